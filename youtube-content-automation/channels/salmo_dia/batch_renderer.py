@@ -0,0 +1,279 @@
+"""
+Render em lote do catálogo Salmo do Dia (CONTENT_ITEMS) num único processo.
+
+Em vez de um `python main.py salmo_dia --index N` por item (interpretador, imports, fontes e fundo a cada vídeo):
+- Workers de render persistentes (core.async_pipeline, pool limitado): fontes de marca, fundo recortado e
+  graduado e música ambiente carregados uma vez por worker (aquecimento no initializer)
+- Narração (edge-tts) dos próximos itens em andamento enquanto os workers codificam os anteriores
+  (prefetch_depth itens além dos workers; core.narration_prefetch.DEFAULT_PREFETCH_DEPTH)
+- Manifesto JSON na pasta do lote (manifest.json): por item, status, vídeo, proporções, voz, descrições, tempo
+- Checkpoint: o manifesto é regravado (atomicamente) a cada item concluído. Repetir o mesmo comando retoma
+  o lote: itens já concluídos (com o vídeo no disco) são pulados; os que falharam são refeitos
+Pasta do lote: <saída>/salmo_do_dia/batch_<chave>, chave = índices + motor/rascunho/proporções/perfil.
+"""
+
+import os
+import re
+import json
+import asyncio
+import hashlib
+import logging
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from channels.salmo_dia.channel_processor import CONTENT_ITEMS
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+__all__ = [
+    "MANIFEST_NAME",
+    "batch_dir_for",
+    "load_manifest",
+    "parse_index_spec",
+    "render_catalog",
+]
+
+
+def parse_index_spec(spec: str, total: Optional[int] = None) -> List[int]:
+    """
+    Índices de CONTENT_ITEMS a partir de "all", "0-13", "0,3,7-9" (intervalos inclusivos).
+    Ordem preservada, sem repetição.
+    Raises:
+        ValueError: Sintaxe inválida ou índice fora de 0..total-1.
+    """
+    total = len(CONTENT_ITEMS) if total is None else total
+    spec = (spec or "").strip().lower()
+    if spec in ("all", "todos", "*"):
+        return list(range(total))
+    out: List[int] = []
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        m = re.fullmatch(r"(\d+)\s*-\s*(\d+)", part)
+        if m:
+            a, b = int(m.group(1)), int(m.group(2))
+            if b < a:
+                raise ValueError(f"Intervalo invertido: {part}")
+            values = range(a, b + 1)
+        elif part.isdigit():
+            values = [int(part)]
+        else:
+            raise ValueError(f"Índice inválido: {part!r} (use ex.: 0-13 ou 0,3,7-9 ou all)")
+        for i in values:
+            if i < 0 or i >= total:
+                raise ValueError(f"Índice {i} fora do catálogo. Use 0-{total - 1}")
+            if i not in out:
+                out.append(i)
+    if not out:
+        raise ValueError("Nenhum índice informado.")
+    return out
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_")[:40] or "item"
+
+
+def batch_dir_for(output_dir: str, indices: Sequence[int], options: Dict[str, Any]) -> str:
+    """Pasta determinística do lote: o mesmo comando aponta para o mesmo manifesto (retomada)."""
+    payload = json.dumps({"indices": list(indices), "options": options}, sort_keys=True, default=str)
+    key = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:10]
+    return os.path.join(output_dir, "salmo_do_dia", f"batch_{key}")
+
+
+def load_manifest(batch_dir: str) -> Optional[Dict[str, Any]]:
+    path = os.path.join(batch_dir, MANIFEST_NAME)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if data.get("version") == MANIFEST_VERSION else None
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(batch_dir: str, manifest: Dict[str, Any]) -> None:
+    """Grava o manifesto atomicamente (temporário + os.replace): interrupção nunca deixa JSON pela metade."""
+    manifest["updated"] = datetime.now().isoformat(timespec="seconds")
+    items = manifest["items"].values()
+    manifest["summary"] = {
+        status: sum(1 for it in items if it.get("status") == status) for status in ("done", "failed", "pending")
+    }
+    fd, tmp = tempfile.mkstemp(prefix=".manifest_", suffix=".tmp", dir=batch_dir)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, os.path.join(batch_dir, MANIFEST_NAME))
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _is_done(entry: Optional[Dict[str, Any]]) -> bool:
+    if not entry or entry.get("status") != "done":
+        return False
+    paths = list((entry.get("renditions") or {}).values()) or [entry.get("video_path")]
+    return all(p and os.path.isfile(p) for p in paths)
+
+
+def _warm_worker(assets_dir: str, layouts: List[Any], music_path: Optional[str]) -> None:
+    """
+    Initializer dos workers de render: fontes de marca, fundo recortado/graduado em cada layout
+    e música ambiente decodificada ficam na memória do worker para todos os itens do lote.
+    """
+    from core import cinematic_salmo_pipeline as pipeline
+
+    try:
+        pipeline._get_brand_font_manager()
+        pipeline._brand_font_fingerprint()
+        for layout in layouts:
+            with pipeline.render_layout(*layout):
+                pipeline._make_graded_bg_np(pipeline.load_background(assets_dir))
+        if music_path:
+            pipeline._music_bed(music_path)
+    except Exception as e:
+        # Aquecimento é só otimização: o render do item reporta o erro real
+        logger.warning("Aquecimento do worker de lote incompleto: %s", e)
+
+
+async def _render_catalog_async(
+    indices: List[int],
+    batch_dir: str,
+    manifest: Dict[str, Any],
+    assets_dir: str,
+    render_engine: Optional[str],
+    draft: bool,
+    aspect_ratios: Optional[Sequence[str]],
+    use_cache: bool,
+    encoder_profile: Optional[str],
+    workers: int,
+    prefetch_depth: int,
+) -> None:
+    from core import cinematic_salmo_pipeline as pipeline
+    from core.async_pipeline import new_render_executor, run_cinematic_salmo_pipeline_async
+    from core.social_descriptions import save_descriptions
+
+    aspects = pipeline.parse_aspect_ratios(aspect_ratios)
+    layouts = [pipeline.draft_layout(pipeline.ASPECT_LAYOUTS[a]) if draft else pipeline.ASPECT_LAYOUTS[a] for a in aspects]
+    music = pipeline._find_ambient_music(assets_dir)
+    # prefetch_depth itens além dos workers: a narração deles corre enquanto os workers codificam.
+    # O semáforo é a backpressure: nenhum item começa a narração sem uma vaga
+    limit = asyncio.Semaphore(workers + prefetch_depth)
+    tts_limit = asyncio.Semaphore(pipeline.TTS_CONCURRENCY)
+    pending = [i for i in indices if not _is_done(manifest["items"].get(str(i)))]
+
+    async def _one(pool: Any, position: int, index: int) -> None:
+        tipo, nome, texto, mood = CONTENT_ITEMS[index]
+        item_dir = os.path.join(batch_dir, f"{index:03d}_{_slug(nome)}")
+        entry = manifest["items"][str(index)]
+        async with limit:
+            logger.info("Lote [%d/%d] índice %d: %s", position, len(pending), index, nome)
+            t0 = time.monotonic()
+            try:
+                out = await run_cinematic_salmo_pipeline_async(
+                    title=nome,
+                    body_text=texto,
+                    output_dir=item_dir,
+                    assets_dir=assets_dir,
+                    output_filename=f"{tipo}_cinematic_{index:03d}.mp4",
+                    render_engine=render_engine,
+                    draft=draft,
+                    aspect_ratios=aspect_ratios,
+                    use_cache=use_cache,
+                    encoder_profile=encoder_profile,
+                    executor=pool,
+                    tts_limit=tts_limit,
+                )
+                descriptions = await asyncio.to_thread(save_descriptions, item_dir, nome, texto)
+                entry.update({
+                    "status": "done",
+                    "video_path": out["video_path"],
+                    "renditions": out.get("renditions", {}),
+                    "audio_path": out.get("audio_path"),
+                    "description_files": descriptions,
+                    "seconds": round(time.monotonic() - t0, 1),
+                    "error": None,
+                })
+            except Exception as e:
+                logger.exception("Lote: índice %d (%s) falhou: %s", index, nome, e)
+                entry.update({"status": "failed", "error": str(e), "seconds": round(time.monotonic() - t0, 1)})
+            # Checkpoint: cada item concluído (ou com erro) já fica registrado no disco
+            _write_manifest(batch_dir, manifest)
+
+    with new_render_executor(workers, _warm_worker, (assets_dir, layouts, music)) as pool:
+        await asyncio.gather(*(_one(pool, pos, i) for pos, i in enumerate(pending, 1)))
+
+
+def render_catalog(
+    indices: Sequence[int],
+    output_dir: str = "outputs",
+    assets_dir: Optional[str] = None,
+    render_engine: Optional[str] = None,
+    draft: bool = False,
+    aspect_ratios: Optional[Sequence[str]] = None,
+    use_cache: bool = True,
+    encoder_profile: Optional[str] = None,
+    workers: Optional[int] = None,
+    batch_dir: Optional[str] = None,
+    prefetch_depth: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Renderiza os itens de CONTENT_ITEMS em indices com workers persistentes (None → DEFAULT_RENDER_WORKERS).
+    prefetch_depth: itens com narração em andamento além dos que estão nos workers (None → DEFAULT_PREFETCH_DEPTH).
+    Retoma um lote anterior com a mesma pasta (batch_dir ou a derivada dos índices/opções).
+    Retorna o manifesto ({"batch_dir", "items": {índice: {...}}, "summary": {"done", "failed", "pending"}}).
+    """
+    from core.async_pipeline import DEFAULT_RENDER_WORKERS
+    from core.encoder_profiles import get_encoder_profile
+    from core.narration_prefetch import DEFAULT_PREFETCH_DEPTH
+
+    indices = list(indices)
+    assets_dir = assets_dir or str(Path(__file__).resolve().parents[2] / "assets")
+    profile = get_encoder_profile(encoder_profile)
+    options = {
+        "engine": render_engine,
+        "draft": draft,
+        "aspects": list(aspect_ratios or []),
+        "encoder_profile": profile.name,
+    }
+    batch_dir = batch_dir or batch_dir_for(output_dir, indices, options)
+    os.makedirs(batch_dir, exist_ok=True)
+
+    manifest = load_manifest(batch_dir) or {
+        "version": MANIFEST_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "options": options,
+        "items": {},
+    }
+    manifest["batch_dir"] = batch_dir
+    for i in indices:
+        tipo, nome, _, mood = CONTENT_ITEMS[i]
+        entry = manifest["items"].setdefault(str(i), {"index": i, "content_type": tipo, "name": nome, "mood": mood})
+        if not _is_done(entry):
+            entry["status"] = "pending"
+    resumed = sum(1 for i in indices if manifest["items"][str(i)]["status"] == "done")
+    _write_manifest(batch_dir, manifest)
+
+    n_workers = max(1, workers or DEFAULT_RENDER_WORKERS)
+    depth = DEFAULT_PREFETCH_DEPTH if prefetch_depth is None else max(0, prefetch_depth)
+    logger.info(
+        "Lote Salmo do Dia: %d item(ns), %d já concluído(s) (checkpoint), %d worker(s) de render → %s",
+        len(indices), resumed, n_workers, batch_dir,
+    )
+    t0 = time.monotonic()
+    if resumed < len(indices):
+        asyncio.run(_render_catalog_async(
+            indices, batch_dir, manifest, assets_dir, render_engine, draft, aspect_ratios, use_cache,
+            encoder_profile, n_workers, depth,
+        ))
+    _write_manifest(batch_dir, manifest)
+    logger.info(
+        "Lote concluído em %.1fs: %d ok, %d com erro",
+        time.monotonic() - t0, manifest["summary"]["done"], manifest["summary"]["failed"],
+    )
+    return manifest
@@ -45,9 +45,23 @@ class SalmoDiaProcessor:
     Índices 0..N-1 = salmos; N..N+M-1 = passagens.
     """
 
-    def __init__(self, output_dir: str = "outputs", assets_dir: Optional[str] = None):
+    def __init__(
+        self,
+        output_dir: str = "outputs",
+        assets_dir: Optional[str] = None,
+        render_engine: Optional[str] = None,
+        draft: bool = False,
+        aspect_ratios: Optional[List[str]] = None,
+        use_cache: bool = True,
+    ):
         self.output_dir = output_dir
         self.assets_dir = assets_dir or str(Path(__file__).resolve().parents[2] / "assets")
+        self.render_engine = render_engine
+        self.draft = draft
+        self.aspect_ratios = aspect_ratios
+        self.use_cache = use_cache
+        # Pasta da última gravação (_generate_cinematic_video); main.py --profile grava os perfis nela
+        self.session_dir: Optional[str] = None
         os.makedirs(output_dir, exist_ok=True)
 
     def _get_item(self, index: Optional[int]) -> Tuple[str, str, str, str]:
@@ -108,9 +122,12 @@ class SalmoDiaProcessor:
     ) -> Dict:
         """Gera vídeo cinematográfico: assets locais + edge-tts."""
         from core.cinematic_salmo_pipeline import run_cinematic_salmo_pipeline
+        from core.social_descriptions import save_descriptions
+        from core.stage_graph import Stage
 
         session_dir = self._session_folder()
         os.makedirs(session_dir, exist_ok=True)
+        self.session_dir = session_dir
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         print(f"\n{'='*60}", flush=True)
         print(f"  GERANDO {name} (SHORT CINEMATOGRÁFICO)", flush=True)
@@ -127,6 +144,14 @@ class SalmoDiaProcessor:
                 assets_dir=self.assets_dir,
                 music_path=None,
                 output_filename=f"{filename_prefix}_cinematic_{timestamp}.mp4",
+                render_engine=self.render_engine,
+                draft=self.draft,
+                aspect_ratios=self.aspect_ratios,
+                use_cache=self.use_cache,
+                # Pacote de distribuição: só depende do texto, roda junto com TTS/render
+                extra_stages=[
+                    Stage("descriptions", lambda r: save_descriptions(session_dir, name, text), optional=True),
+                ],
             )
         except RuntimeError as e:
             if "edge" in str(e).lower() or "tts" in str(e).lower():
@@ -144,17 +169,16 @@ class SalmoDiaProcessor:
         result["short_video_path"] = short_path
         result["video_path"] = short_path
         result["audio_path"] = out["audio_path"]
+        result["renditions"] = out.get("renditions", {})
         result["duration_estimate_sec"] = out.get("duration_seconds", 35.0)
 
         # Pacote de distribuição: descrições por rede social (youtube, instagram, twitter, tiktok)
-        try:
-            from core.social_descriptions import save_descriptions
-            desc_paths = save_descriptions(session_dir, name, text)
-            result["description_files"] = desc_paths
+        desc_paths = (out.get("stage_results") or {}).get("descriptions")
+        result["description_files"] = desc_paths or {}
+        if desc_paths:
             print(f"  📄 Descrições geradas: {', '.join(desc_paths.keys())}.txt", flush=True)
-        except Exception as e:
-            print(f"  ⚠️ Descrições por rede social não geradas: {e}", flush=True)
-            result["description_files"] = {}
+        else:
+            print("  ⚠️ Descrições por rede social não geradas (detalhe no log)", flush=True)
 
         print(f"\n  ✅ SHORT CINEMATOGRÁFICO GERADO: {short_path}\n", flush=True)
         return result
@@ -261,15 +285,17 @@ class SalmoDiaProcessor:
             dest_list = publish_destinations if publish_destinations is not None else None
             if dest_list is not None and len(dest_list) == 0:
                 dest_list = None
-            pub = self.publish_to_destinations(
-                video_path=result["short_video_path"],
-                psalm_name=result.get("psalm_name", "Salmo do Dia"),
-                description=result.get("description", ""),
-                tags=result.get("tags"),
-                destinations=dest_list,
-                result_metadata=result,
-                schedule_at=schedule_at,
-            )
+            from core.stage_profiler import profile_section
+            with profile_section("publish"):
+                pub = self.publish_to_destinations(
+                    video_path=result["short_video_path"],
+                    psalm_name=result.get("psalm_name", "Salmo do Dia"),
+                    description=result.get("description", ""),
+                    tags=result.get("tags"),
+                    destinations=dest_list,
+                    result_metadata=result,
+                    schedule_at=schedule_at,
+                )
             result["publish"] = pub
             result["twitter"] = pub.get("twitter")
         return result
@@ -0,0 +1,28 @@
+"""
+Core modules for Salmo do Dia video generation.
+"""
+
+from .premium_visuals import (
+    PremiumVideoCompositor,
+    PremiumBackgroundGenerator,
+    PremiumTextRenderer,
+    FontManager,
+    SPIRITUAL_PALETTES,
+)
+
+from .synced_video_generator import SyncedVideoGenerator
+
+from .text_to_speech_enhanced import EnhancedTextToSpeech
+
+from .twitter_publisher import TwitterPublisher
+
+__all__ = [
+    "PremiumVideoCompositor",
+    "PremiumBackgroundGenerator", 
+    "PremiumTextRenderer",
+    "FontManager",
+    "SPIRITUAL_PALETTES",
+    "SyncedVideoGenerator",
+    "EnhancedTextToSpeech",
+    "TwitterPublisher",
+]
@@ -0,0 +1,198 @@
+"""
+Variante assíncrona do pipeline cinematográfico (run_cinematic_salmo_pipeline) para uso dentro de um event loop.
+
+Cada etapa é um awaitable:
+- Rede no próprio loop: edge-tts (blocos sintetizados em paralelo) e forced alignment (aiohttp)
+- IO/CPU curtos em threads (asyncio.to_thread): hash de fundo/música, caches, duração e merge do áudio
+- Composição + encode por proporção em ProcessPoolExecutor: o layout (set_render_layout) é global por processo,
+  então renders simultâneos de vídeos diferentes não podem dividir um processo
+Vários vídeos no mesmo processo: run_cinematic_salmo_pipelines_async(jobs, max_concurrency=...).
+Enquanto um vídeo está no encode, a narração do próximo já está em andamento.
+"""
+
+import os
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from core import cinematic_salmo_pipeline as pipeline
+
+logger = logging.getLogger(__name__)
+
+# Vídeos em andamento ao mesmo tempo (SALMO_ASYNC_CONCURRENCY)
+DEFAULT_ASYNC_CONCURRENCY = max(1, int(os.getenv("SALMO_ASYNC_CONCURRENCY", "2") or 1))
+# Processos de render/encode compartilhados entre os vídeos (SALMO_ASYNC_RENDER_WORKERS)
+DEFAULT_RENDER_WORKERS = max(1, int(os.getenv("SALMO_ASYNC_RENDER_WORKERS", "2") or 1))
+
+__all__ = [
+    "DEFAULT_ASYNC_CONCURRENCY",
+    "DEFAULT_RENDER_WORKERS",
+    "new_render_executor",
+    "run_cinematic_salmo_pipeline_async",
+    "run_cinematic_salmo_pipelines_async",
+]
+
+
+def new_render_executor(
+    workers: Optional[int] = None,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[Any, ...] = (),
+) -> ProcessPoolExecutor:
+    """
+    Pool de processos para composição/encode. spawn: o processo pai tem o event loop e threads ativas,
+    e fork nesse estado pode herdar locks presos. initializer: aquecimento do worker (fontes, fundos...).
+    """
+    ctx = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(
+        max_workers=workers or DEFAULT_RENDER_WORKERS, mp_context=ctx, initializer=initializer, initargs=initargs,
+    )
+
+
+def _render_rendition_in_worker(
+    job: "pipeline._PipelineJob",
+    aspect: str,
+    layout: Tuple[int, int],
+    phrase_segments: List[Dict[str, Any]],
+    retention_texts: Optional[Tuple[str, str, str, str]],
+    voice_path: str,
+) -> Tuple[str, Dict[str, int], Dict[str, int], Dict[str, Any]]:
+    """
+    Render de uma proporção no worker; devolve o MP4, a variação dos contadores de cache (fundos, overlays)
+    e as estatísticas do export (frames, fps, motor) mais o tempo da etapa, para as métricas da execução.
+    """
+    from core.memory_sampler import sampling_memory
+    from core.render_cache import get_background_cache, get_overlay_cache
+
+    t0 = time.monotonic()
+    bg_before, ov_before = get_background_cache().stats(), get_overlay_cache().stats()
+    # SALMO_MEMORY_REPORT: cada worker grava o relatório da sua proporção (<vídeo>.memory.*)
+    with sampling_memory(pipeline._memory_report_base(job.video_paths[aspect])):
+        path = pipeline._render_rendition(job, aspect, layout, phrase_segments, retention_texts, voice_path)
+    bg_after, ov_after = get_background_cache().stats(), get_overlay_cache().stats()
+    export = dict(pipeline._pop_export_stats(path), stage_seconds=round(time.monotonic() - t0, 3))
+    return (
+        path,
+        {k: bg_after[k] - bg_before[k] for k in bg_after},
+        {k: ov_after[k] - ov_before[k] for k in ov_after},
+        export,
+    )
+
+
+def _sum_stats(parts: Sequence[Dict[str, int]]) -> Dict[str, int]:
+    total: Dict[str, int] = {}
+    for part in parts:
+        for k, v in part.items():
+            total[k] = total.get(k, 0) + v
+    return total
+
+
+async def run_cinematic_salmo_pipeline_async(
+    title: str,
+    body_text: str,
+    output_dir: str = "outputs",
+    assets_dir: Optional[str] = None,
+    music_path: Optional[str] = None,
+    output_filename: Optional[str] = None,
+    render_engine: Optional[str] = None,
+    draft: bool = False,
+    aspect_ratios: Optional[Sequence[str]] = None,
+    use_cache: bool = True,
+    encoder_profile: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    tts_limit: Optional[asyncio.Semaphore] = None,
+) -> dict:
+    """
+    Mesmos parâmetros e resultado de run_cinematic_salmo_pipeline, como corrotina.
+    - executor: pool para composição/encode (None → pool próprio com um processo por proporção).
+      Passar o mesmo pool a vários vídeos limita quantos encodes rodam ao mesmo tempo.
+    - tts_limit: semáforo de sínteses edge-tts simultâneas, compartilhável entre vídeos
+      (None → até TTS_CONCURRENCY por vídeo).
+    As proporções de um mesmo vídeo são renderizadas em paralelo no executor.
+    """
+    t_pipeline_start = time.monotonic()
+    job = await asyncio.to_thread(
+        pipeline._new_pipeline_job,
+        title, body_text, output_dir, assets_dir, music_path, output_filename,
+        render_engine, draft, aspect_ratios, encoder_profile,
+    )
+
+    if use_cache:
+        cached = await asyncio.to_thread(pipeline._cached_pipeline_result, job, t_pipeline_start, "async")
+        if cached is not None:
+            return cached
+
+    narration_info: Dict[str, Any] = {}
+    seconds: Dict[str, float] = {"setup": round(time.monotonic() - t_pipeline_start, 3)}
+    loop = asyncio.get_running_loop()
+    own_executor = executor is None
+    pool = new_render_executor(len(job.layouts)) if own_executor else executor
+    try:
+        t_narration = time.monotonic()
+        phrase_segments, voice_path = await pipeline._prepare_narration_async(
+            body_text, job.voice_path, tts_limit, info=narration_info
+        )
+        seconds["narration"] = round(time.monotonic() - t_narration, 3)
+        retention_texts = pipeline._retention_texts_for(job, phrase_segments)
+        results = await asyncio.gather(*(
+            loop.run_in_executor(
+                pool, _render_rendition_in_worker, job, aspect, layout, phrase_segments, retention_texts, voice_path
+            )
+            for aspect, layout in job.layouts
+        ))
+    except Exception as e:
+        await asyncio.to_thread(
+            pipeline._emit_run_metrics, job, "error", t_pipeline_start, "async", None, None, narration_info,
+            {"seconds": seconds}, None, str(e),
+        )
+        raise
+    finally:
+        if own_executor:
+            pool.shutdown(wait=False)
+
+    renditions = {aspect: r[0] for (aspect, _), r in zip(job.layouts, results)}
+    exports = {aspect: r[3] for (aspect, _), r in zip(job.layouts, results)}
+    seconds.update({f"render:{aspect}": export.pop("stage_seconds") for aspect, export in exports.items()})
+    return await asyncio.to_thread(
+        pipeline._finish_pipeline,
+        job, renditions, voice_path, t_pipeline_start,
+        _sum_stats([r[1] for r in results]), _sum_stats([r[2] for r in results]),
+        exports, narration_info, {"seconds": seconds}, "async",
+    )
+
+
+async def run_cinematic_salmo_pipelines_async(
+    jobs: Sequence[Dict[str, Any]],
+    max_concurrency: Optional[int] = None,
+    render_workers: Optional[int] = None,
+    tts_concurrency: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Vários vídeos no mesmo processo. jobs = kwargs de run_cinematic_salmo_pipeline_async (title, body_text, ...).
+    - max_concurrency: vídeos em andamento ao mesmo tempo (None → DEFAULT_ASYNC_CONCURRENCY)
+    - render_workers: processos de composição/encode compartilhados (None → DEFAULT_RENDER_WORKERS)
+    - tts_concurrency: sínteses edge-tts simultâneas somando todos os vídeos (None → TTS_CONCURRENCY)
+    Resultados na ordem dos jobs; um vídeo que falha vira {"title", "error"} sem interromper os demais.
+    """
+    limit = asyncio.Semaphore(max_concurrency or DEFAULT_ASYNC_CONCURRENCY)
+    tts_limit = asyncio.Semaphore(tts_concurrency or pipeline.TTS_CONCURRENCY)
+    t0 = time.monotonic()
+
+    async def _one(index: int, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        async with limit:
+            logger.info("Vídeo %d/%d: %s", index + 1, len(jobs), kwargs.get("title", ""))
+            try:
+                return await run_cinematic_salmo_pipeline_async(**kwargs, executor=pool, tts_limit=tts_limit)
+            except Exception as e:
+                logger.exception("Vídeo %d/%d falhou: %s", index + 1, len(jobs), e)
+                return {"title": kwargs.get("title", ""), "error": str(e)}
+
+    with new_render_executor(render_workers) as pool:
+        results = await asyncio.gather(*(_one(i, kwargs) for i, kwargs in enumerate(jobs)))
+    failed = sum(1 for r in results if "error" in r)
+    logger.info(
+        "%d vídeo(s) em %.1fs (%d com erro)", len(results) - failed, time.monotonic() - t0, failed,
+    )
+    return list(results)
@@ -0,0 +1,2511 @@
+"""
+Pipeline cinematográfico profissional para Salmo do Dia.
+
+Foco: retenção e impacto imediato.
+- Hook nos primeiros 1–2s, sem introdução lenta
+- 4 frames: Hook (3s) → Continuação (4s) → Conclusão (4s) → Referência (2–3s)
+- Duração total alvo: 25–35s (YouTube Shorts)
+- Backgrounds EXCLUSIVAMENTE da pasta assets/
+- Narração: exclusivamente edge-tts (pt-BR-ThalitaMultilingualNeural)
+"""
+
+import os
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
+
+from core.encoder_profiles import EncoderProfile, get_encoder_profile
+from core.ken_burns import KenBurnsZoom
+from core.render_plan import BackgroundLayer, OverlayRaster, crop_rgba
+from core.memory_sampler import sampling_memory
+from core.progress import moviepy_logger, track as track_progress
+from core.stage_profiler import instrumented, profile_section
+
+if TYPE_CHECKING:
+    from core.stage_graph import Stage
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+WIDTH, HEIGHT = 1080, 1920
+FPS = 30
+ASSETS_DIR_DEFAULT = "assets"
+
+# Cores retenção: branco quente, máximo contraste
+TEXT_WARM_WHITE = (245, 242, 232, 255)  # #F5F2E8
+SHADOW_RGBA = (0, 0, 0, 180)
+GLOW_RGBA = (255, 248, 230, 80)
+
+# Durações por frame (segundos) – referência fixa no fim
+DURATION_HOOK = 3.0
+DURATION_PART2 = 4.0
+DURATION_PART3 = 4.0
+DURATION_REFERENCE = 2.5
+REFERENCE_FRAME_DURATION = DURATION_REFERENCE
+
+# Densidade de texto: 10–16 palavras por frame (narrativa contínua, sem telas vazias)
+PHRASE_MIN_WORDS = 10
+PHRASE_MAX_WORDS = 16
+REFERENCE_FRAME_DURATION_SYNC = 2.5
+# Tempo mínimo de leitura por trecho (evita texto sumir rápido demais)
+MIN_SEGMENT_DURATION = 1.0
+# Transição cinematográfica: crossfade suave (nunca corte seco)
+CROSSFADE_DURATION = 0.6
+# Ken Burns do vídeo sincronizado: 1.0 → KEN_BURNS_ZOOM do início ao fim. No motor "incremental", ritmo fixo desde
+# t=0 (KEN_BURNS_PERIOD s aproximando, depois afastando...): mudar a narração não altera o fundo antes da edição
+KEN_BURNS_ZOOM = 1.06
+KEN_BURNS_PERIOD = 40.0
+
+# Header fixo: referência bíblica no topo em todos os frames (identidade visual)
+HEADER_HEIGHT = int(HEIGHT * 0.105)  # ~202px, legível em mobile
+
+# Área do verso (camada 3): caixa fixa, margens simétricas, safe area mobile
+VERSE_PADDING_H = int(WIDTH * 0.14)  # margens laterais generosas (editorial)
+VERSE_PADDING_TOP = int(HEIGHT * 0.07)
+VERSE_PADDING_BOTTOM = int(HEIGHT * 0.09)
+VERSE_AREA_TOP = HEADER_HEIGHT + VERSE_PADDING_TOP
+VERSE_AREA_BOTTOM = HEIGHT - VERSE_PADDING_BOTTOM
+VERSE_AREA_HEIGHT = VERSE_AREA_BOTTOM - VERSE_AREA_TOP
+VERSE_MAX_LINE_WIDTH = WIDTH - 2 * VERSE_PADDING_H
+# Tipografia cinematográfica: respirável, elegante (nunca cortar palavras/sílabas)
+VERSE_LINE_HEIGHT_RATIO = 0.078  # espaço entre linhas (ritmo visual)
+VERSE_MIN_LINE_WIDTH_RATIO = 0.28  # evita orphan (linha última muito curta)
+
+# Proporções de saída (um job → várias renditions; voz, tempos e texto compartilhados)
+ASPECT_LAYOUTS: Dict[str, Tuple[int, int]] = {
+    "9:16": (1080, 1920),  # Shorts / Reels / TikTok
+    "1:1": (1080, 1080),   # post de feed
+    "16:9": (1920, 1080),  # paisagem
+}
+DEFAULT_ASPECT = "9:16"
+
+# Render de rascunho (--draft): mesmo layout em escala reduzida, fps menor, preset ultrafast
+DRAFT_SCALE = 0.5  # 1080x1920 → 540x960
+DRAFT_FPS = 15
+# Encode: perfis de core.encoder_profiles (todos os motores); rascunho usa DRAFT_ENCODER_PROFILE,
+# render final o perfil do canal (encoder_profile em config/channels.yaml) ou SALMO_ENCODER_PROFILE
+DRAFT_ENCODER_PROFILE = "draft"
+
+# Motor de render: "numpy" (frames NumPy → pipe ffmpeg), "ffmpeg" (filter_complex, composição em C),
+# "sliced" (compositor NumPy em N fatias de tempo paralelas, unidas por stream copy),
+# "incremental" (trechos alinhados ao GOP em cache por assinatura: só o que mudou é recodificado)
+# ou "moviepy" (CompositeVideoClip, fallback)
+RENDER_ENGINES = ("numpy", "ffmpeg", "sliced", "incremental", "moviepy")
+DEFAULT_RENDER_ENGINE = os.getenv("SALMO_RENDER_ENGINE", "numpy").strip().lower() or "numpy"
+# Versão do pipeline na chave do cache de vídeos finais: incrementar quando o visual/áudio gerado mudar
+PIPELINE_VERSION = "cinematic-2026.10-3"
+
+__all__ = [
+    "load_background",
+    "generate_voice",
+    "generate_voice_async",
+    "get_forced_alignment",
+    "get_forced_alignment_async",
+    "segment_into_phrases",
+    "render_phrase_overlay",
+    "render_verse_only_overlay",
+    "render_text_overlay",
+    "render_retention_frame",
+    "split_script_for_retention",
+    "compose_video",
+    "compose_retention_video",
+    "compose_synced_video",
+    "run_cinematic_salmo_pipeline",
+]
+
+
+# =============================================================================
+# LAYOUT — constantes geométricas derivadas de WIDTH × HEIGHT
+# =============================================================================
+
+def _layout_constants(width: int, height: int) -> Dict[str, int]:
+    """Mesmas fórmulas das constantes do topo do módulo, para um quadro width × height."""
+    header_height = int(height * 0.105)
+    padding_h = int(width * 0.14)
+    padding_top = int(height * 0.07)
+    padding_bottom = int(height * 0.09)
+    area_top = header_height + padding_top
+    area_bottom = height - padding_bottom
+    return {
+        "WIDTH": width,
+        "HEIGHT": height,
+        "HEADER_HEIGHT": header_height,
+        "VERSE_PADDING_H": padding_h,
+        "VERSE_PADDING_TOP": padding_top,
+        "VERSE_PADDING_BOTTOM": padding_bottom,
+        "VERSE_AREA_TOP": area_top,
+        "VERSE_AREA_BOTTOM": area_bottom,
+        "VERSE_AREA_HEIGHT": area_bottom - area_top,
+        "VERSE_MAX_LINE_WIDTH": width - 2 * padding_h,
+    }
+
+
+def set_render_layout(width: int, height: int) -> None:
+    """
+    Redefine WIDTH/HEIGHT e todas as constantes derivadas (header, caixa do verso).
+    Tamanhos de fonte são proporcionais a HEIGHT e acompanham automaticamente.
+    """
+    globals().update(_layout_constants(int(width), int(height)))
+
+
+@contextmanager
+def render_layout(width: int, height: int) -> Iterator[None]:
+    """Aplica um layout durante o bloco e restaura o anterior ao sair."""
+    previous = (WIDTH, HEIGHT)
+    set_render_layout(width, height)
+    try:
+        yield
+    finally:
+        set_render_layout(*previous)
+
+
+def draft_layout(size: Optional[Tuple[int, int]] = None) -> Tuple[int, int]:
+    """Tamanho do rascunho: size (padrão: layout atual) × DRAFT_SCALE (dimensões pares para yuv420p)."""
+    w, h = size or (WIDTH, HEIGHT)
+    return int(w * DRAFT_SCALE) // 2 * 2, int(h * DRAFT_SCALE) // 2 * 2
+
+
+def parse_aspect_ratios(aspects: Optional[Sequence[str]]) -> List[str]:
+    """
+    Normaliza a lista de proporções ("9:16", "1:1", "16:9"; aceita "9x16"). None/vazio → [DEFAULT_ASPECT].
+    Raises:
+        ValueError: proporção desconhecida.
+    """
+    result: List[str] = []
+    for item in aspects or [DEFAULT_ASPECT]:
+        for token in str(item).split(","):
+            key = token.strip().lower().replace("x", ":")
+            if not key:
+                continue
+            if key not in ASPECT_LAYOUTS:
+                raise ValueError(f"Proporção desconhecida: {token!r}. Use uma de: {', '.join(ASPECT_LAYOUTS)}")
+            if key not in result:
+                result.append(key)
+    return result or [DEFAULT_ASPECT]
+
+
+# =============================================================================
+# 1. LOAD BACKGROUND
+# =============================================================================
+
+def _select_background_path(assets_dir: Optional[str] = None) -> Path:
+    """
+    Asset de fundo da pasta assets/ (EXCLUSIVAMENTE imagens locais; preferência: salmo_do_dia*.jpg).
+    Raises:
+        FileNotFoundError: Se não houver imagens em assets/
+    """
+    assets_path = Path(assets_dir or ASSETS_DIR_DEFAULT)
+    if not assets_path.is_absolute():
+        base = Path(__file__).resolve().parents[1]
+        assets_path = base / assets_path
+    if not assets_path.exists():
+        raise FileNotFoundError(f"Pasta de assets não encontrada: {assets_path}")
+
+    # Preferir imagens do salmo (salmo_do_dia*.jpg)
+    candidates: List[Path] = []
+    for ext in ("*.jpg", "*.jpeg", "*.png", "*.webp"):
+        for f in sorted(assets_path.glob(ext)):
+            if "salmo" in f.name.lower():
+                candidates.insert(0, f)
+            elif f.name != "curiosidade_do_dia.jpg" and f.name != "placar_do_dia.jpg":
+                candidates.append(f)
+    if not candidates:
+        for ext in ("*.jpg", "*.jpeg", "*.png", "*.webp"):
+            candidates.extend(sorted(assets_path.glob(ext)))
+    if not candidates:
+        raise FileNotFoundError(
+            f"Nenhuma imagem encontrada em {assets_path}. "
+            "Adicione imagens (ex: salmo_do_dia.jpg) em assets/."
+        )
+
+    return candidates[0]
+
+
+# Fundos já recortados/redimensionados por (arquivo, mtime, WIDTH, HEIGHT): processos que renderizam vários
+# vídeos (lotes, workers persistentes) não decodificam nem refazem o LANCZOS a cada vídeo
+_loaded_backgrounds: Dict[Tuple[str, int, int, int], Image.Image] = {}
+_LOADED_BACKGROUNDS_MAX = 8
+
+
+def load_background(assets_dir: Optional[str] = None) -> Image.Image:
+    """
+    Carrega o background mais adequado da pasta assets/.
+    Usa EXCLUSIVAMENTE imagens locais. Preferência: salmo_do_dia*.jpg.
+    Redimensiona e recorta para 1080x1920 (vertical) mantendo aspecto.
+    Memoizado no processo (devolve uma cópia).
+    
+    Raises:
+        FileNotFoundError: Se não houver imagens em assets/
+    """
+    chosen = _select_background_path(assets_dir)
+    logger.info("[1/6] Background selecionado: %s", chosen.name)
+    memo_key = (str(chosen), chosen.stat().st_mtime_ns, WIDTH, HEIGHT)
+    if memo_key in _loaded_backgrounds:
+        return _loaded_backgrounds[memo_key].copy()
+    img = Image.open(chosen).convert("RGB")
+
+    # Crop/resize para 1080x1920 (vertical) – center crop depois scale
+    w, h = img.size
+    target_ratio = WIDTH / HEIGHT
+    current_ratio = w / h
+    if current_ratio > target_ratio:
+        new_w = int(h * target_ratio)
+        left = (w - new_w) // 2
+        img = img.crop((left, 0, left + new_w, h))
+    else:
+        new_h = int(w / target_ratio)
+        top = (h - new_h) // 2
+        img = img.crop((0, top, w, top + new_h))
+    img = img.resize((WIDTH, HEIGHT), Image.Resampling.LANCZOS)
+    if len(_loaded_backgrounds) >= _LOADED_BACKGROUNDS_MAX:
+        _loaded_backgrounds.pop(next(iter(_loaded_backgrounds)))
+    _loaded_backgrounds[memo_key] = img
+    return img.copy()
+
+
+def _apply_spiritual_grading(img: Image.Image) -> Image.Image:
+    """Color grading espiritual: leve aquecimento, contraste suave, brilho sutil."""
+    img = ImageEnhance.Contrast(img).enhance(1.05)
+    img = ImageEnhance.Color(img).enhance(1.1)
+    img = ImageEnhance.Brightness(img).enhance(0.98)
+    # Leve tom âmbar
+    r, g, b = img.split()
+    r = r.point(lambda x: min(255, int(x * 1.02)))
+    b = b.point(lambda x: max(0, int(x * 0.98)))
+    img = Image.merge("RGB", (r, g, b))
+    return img
+
+
+def _apply_soft_glow(img: Image.Image, radius: int = 25, strength: float = 0.15) -> Image.Image:
+    """Adiciona glow suave (blur leve nas altas luzes)."""
+    blurred = img.filter(ImageFilter.GaussianBlur(radius=radius))
+    return Image.blend(img, blurred, strength)
+
+
+def _apply_dark_cinematic_grading(img: Image.Image, vignette_strength: float = 0.5) -> Image.Image:
+    """Dark cinematic: escurece, vignette, gradiente central escuro. Fundo nunca compete com texto."""
+    img = ImageEnhance.Brightness(img).enhance(0.5)
+    img = ImageEnhance.Contrast(img).enhance(1.15)
+    w, h = img.size
+    # Vignette suave
+    overlay = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    cx, cy = w // 2, h // 2
+    max_r = (cx**2 + cy**2) ** 0.5
+    for y in range(0, h, 8):
+        for x in range(0, w, 8):
+            r = ((x - cx) ** 2 + (y - cy) ** 2) ** 0.5
+            alpha = int(255 * vignette_strength * (1 - (1 - r / max_r) ** 2))
+            overlay.putpixel((x, y), (0, 0, 0, min(alpha, 200)))
+    img = img.convert("RGBA")
+    img = Image.alpha_composite(img, overlay)
+    return img.convert("RGB")
+
+
+def _grade_background_np(
+    img: Image.Image,
+    golden: bool,
+    golden_gain: Tuple[float, float],
+    vignette_strength: float,
+    glow_radius: int,
+    glow_strength: float,
+) -> np.ndarray:
+    b = _apply_dark_cinematic_grading(img.copy(), vignette_strength=vignette_strength)
+    b = _apply_soft_glow(b, radius=glow_radius, strength=glow_strength)
+    if golden:
+        r_gain, b_gain = golden_gain
+        r, g, bl = b.split()
+        r = r.point(lambda x: min(255, int(x * r_gain)))
+        bl = bl.point(lambda x: max(0, int(x * b_gain)))
+        b = Image.merge("RGB", (r, g, bl))
+    return np.array(b)
+
+
+def _make_graded_bg_np(
+    img: Image.Image,
+    golden: bool = False,
+    golden_gain: Tuple[float, float] = (1.05, 0.95),
+    vignette_strength: float = 0.5,
+    glow_radius: int = 20,
+    glow_strength: float = 0.08,
+) -> np.ndarray:
+    """
+    Fundo dark cinematic + glow suave; golden aquece (R × gain[0], B × gain[1]).
+    Resultado em cache persistente (core.render_cache): o grading só roda uma vez por asset/parâmetros.
+    Retorno pode ser um memmap somente leitura.
+    """
+    from core.render_cache import get_background_cache
+    params = {
+        "golden": bool(golden),
+        "golden_gain": [float(v) for v in golden_gain] if golden else None,
+        "vignette_strength": float(vignette_strength),
+        "glow_radius": int(glow_radius),
+        "glow_strength": float(glow_strength),
+    }
+    return get_background_cache().get_or_create(
+        img,
+        params,
+        lambda: _grade_background_np(
+            img, golden, golden_gain, vignette_strength, glow_radius, glow_strength
+        ),
+    )
+
+
+# =============================================================================
+# SEGMENTAÇÃO PARA RETENÇÃO (4 FRAMES)
+# =============================================================================
+
+def split_script_for_retention(
+    title: str,
+    body_text: str,
+) -> Tuple[str, str, str, str]:
+    """
+    Divide o texto em 4 segmentos para retenção:
+    - Hook: parte mais forte (início impactante)
+    - Part2: continuação equilibrada
+    - Part3: conclusão
+    - Reference: só a referência (ex: "Salmo 46:10")
+    Retorno: (hook_text, part2_text, part3_text, reference_text).
+    """
+    lines = [ln.strip() for ln in body_text.strip().split("\n") if ln.strip()]
+    if not lines:
+        return ("", "", "", title)
+    n = len(lines)
+    if n <= 3:
+        hook = lines[0] if n >= 1 else ""
+        part2 = lines[1] if n >= 2 else ""
+        part3 = lines[2] if n >= 3 else ""
+    else:
+        # ~25% hook, ~35% part2, ~35% part3
+        i1 = max(1, n // 4)
+        i2 = max(i1 + 1, int(n * 0.6))
+        hook = "\n".join(lines[:i1])
+        part2 = "\n".join(lines[i1:i2])
+        part3 = "\n".join(lines[i2:])
+    return (hook, part2, part3, title)
+
+
+# =============================================================================
+# SINCRONIZAÇÃO COM VOZ – FORCED ALIGNMENT + SEGMENTAÇÃO POR PAUSAS
+# =============================================================================
+
+FORCED_ALIGNMENT_URL = "https://api.elevenlabs.io/v1/forced-alignment"
+
+
+def _alignment_words(out: Dict[str, Any]) -> List[Dict[str, Any]]:
+    words = out.get("words") or []
+    return [{"text": w.get("text", ""), "start": float(w.get("start", 0)), "end": float(w.get("end", 0))} for w in words]
+
+
+def get_forced_alignment(audio_path: str, transcript: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Obtém timestamps por palavra via ElevenLabs Forced Alignment API.
+    Retorna lista de {"text": str, "start": float, "end": float} ou None se falhar.
+    """
+    api_key = os.getenv("ELEVENLABS_API_KEY")
+    if not api_key or not api_key.strip():
+        return None
+    if not os.path.isfile(audio_path) or not transcript.strip():
+        return None
+    logger.info("      → Forced alignment: enviando áudio + texto para ElevenLabs...")
+    t0 = time.monotonic()
+    try:
+        import requests
+        headers = {"xi-api-key": api_key.strip()}
+        with open(audio_path, "rb") as f:
+            files = {"file": (os.path.basename(audio_path), f, "audio/mpeg")}
+            data = {"text": transcript.strip()}
+            r = requests.post(FORCED_ALIGNMENT_URL, headers=headers, files=files, data=data, timeout=60)
+        if r.status_code != 200:
+            logger.warning("      → Forced alignment falhou: %s %s", r.status_code, r.text[:200])
+            return None
+        words = _alignment_words(r.json())
+        elapsed = time.monotonic() - t0
+        logger.info("      → Forced alignment OK: %d palavras em %.1fs", len(words), elapsed)
+        return words
+    except Exception as e:
+        elapsed = time.monotonic() - t0
+        logger.warning("      → Forced alignment não disponível (%.1fs): %s", elapsed, e)
+        return None
+
+
+async def get_forced_alignment_async(audio_path: str, transcript: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    get_forced_alignment no event loop (aiohttp, dependência do edge-tts).
+    Sem aiohttp → a versão síncrona roda numa thread.
+    """
+    import asyncio
+    try:
+        import aiohttp
+    except ImportError:
+        return await asyncio.to_thread(get_forced_alignment, audio_path, transcript)
+
+    api_key = os.getenv("ELEVENLABS_API_KEY")
+    if not api_key or not api_key.strip():
+        return None
+    if not os.path.isfile(audio_path) or not transcript.strip():
+        return None
+    logger.info("      → Forced alignment: enviando áudio + texto para ElevenLabs...")
+    t0 = time.monotonic()
+    try:
+        audio = await asyncio.to_thread(Path(audio_path).read_bytes)
+        form = aiohttp.FormData()
+        form.add_field("file", audio, filename=os.path.basename(audio_path), content_type="audio/mpeg")
+        form.add_field("text", transcript.strip())
+        timeout = aiohttp.ClientTimeout(total=60)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.post(FORCED_ALIGNMENT_URL, headers={"xi-api-key": api_key.strip()}, data=form) as r:
+                if r.status != 200:
+                    body = await r.text()
+                    logger.warning("      → Forced alignment falhou: %s %s", r.status, body[:200])
+                    return None
+                out = await r.json(content_type=None)
+        words = _alignment_words(out)
+        elapsed = time.monotonic() - t0
+        logger.info("      → Forced alignment OK: %d palavras em %.1fs", len(words), elapsed)
+        return words
+    except Exception as e:
+        elapsed = time.monotonic() - t0
+        logger.warning("      → Forced alignment não disponível (%.1fs): %s", elapsed, e)
+        return None
+
+
+def _is_break_after(word: str) -> bool:
+    """Pausa natural após pontuação forte ou vírgula."""
+    w = (word or "").strip()
+    if not w:
+        return False
+    return w.endswith(".") or w.endswith(",") or w.endswith(";") or w.endswith(":") or w.endswith("!") or w.endswith("?") or w.endswith("—")
+
+
+def segment_into_phrases(
+    words: List[Dict[str, Any]],
+    min_words: int = PHRASE_MIN_WORDS,
+    max_words: int = PHRASE_MAX_WORDS,
+    min_duration: float = MIN_SEGMENT_DURATION,
+) -> List[Dict[str, Any]]:
+    """
+    Agrupa palavras em frases de 10–16 palavras em pausas naturais.
+    Usa timestamps reais do forced alignment (start/end por palavra).
+    Trechos curtos demais são fundidos para tempo mínimo de leitura confortável.
+    Retorna lista de {"text": str, "start": float, "end": float}.
+    """
+    if not words:
+        return []
+    phrases: List[Dict[str, Any]] = []
+    current: List[Dict[str, Any]] = []
+    for w in words:
+        current.append(w)
+        word_count = len(current)
+        text = " ".join(c["text"] for c in current).strip()
+        at_break = _is_break_after(w["text"])
+        if at_break and word_count >= min_words:
+            phrases.append({
+                "text": text,
+                "start": current[0]["start"],
+                "end": current[-1]["end"],
+            })
+            current = []
+        elif word_count >= max_words:
+            phrases.append({
+                "text": text,
+                "start": current[0]["start"],
+                "end": current[-1]["end"],
+            })
+            current = []
+    if current:
+        text = " ".join(c["text"] for c in current).strip()
+        phrases.append({
+            "text": text,
+            "start": current[0]["start"],
+            "end": current[-1]["end"],
+        })
+    # Fusão: trechos com duração < min_duration são unidos ao próximo (ritmo de leitura)
+    merged: List[Dict[str, Any]] = []
+    for p in phrases:
+        dur = p["end"] - p["start"]
+        if merged and dur < min_duration and (p["start"] - merged[-1]["end"]) < 0.15:
+            merged[-1] = {
+                "text": (merged[-1]["text"] + " " + p["text"]).strip(),
+                "start": merged[-1]["start"],
+                "end": p["end"],
+            }
+        else:
+            merged.append(p)
+    return merged
+
+
+def _fallback_segment_by_pauses(
+    body_text: str,
+    total_duration: float,
+) -> List[Dict[str, Any]]:
+    """
+    Fallback sem API: divide por pontuação em trechos de 10–16 palavras.
+    Atribui duração proporcional ao número de palavras.
+    """
+    import re
+    normalized = " ".join(body_text.strip().split())
+    if not normalized:
+        return []
+    tokens = re.findall(r"[^\s.,;:!?—]+|[.,;:!?—]", normalized)
+    words_only = [t for t in tokens if t not in ".,;:!?—"]
+    if not words_only:
+        return [{"text": normalized, "start": 0.0, "end": max(2.0, total_duration)}]
+    n = len(words_only)
+    phrase_size = max(PHRASE_MIN_WORDS, min(PHRASE_MAX_WORDS, n // max(1, (int(total_duration) // 2))))
+    phrases: List[Dict[str, Any]] = []
+    i = 0
+    t = 0.0
+    step = total_duration / max(1, (n + phrase_size - 1) // phrase_size)
+    while i < n:
+        take = min(phrase_size, n - i)
+        chunk = words_only[i : i + take]
+        text = " ".join(chunk)
+        start = t
+        end = t + step
+        t = end
+        phrases.append({"text": text, "start": start, "end": end})
+        i += take
+    if phrases:
+        phrases[-1]["end"] = total_duration
+    return phrases
+
+
+# =============================================================================
+# TIPOGRAFIA DE MARCA — SEM FONTE GENÉRICA
+# Uma família premium (Playfair, Cinzel, Cormorant, DM Serif Display, Montserrat, Poppins, Inter).
+# Se a fonte não carregar → RuntimeError explícito (nunca fallback silencioso).
+# =============================================================================
+
+_font_managers: Dict[str, Any] = {}
+
+
+def _get_brand_font_manager(fonts_dir: Optional[str] = None):
+    """
+    Retorna FontManager (um por pasta de fontes no processo: fontes TrueType carregadas uma vez).
+    Levanta RuntimeError se não for possível carregar (sem fallback).
+    """
+    base = Path(__file__).resolve().parents[1]
+    from core.premium_visuals import FontManager
+    path = fonts_dir or str(base / "outputs" / "fonts")
+    if path not in _font_managers:
+        _font_managers[path] = FontManager(path)
+    return _font_managers[path]
+
+
+def _get_phrase_fonts(fonts_dir: Optional[str] = None, is_reference: bool = False) -> ImageFont.FreeTypeFont:
+    """Fonte de marca obrigatória. Erro explícito se não carregar."""
+    fm = _get_brand_font_manager(fonts_dir)
+    if is_reference:
+        return fm.get_brand_title_font(int(HEIGHT * 0.038))
+    return fm.get_brand_body_font(int(HEIGHT * 0.055))
+
+
+def _get_header_font(fonts_dir: Optional[str] = None) -> ImageFont.FreeTypeFont:
+    """Header: fonte de marca obrigatória. Erro explícito se não carregar."""
+    fm = _get_brand_font_manager(fonts_dir)
+    return fm.get_brand_title_font(int(HEIGHT * 0.042))
+
+
+def render_header_band(
+    reference: str,
+    width: Optional[int] = None,
+    height_band: Optional[int] = None,
+    fonts_dir: Optional[str] = None,
+) -> Image.Image:
+    """
+    Faixa fixa do topo: referência bíblica (ex. Gálatas 5:22–23) sobre gradiente escuro.
+    Tipografia serif premium, branco quente #F5F2E8, glow + sombra. Contraste máximo.
+    width/height_band: padrão = layout atual (WIDTH, HEADER_HEIGHT).
+    """
+    width = width or WIDTH
+    height_band = height_band or HEADER_HEIGHT
+    if not reference or not reference.strip():
+        ref_img = Image.new("RGBA", (width, height_band), (0, 0, 0, 0))
+        return ref_img
+    band = Image.new("RGBA", (width, height_band), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(band)
+    # Gradiente escuro: topo mais escuro, transição suave para transparente na base
+    for y in range(height_band):
+        alpha = int(200 * (1 - 0.65 * y / max(1, height_band)))
+        alpha = max(0, min(255, alpha))
+        draw.line([(0, y), (width, y)], fill=(0, 0, 0, alpha))
+    draw = ImageDraw.Draw(band)
+    font = _get_header_font(fonts_dir)
+    text = reference.strip()
+    bbox = draw.textbbox((0, 0), text, font=font)
+    tw = bbox[2] - bbox[0]
+    x = (width - tw) // 2
+    y = (height_band - (bbox[3] - bbox[1])) // 2 - 2
+    for dx in (-2, 0, 2):
+        for dy in (-2, 0, 2):
+            if dx or dy:
+                draw.text((x + dx, y + dy), text, font=font, fill=GLOW_RGBA)
+    draw.text((x + 2, y + 2), text, font=font, fill=SHADOW_RGBA)
+    draw.text((x, y), text, font=font, fill=TEXT_WARM_WHITE)
+    return band
+
+
+def render_phrase_overlay(
+    text: str,
+    size: Optional[Tuple[int, int]] = None,
+    fonts_dir: Optional[str] = None,
+    is_reference: bool = False,
+    reference_title: str = "",
+) -> Image.Image:
+    """
+    Um frame: header fixo com referência no topo (se reference_title) + conteúdo centralizado.
+    Serif premium, branco quente (#F5F2E8), sombra + glow. Legibilidade perfeita.
+    """
+    w, h = size or (WIDTH, HEIGHT)
+    content_top = HEADER_HEIGHT if reference_title else 0
+    content_h = h - content_top
+    overlay = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    padding = int(w * 0.14)
+    max_line_width = w - 2 * padding
+    font = _get_phrase_fonts(fonts_dir, is_reference=is_reference)
+    color = TEXT_WARM_WHITE
+    if is_reference:
+        color = (240, 235, 220, 250)
+
+    def _wrap(_text: str) -> List[str]:
+        words = _text.replace("\n", " ").strip().split()
+        if not words:
+            return [""]
+        out, current = [], []
+        for word in words:
+            test = " ".join(current + [word])
+            bbox = draw.textbbox((0, 0), test, font=font)
+            if bbox[2] - bbox[0] <= max_line_width:
+                current.append(word)
+            else:
+                if current:
+                    out.append(" ".join(current))
+                current = [word]
+        if current:
+            out.append(" ".join(current))
+        return out
+
+    def _draw_centered(_d: ImageDraw.ImageDraw, _t: str, y: int, glow: bool = True):
+        bbox = _d.textbbox((0, 0), _t, font=font)
+        tw = bbox[2] - bbox[0]
+        x = (w - tw) // 2
+        if glow and not is_reference:
+            for dx in (-2, 0, 2):
+                for dy in (-2, 0, 2):
+                    if dx or dy:
+                        _d.text((x + dx, y + dy), _t, font=font, fill=GLOW_RGBA)
+        _d.text((x + 2, y + 2), _t, font=font, fill=SHADOW_RGBA)
+        _d.text((x, y), _t, font=font, fill=color)
+
+    lines = _wrap(text)
+    line_height = int(h * 0.07) if not is_reference else int(h * 0.05)
+    # Centralizar conteúdo na área abaixo do header
+    y = content_top + (content_h - line_height * len(lines)) // 2 - line_height // 2
+    for line in lines:
+        if line:
+            _draw_centered(draw, line, y, glow=not is_reference)
+        y += line_height
+
+    if reference_title:
+        header_band = render_header_band(reference_title, w, HEADER_HEIGHT, fonts_dir)
+        overlay.paste(header_band, (0, 0), header_band)
+    return overlay
+
+
+def _wrap_verse_by_width(
+    draw: ImageDraw.ImageDraw,
+    font: ImageFont.FreeTypeFont,
+    text: str,
+    max_width: int,
+) -> List[str]:
+    """Quebra por palavras (nunca cortar palavras/sílabas). Respeita max_width."""
+    words = text.replace("\n", " ").strip().split()
+    if not words:
+        return [""]
+    out, current = [], []
+    for word in words:
+        test = " ".join(current + [word])
+        bbox = draw.textbbox((0, 0), test, font=font)
+        if bbox[2] - bbox[0] <= max_width:
+            current.append(word)
+        else:
+            if current:
+                out.append(" ".join(current))
+            current = [word]
+    if current:
+        out.append(" ".join(current))
+    return out
+
+
+def _balance_verse_lines(
+    draw: ImageDraw.ImageDraw,
+    font: ImageFont.FreeTypeFont,
+    lines: List[str],
+    max_width: int,
+    min_width_ratio: float = VERSE_MIN_LINE_WIDTH_RATIO,
+) -> List[str]:
+    """
+    Evita linha última muito curta (orphan): se a última linha for curta demais,
+    tenta colocar todo o conteúdo na linha anterior (se couber). Nunca corta palavras.
+    """
+    if len(lines) <= 1:
+        return lines
+    min_width = int(max_width * min_width_ratio)
+    last = lines[-1].strip()
+    if not last:
+        return lines[:-1]
+    last_bbox = draw.textbbox((0, 0), last, font=font)
+    last_w = last_bbox[2] - last_bbox[0]
+    if last_w >= min_width:
+        return lines
+    prev = lines[-2]
+    test_prev = (prev + " " + last).strip()
+    bbox = draw.textbbox((0, 0), test_prev, font=font)
+    if bbox[2] - bbox[0] <= max_width:
+        return lines[:-2] + [test_prev]
+    return lines
+
+
+def _normalize_verse_text_for_render(text: str) -> str:
+    """Aplica normalização de exibição antes de renderizar (capitalização, limpeza)."""
+    from core.psalm_text_preparation import normalize_text_for_display
+    return normalize_text_for_display(text or "").strip()
+
+
+def render_verse_only_overlay(
+    text: str,
+    size: Optional[Tuple[int, int]] = None,
+    fonts_dir: Optional[str] = None,
+    is_reference: bool = False,
+) -> Image.Image:
+    """
+    Composição tipográfica cinematográfica: centralizada (vertical + horizontal),
+    caixa fixa, safe area, quebra só por palavras (nunca cortar letras/sílabas).
+    Texto normalizado antes de desenhar. Sem overflow, layout estável.
+    """
+    w, h = size or (WIDTH, HEIGHT)
+    overlay = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    font = _get_phrase_fonts(fonts_dir, is_reference=is_reference)
+    color = TEXT_WARM_WHITE
+    if is_reference:
+        color = (240, 235, 220, 250)
+
+    # Etapa 1 — Texto limpo para exibição (capitalização, espaços, pontuação)
+    text = _normalize_verse_text_for_render(text)
+    if not text:
+        return overlay
+
+    def _draw_centered_line(_d: ImageDraw.ImageDraw, _t: str, y: int, glow: bool = True) -> None:
+        bbox = _d.textbbox((0, 0), _t, font=font)
+        tw = bbox[2] - bbox[0]
+        th = bbox[3] - bbox[1]
+        x = (w - tw) // 2
+        # Não desenhar fora da caixa (evita letras cortadas)
+        if y + th > VERSE_AREA_BOTTOM or y < VERSE_AREA_TOP:
+            return
+        if glow and not is_reference:
+            for dx in (-2, 0, 2):
+                for dy in (-2, 0, 2):
+                    if dx or dy:
+                        _d.text((x + dx, y + dy), _t, font=font, fill=GLOW_RGBA)
+        _d.text((x + 2, y + 2), _t, font=font, fill=SHADOW_RGBA)
+        _d.text((x, y), _t, font=font, fill=color)
+
+    # Etapa 2 — Paginação inteligente: quebra só por palavras, densidade equilibrada
+    lines = _wrap_verse_by_width(draw, font, text, VERSE_MAX_LINE_WIDTH)
+    lines = _balance_verse_lines(draw, font, lines, VERSE_MAX_LINE_WIDTH)
+    if not lines:
+        return overlay
+
+    line_height = int(VERSE_AREA_HEIGHT * VERSE_LINE_HEIGHT_RATIO) if not is_reference else int(VERSE_AREA_HEIGHT * 0.052)
+    total_lines_h = line_height * len(lines)
+    if total_lines_h > VERSE_AREA_HEIGHT:
+        line_height = max(14, VERSE_AREA_HEIGHT // len(lines))
+        total_lines_h = line_height * len(lines)
+
+    # Etapa 3 — Centralização simétrica (vertical + horizontal)
+    y_offset = max(0, (VERSE_AREA_HEIGHT - total_lines_h) // 2)
+    y = VERSE_AREA_TOP + y_offset
+    for line in lines:
+        line = line.strip()
+        if line:
+            _draw_centered_line(draw, line, y, glow=not is_reference)
+        y += line_height
+    return overlay
+
+
+# =============================================================================
+# RENDER RETENÇÃO – 4 ESTILOS DE FRAME (LEGADO)
+# =============================================================================
+
+def _get_retention_fonts(
+    frame_index: int,
+    fonts_dir: Optional[str] = None,
+) -> Tuple[ImageFont.FreeTypeFont, ImageFont.FreeTypeFont]:
+    """Fonte de marca obrigatória em todos os frames. Erro explícito se não carregar."""
+    fm = _get_brand_font_manager(fonts_dir)
+    if frame_index == 3:
+        return fm.get_brand_title_font(int(HEIGHT * 0.038)), fm.get_brand_body_font(int(HEIGHT * 0.028))
+    if frame_index == 0:
+        return fm.get_brand_title_font(int(HEIGHT * 0.072)), fm.get_brand_body_font(int(HEIGHT * 0.058))
+    return fm.get_brand_title_font(int(HEIGHT * 0.055)), fm.get_brand_body_font(int(HEIGHT * 0.042))
+
+
+def render_retention_frame(
+    frame_index: int,
+    text: str,
+    reference: str,
+    size: Optional[Tuple[int, int]] = None,
+    fonts_dir: Optional[str] = None,
+    golden_light: bool = False,
+) -> Image.Image:
+    """
+    Renderiza um frame da sequência de retenção.
+    frame_index: 0=hook (texto MUITO grande), 1=part2, 2=part3 (luz dourada sutil), 3=referência (texto menor).
+    """
+    w, h = size or (WIDTH, HEIGHT)
+    content_top = HEADER_HEIGHT
+    content_h = h - content_top
+    overlay = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    padding = int(w * 0.12)
+    max_line_width = w - 2 * padding
+
+    title_font, body_font = _get_retention_fonts(frame_index, fonts_dir)
+    if frame_index == 3:
+        main_font = title_font
+        text_to_draw = reference
+    else:
+        main_font = body_font if len(text) > 60 else title_font
+        text_to_draw = text.strip()
+
+    color = TEXT_WARM_WHITE
+    if golden_light and frame_index == 2:
+        color = (255, 235, 200, 252)
+
+    def _wrap(_text: str, font: ImageFont.FreeTypeFont) -> List[str]:
+        words = _text.replace("\n", " ").strip().split()
+        if not words:
+            return [""]
+        out, current = [], []
+        for word in words:
+            test = " ".join(current + [word])
+            bbox = draw.textbbox((0, 0), test, font=font)
+            if bbox[2] - bbox[0] <= max_line_width:
+                current.append(word)
+            else:
+                if current:
+                    out.append(" ".join(current))
+                current = [word]
+        if current:
+            out.append(" ".join(current))
+        return out
+
+    def _draw_centered(d: ImageDraw.ImageDraw, _t: str, font: ImageFont.FreeTypeFont, y: int, fill: tuple, glow: bool = True):
+        bbox = d.textbbox((0, 0), _t, font=font)
+        tw = bbox[2] - bbox[0]
+        x = (w - tw) // 2
+        if glow:
+            for dx in range(-3, 4, 2):
+                for dy in range(-3, 4, 2):
+                    d.text((x + dx, y + dy), _t, font=font, fill=GLOW_RGBA)
+        d.text((x + 2, y + 2), _t, font=font, fill=SHADOW_RGBA)
+        d.text((x, y), _t, font=font, fill=fill)
+
+    lines = _wrap(text_to_draw, main_font)
+    if frame_index == 0 and len(lines) > 2:
+        lines = lines[:2]
+    line_height = int(h * (0.08 if frame_index == 0 else 0.065 if frame_index == 3 else 0.07))
+    y = content_top + (content_h - line_height * len(lines)) // 2 - line_height // 2
+    for line in lines:
+        if line:
+            _draw_centered(draw, line, main_font, y, color, glow=(frame_index != 3))
+        y += line_height
+
+    if reference:
+        header_band = render_header_band(reference, w, HEADER_HEIGHT, fonts_dir)
+        overlay.paste(header_band, (0, 0), header_band)
+    return overlay
+
+
+# =============================================================================
+# CACHE DE OVERLAYS — texto já rasterizado é reaproveitado entre execuções
+# =============================================================================
+
+_font_fingerprints: Dict[str, str] = {}
+
+
+def _brand_font_fingerprint(fonts_dir: Optional[str] = None) -> str:
+    """Hash dos arquivos da fonte de marca (regular + bold) usados nos overlays."""
+    fm = _get_brand_font_manager(fonts_dir)
+    memo_key = f"{fm.fonts_dir}|{fm.BRAND_FONT_KEY}"
+    if memo_key not in _font_fingerprints:
+        from core.render_cache import file_content_hash
+        regular = fm.download_font(fm.BRAND_FONT_KEY, bold=False) or ""
+        bold = fm.download_font(fm.BRAND_FONT_KEY, bold=True) or ""
+        _font_fingerprints[memo_key] = f"{fm.BRAND_FONT_KEY}:{file_content_hash(regular)}:{file_content_hash(bold)}"
+    return _font_fingerprints[memo_key]
+
+
+def _overlay_layout_signature(layout: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+    """
+    Constantes de layout/cor que afetam a rasterização (entram na chave do cache).
+    layout=(w, h) calcula a assinatura desse quadro via _layout_constants, sem tocar nos globais do módulo
+    (seguro entre threads); None → layout atual.
+    """
+    c = _layout_constants(*layout) if layout is not None else globals()
+    return {
+        "frame": [c["WIDTH"], c["HEIGHT"]],
+        "header_height": c["HEADER_HEIGHT"],
+        "verse": [
+            c["VERSE_PADDING_H"], c["VERSE_PADDING_TOP"], c["VERSE_PADDING_BOTTOM"], c["VERSE_AREA_TOP"],
+            c["VERSE_AREA_BOTTOM"], c["VERSE_MAX_LINE_WIDTH"], VERSE_LINE_HEIGHT_RATIO, VERSE_MIN_LINE_WIDTH_RATIO,
+        ],
+        "colors": [TEXT_WARM_WHITE, SHADOW_RGBA, GLOW_RGBA],
+    }
+
+
+def _cached_overlay(
+    kind: str,
+    render: Callable[..., Image.Image],
+    *args: Any,
+    fonts_dir: Optional[str] = None,
+    **kwargs: Any,
+) -> "OverlayRaster":
+    """
+    render(*args, fonts_dir=fonts_dir, **kwargs) recortado ao bounding box, com cache persistente
+    (core.render_cache.OverlayCache). Chave: tipo + argumentos + hash da fonte + layout.
+    Em hit, nenhum texto é rasterizado.
+    """
+    from core.render_cache import get_overlay_cache
+    params = {
+        "kind": kind,
+        "args": list(args),
+        "kwargs": kwargs,
+        "font": _brand_font_fingerprint(fonts_dir),
+        "layout": _overlay_layout_signature(),
+    }
+    return get_overlay_cache().get_or_render(params, lambda: render(*args, fonts_dir=fonts_dir, **kwargs))
+
+
+# =============================================================================
+# 2. NARRAÇÃO – EXCLUSIVAMENTE EDGE-TTS
+# =============================================================================
+
+# Voz obrigatória: pt-BR-ThalitaMultilingualNeural (sem fallback, sem substituição)
+EDGE_TTS_VOICE = "pt-BR-ThalitaMultilingualNeural"
+
+
+# Blocos sintetizados ao mesmo tempo na narração por blocos (SALMO_TTS_CONCURRENCY); 1 → um de cada vez
+TTS_CONCURRENCY = max(1, int(os.getenv("SALMO_TTS_CONCURRENCY", "4") or 1))
+
+
+def _edge_tts_error(e: Exception) -> RuntimeError:
+    err_msg = str(e)
+    if "403" in err_msg or "Invalid response status" in err_msg:
+        return RuntimeError(
+            "edge-tts retornou 403 (serviço Microsoft recusou a conexão). "
+            "Tente: 1) pip install --upgrade edge-tts  2) Se persistir, a Microsoft pode bloquear sua rede/região — teste outra rede ou VPN."
+        )
+    return RuntimeError(f"edge-tts falhou: {e}")
+
+
+async def generate_voice_async(text: str, output_path: str) -> str:
+    """generate_voice como corrotina: a síntese edge-tts roda no event loop do chamador."""
+    import edge_tts
+
+    logger.info("[2/6] Gerando voz (edge-tts – %s)...", EDGE_TTS_VOICE)
+    t0 = time.monotonic()
+    os.makedirs(os.path.dirname(output_path) or "outputs", exist_ok=True)
+    try:
+        communicate = edge_tts.Communicate(text.strip(), EDGE_TTS_VOICE)
+        progress = track_progress("tts", output_path, unit="bytes", chars=len(text.strip()), voice=EDGE_TTS_VOICE)
+        if not progress.active:
+            await communicate.save(output_path)
+        else:
+            # Tamanho final desconhecido: bytes recebidos e taxa (sem ETA)
+            with progress, open(output_path, "wb") as f:
+                async for chunk in communicate.stream():
+                    if chunk.get("type") == "audio":
+                        f.write(chunk["data"])
+                        progress.advance(len(chunk["data"]))
+    except Exception as e:
+        logger.exception("edge-tts falhou: %s", e)
+        raise _edge_tts_error(e) from e
+    size_kb = os.path.getsize(output_path) // 1024
+    elapsed = time.monotonic() - t0
+    logger.info("[2/6] Narração edge-tts concluída: %s (%d KB) em %.1fs", output_path, size_kb, elapsed)
+    return output_path
+
+
+def generate_voice(text: str, output_path: str) -> str:
+    """
+    Gera narração com edge-tts exclusivamente.
+    Voz: pt-BR-ThalitaMultilingualNeural. Áudio salvo em MP3.
+    Sem fallback: se edge-tts falhar, lança exceção.
+    Dentro de um event loop, use generate_voice_async.
+    """
+    import asyncio
+    return asyncio.run(generate_voice_async(text, output_path))
+
+
+def _merge_voice_segments(paths: List[str], texts: List[str], output_path: str) -> List[Dict[str, Any]]:
+    """Concatena os MP3 dos blocos em output_path; retorna phrase_segments com os tempos reais de cada bloco."""
+    from pydub import AudioSegment
+
+    combined = AudioSegment.empty()
+    starts: List[float] = [0.0]
+    for p in paths:
+        seg = AudioSegment.from_mp3(p)
+        combined += seg
+        starts.append(starts[-1] + len(seg) / 1000.0)
+    combined.export(output_path, format="mp3", bitrate="192k")
+    phrase_segments = [{"text": texts[i], "start": starts[i], "end": starts[i + 1]} for i in range(len(texts))]
+    logger.info("[2/6] Narração por blocos: %d segmentos, %.1fs total", len(phrase_segments), starts[-1])
+    return phrase_segments
+
+
+async def _generate_voice_from_segments_async(
+    segments: List[str],
+    output_path: str,
+    tts_limit: Optional[Any] = None,
+) -> Tuple[List[Dict[str, Any]], str]:
+    """
+    Gera áudio por bloco (cadência preparada), concatena e retorna phrase_segments com tempos exatos.
+    Cada bloco = 1 unidade de áudio; tempo de tela = duração real da fala. Sincronização perfeita.
+    Blocos sintetizados em paralelo (até TTS_CONCURRENCY, ou o asyncio.Semaphore tts_limit compartilhado
+    entre vídeos); a ordem do áudio final é a dos blocos. O merge (pydub/ffmpeg) roda numa thread.
+    """
+    import asyncio
+    import tempfile
+
+    parent = os.path.dirname(output_path)
+    if not parent:
+        parent = "outputs"
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix="salmo_tts_", dir=parent)
+    limit = tts_limit or asyncio.Semaphore(TTS_CONCURRENCY)
+    blocks = [(os.path.join(tmp_dir, f"seg_{i:04d}.mp3"), text.strip()) for i, text in enumerate(segments)
+              if (text or "").strip()]
+    paths = [p for p, _ in blocks]
+
+    async def _synthesize(path: str, text: str) -> None:
+        async with limit:
+            await generate_voice_async(text, path)
+
+    try:
+        if not blocks:
+            raise RuntimeError("Nenhum segmento de áudio gerado.")
+        tasks = [asyncio.ensure_future(_synthesize(p, text)) for p, text in blocks]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Um bloco falhou: cancela os demais antes de limpar a pasta temporária
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        phrase_segments = await asyncio.to_thread(
+            _merge_voice_segments, paths, [text for _, text in blocks], output_path
+        )
+        return phrase_segments, output_path
+    finally:
+        for p in paths:
+            try:
+                if os.path.isfile(p):
+                    os.remove(p)
+            except OSError:
+                pass
+        try:
+            os.rmdir(tmp_dir)
+        except OSError:
+            pass
+
+
+def _generate_voice_from_segments(
+    segments: List[str],
+    output_path: str,
+) -> Tuple[List[Dict[str, Any]], str]:
+    """Versão síncrona de _generate_voice_from_segments_async (um único event loop para todos os blocos)."""
+    import asyncio
+    return asyncio.run(_generate_voice_from_segments_async(segments, output_path))
+
+
+# =============================================================================
+# 3. RENDER TEXT OVERLAY
+# =============================================================================
+
+def _get_cinematic_fonts(fonts_dir: Optional[str] = None) -> Tuple[ImageFont.FreeTypeFont, ImageFont.FreeTypeFont]:
+    """Fonte de marca obrigatória para overlay cinematográfico. Erro explícito se não carregar."""
+    fm = _get_brand_font_manager(fonts_dir)
+    return fm.get_brand_title_font(int(HEIGHT * 0.048)), fm.get_brand_body_font(int(HEIGHT * 0.032))
+
+
+def render_text_overlay(
+    size: Optional[Tuple[int, int]] = None,
+    title: str = "",
+    body_text: str = "",
+    fonts_dir: Optional[str] = None,
+) -> Image.Image:
+    """
+    Renderiza overlay de texto centralizado: tipografia elegante (serif),
+    sombra suave, layout limpo. Transparência para composição sobre o background.
+    """
+    w, h = size or (WIDTH, HEIGHT)
+    overlay = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+
+    title_font, body_font = _get_cinematic_fonts(fonts_dir)
+    padding = int(w * 0.1)
+    max_line_width = w - 2 * padding
+    text_color = (255, 252, 245, 250)
+    shadow_color = (0, 0, 0, 120)
+
+    def _draw_centered(d: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont, y: int, color: tuple):
+        bbox = d.textbbox((0, 0), text, font=font)
+        tw = bbox[2] - bbox[0]
+        x = (w - tw) // 2
+        d.text((x + 2, y + 2), text, font=font, fill=shadow_color)
+        d.text((x, y), text, font=font, fill=color)
+
+    def _wrap(text: str, font: ImageFont.FreeTypeFont) -> List[str]:
+        lines = []
+        for para in text.strip().split("\n"):
+            para = para.strip()
+            if not para:
+                lines.append("")
+                continue
+            words = para.split()
+            current = []
+            for word in words:
+                test = " ".join(current + [word])
+                bbox = draw.textbbox((0, 0), test, font=font)
+                if bbox[2] - bbox[0] <= max_line_width:
+                    current.append(word)
+                else:
+                    if current:
+                        lines.append(" ".join(current))
+                    current = [word]
+            if current:
+                lines.append(" ".join(current))
+        return lines
+
+    y = int(h * 0.12)
+    if title:
+        _draw_centered(draw, title, title_font, y, text_color)
+        y += int(h * 0.08)
+
+    for line in _wrap(body_text, body_font):
+        if line:
+            _draw_centered(draw, line, body_font, y, text_color)
+        y += int(h * 0.045)
+
+    return overlay
+
+
+# =============================================================================
+# 4. COMPOSE VIDEO
+# =============================================================================
+
+def compose_video(
+    background_image: Image.Image,
+    text_overlay: Image.Image,
+    voice_audio_path: str,
+    output_path: str,
+    music_path: Optional[str] = None,
+    music_volume: float = 0.18,
+    ken_burns_zoom: float = 1.08,
+    fade_duration: float = 0.8,
+    fps: int = FPS,
+    encode: Optional[EncoderProfile] = None,
+) -> str:
+    """
+    Compõe o vídeo final:
+    - Background com Ken Burns (zoom suave) + color grading + glow
+    - Overlay de texto com fade-in e fade-out
+    - Áudio: voz + música ambiente (se music_path) com mixagem profissional
+    - Saída 1080x1920, duração = duração do áudio de voz
+    - encode: perfil de encode (padrão get_encoder_profile())
+    """
+    from moviepy.editor import (
+        AudioFileClip,
+        CompositeVideoClip,
+        CompositeAudioClip,
+    )
+    from moviepy.video.fx.all import fadein, fadeout
+
+    voice_clip = AudioFileClip(voice_audio_path)
+    duration = voice_clip.duration
+
+    if duration < 1.0:
+        duration = 1.0
+
+    # Background: color grading + glow
+    bg_np = np.array(_apply_soft_glow(_apply_spiritual_grading(background_image.copy())))
+
+    # Ken Burns: zoom suave ao longo do tempo (crop pré-calculado sobre fundo renderizado uma vez)
+    bg_clip = KenBurnsZoom(bg_np, (WIDTH, HEIGHT), 1.0, ken_burns_zoom, duration, fps).to_clip()
+
+    # Overlay de texto com fade in/out (só o recorte com conteúdo, máscara uint8)
+    layers = [bg_clip]
+    overlay_clip = _raster_clip(_as_overlay_raster(text_overlay), duration)
+    if overlay_clip is not None:
+        layers.append(overlay_clip.fx(fadein, fade_duration).fx(fadeout, fade_duration))
+
+    composite = CompositeVideoClip(layers, size=(WIDTH, HEIGHT))
+
+    # Áudio: música ambiente abaixo da voz (crossfade suave, mixagem profissional)
+    if music_path and os.path.isfile(music_path):
+        try:
+            from pydub import AudioSegment
+            music = AudioSegment.from_file(music_path)
+            music = music - 18  # dB abaixo
+            music = music[: int(duration * 1000)]
+            music_path_trimmed = voice_audio_path.replace(".mp3", "_music_trim.mp3")
+            music.export(music_path_trimmed, format="mp3")
+            music_clip = AudioFileClip(music_path_trimmed)
+            music_clip = music_clip.volumex(music_volume)
+            voice_only = voice_clip.volumex(1.0)
+            final_audio = CompositeAudioClip([music_clip, voice_only])
+            composite = composite.set_audio(final_audio)
+            music_clip.close()
+            if os.path.exists(music_path_trimmed):
+                os.remove(music_path_trimmed)
+        except Exception as e:
+            logger.warning("Música ambiente ignorada: %s", e)
+            composite = composite.set_audio(voice_clip)
+    else:
+        composite = composite.set_audio(voice_clip)
+
+    os.makedirs(os.path.dirname(output_path) or "outputs", exist_ok=True)
+    _write_moviepy(composite, output_path, fps, encode, int(round(duration * fps)))
+
+    voice_clip.close()
+    bg_clip.close()
+    if overlay_clip is not None:
+        overlay_clip.close()
+    composite.close()
+
+    logger.info("Vídeo cinematográfico exportado: %s (%.1fs)", output_path, duration)
+    return output_path
+
+
+def compose_retention_video(
+    background_image: Image.Image,
+    overlay_images: Sequence[Any],
+    voice_audio_path: str,
+    segment_texts: Tuple[str, str, str, str],
+    output_path: str,
+    music_path: Optional[str] = None,
+    music_volume: float = 0.18,
+    fps: int = FPS,
+    engine: Optional[str] = None,
+    encode: Optional[EncoderProfile] = None,
+) -> str:
+    """
+    Compõe o vídeo de retenção em 4 segmentos:
+    - Fundo dark cinematic + movimento (zoom/drift) em todos os frames
+    - Hook: fade-in rápido (0.35s); Referência: fade-out cinematográfico
+    - Durações: 3 segmentos narrados proporcional ao texto + 2.5s referência
+    overlay_images: OverlayRaster (recorte + posição) ou imagens RGBA de quadro inteiro.
+    engine: "numpy" | "ffmpeg" | "sliced" | "moviepy" (ver RENDER_ENGINES); se o motor falhar, cai no MoviePy.
+    encode: perfil de encode (core.encoder_profiles; padrão get_encoder_profile(), rascunho usa "draft").
+    """
+    assert len(overlay_images) >= 4 and len(segment_texts) >= 4
+    engine = _resolve_render_engine(engine)
+    logger.info("[4/6] Compondo vídeo retenção (4 frames)...")
+    t_retention = time.monotonic()
+    total_voice = _audio_duration(voice_audio_path)
+    if total_voice < 1.0:
+        total_voice = 1.0
+    hook_t, part2_t, part3_t, ref_t = segment_texts[0], segment_texts[1], segment_texts[2], segment_texts[3]
+    total_chars = max(1, len(hook_t) + len(part2_t) + len(part3_t))
+    d1 = total_voice * len(hook_t) / total_chars
+    d2 = total_voice * len(part2_t) / total_chars
+    d3 = total_voice - d1 - d2
+    if d3 < 0.5:
+        d3 = 0.5
+        d1 = min(d1, total_voice - d2 - d3)
+        d2 = total_voice - d1 - d3
+    d4 = REFERENCE_FRAME_DURATION
+    durations = [d1, d2, d3, d4]
+
+    # Zoom contínuo nos 4 segmentos: 1.0 → 1.015 → 1.03 → 1.045 → 1.06 (uma tomada)
+    zoom_per_seg = 0.06 / 4
+    crossfade_ret = 0.6
+
+    # Fundos: só 2 variações (normal / dourado no segmento 3) — graduados uma vez cada
+    bg_plain = _make_graded_bg_np(background_image, golden=False)
+    bg_golden = _make_graded_bg_np(background_image, golden=True, golden_gain=(1.08, 0.92))
+    # (start, dur, z_start, z_end, fade_in, fade_out, bg, overlay recortado)
+    segments: List[Tuple[float, float, float, float, float, float, np.ndarray, OverlayRaster]] = []
+    seg_start = 0.0
+    for i in range(4):
+        dur = durations[i]
+        fade_in = min(0.5, dur * 0.2) if i == 0 else min(crossfade_ret, dur * 0.3)
+        fade_out = min(crossfade_ret, dur * 0.35) if i < 3 else min(1.2, dur * 0.5)
+        segments.append((
+            seg_start,
+            dur,
+            1.0 + zoom_per_seg * i,
+            1.0 + zoom_per_seg * (i + 1),
+            fade_in,
+            fade_out,
+            bg_golden if i == 2 else bg_plain,
+            _as_overlay_raster(overlay_images[i]),
+        ))
+        seg_start += dur
+
+    os.makedirs(os.path.dirname(output_path) or "outputs", exist_ok=True)
+    if engine != "moviepy":
+        from core.render_plan import RenderPlan, overlay_layer_from_raster
+
+        plan = RenderPlan(size=(WIDTH, HEIGHT), fps=fps, duration=seg_start)
+        for start, dur, z_start, z_end, fade_in, fade_out, bg_np, raster in segments:
+            plan.backgrounds.append(BackgroundLayer(bg_np, start, start + dur, z_start, z_end))
+            layer = overlay_layer_from_raster(raster, start, start + dur, fade_in, fade_out)
+            if layer is not None:
+                plan.overlays.append(layer)
+        stats = _export_plan(engine, plan, output_path, voice_audio_path, d1 + d2 + d3, music_path, music_volume, encode)
+        if stats is not None:
+            _note_export(output_path, engine, stats["frames"], stats["seconds"])
+            logger.info(
+                "[5/6] Vídeo retenção exportado em %.1fs (%s: %d frames em %.1fs = %.1f fps): %s (%.1fs)",
+                time.monotonic() - t_retention, engine, stats["frames"], stats["seconds"], stats["fps"], output_path, seg_start,
+            )
+            return output_path
+
+    from moviepy.editor import (
+        AudioFileClip,
+        CompositeVideoClip,
+        CompositeAudioClip,
+        concatenate_videoclips,
+        concatenate_audioclips,
+    )
+    from moviepy.video.fx.all import fadein, fadeout
+    from moviepy.audio.AudioClip import AudioClip
+
+    voice_clip = AudioFileClip(voice_audio_path)
+    clips = []
+    for start, dur, z_start, z_end, fade_in, fade_out, bg_np, raster in segments:
+        bg_clip = KenBurnsZoom(bg_np, (WIDTH, HEIGHT), z_start, z_end, dur, fps).to_clip()
+        layers = [bg_clip]
+        overlay_clip = _raster_clip(raster, dur)
+        if overlay_clip is not None:
+            layers.append(overlay_clip.fx(fadein, fade_in).fx(fadeout, fade_out))
+        comp = CompositeVideoClip(layers, size=(WIDTH, HEIGHT))
+        clips.append(comp)
+
+    final = concatenate_videoclips(clips)
+    total_duration = final.duration
+    # Áudio: voz nos primeiros d1+d2+d3, silêncio no último segmento
+    voice_trimmed = voice_clip.subclip(0, d1 + d2 + d3)
+    # Silêncio no segmento de referência (d4 segundos)
+    try:
+        silence = AudioClip(lambda t: np.zeros(1), duration=d4, fps=44100)
+        voice_with_silence = concatenate_audioclips([voice_trimmed, silence])
+    except Exception:
+        voice_with_silence = voice_trimmed
+
+    if music_path and os.path.isfile(music_path):
+        try:
+            from pydub import AudioSegment
+            music = AudioSegment.from_file(music_path)
+            music = music - 18
+            music = music[: int(total_duration * 1000)]
+            music_path_trimmed = voice_audio_path.replace(".mp3", "_music_retention.mp3")
+            music.export(music_path_trimmed, format="mp3")
+            music_clip = AudioFileClip(music_path_trimmed)
+            music_clip = music_clip.volumex(music_volume).set_duration(total_duration)
+            voice_only = voice_with_silence.volumex(1.0)
+            if voice_only.duration > total_duration:
+                voice_only = voice_only.subclip(0, total_duration)
+            final_audio = CompositeAudioClip([music_clip, voice_only])
+            final = final.set_audio(final_audio)
+            music_clip.close()
+            if os.path.exists(music_path_trimmed):
+                os.remove(music_path_trimmed)
+        except Exception as e:
+            logger.warning("Música retenção ignorada: %s", e)
+            final = final.set_audio(voice_with_silence)
+    else:
+        final = final.set_audio(voice_with_silence)
+
+    logger.info("[5/6] Exportando MP4 (MoviePy; pode levar 2–5 min; aguarde)...")
+    t_export_ret = time.monotonic()
+    with profile_section("compose_encode"):
+        _write_moviepy(final, output_path, fps, encode, int(round(total_duration * fps)))
+    export_ret_elapsed = time.monotonic() - t_export_ret
+    voice_clip.close()
+    for c in clips:
+        c.close()
+    final.close()
+    n_frames = int(round(total_duration * fps))
+    _note_export(output_path, "moviepy", n_frames, export_ret_elapsed)
+    logger.info(
+        "[5/6] Vídeo retenção exportado em %.1fs (MoviePy: %d frames = %.1f fps): %s (%.1fs)",
+        export_ret_elapsed, n_frames, n_frames / max(export_ret_elapsed, 1e-6), output_path, total_duration,
+    )
+    return output_path
+
+
+def _as_overlay_raster(overlay: Any) -> OverlayRaster:
+    """Aceita OverlayRaster ou imagem/array RGBA de quadro inteiro; retorna o recorte."""
+    if isinstance(overlay, OverlayRaster):
+        return overlay
+    if isinstance(overlay, Image.Image):
+        overlay = overlay.convert("RGBA")
+    return crop_rgba(np.asarray(overlay))
+
+
+def _header_layer_raster(band: OverlayRaster) -> OverlayRaster:
+    """Header colado sobre quadro transparente usando o próprio alpha como máscara (visual original)."""
+    if band.is_empty:
+        return band
+    img = Image.fromarray(band.rgba, "RGBA")
+    pasted = Image.new("RGBA", img.size, (0, 0, 0, 0))
+    pasted.paste(img, (0, 0), img)
+    return crop_rgba(np.asarray(pasted), offset=(band.x, band.y), size=(WIDTH, HEIGHT))
+
+
+def _raster_clip(raster: OverlayRaster, duration: float):
+    """
+    ImageClip do MoviePy só com o recorte, posicionado em (x, y). A máscara guarda o alpha uint8
+    e converte para 0–1 apenas ao compor cada frame (nada de máscara float de quadro inteiro).
+    None se o recorte for vazio.
+    """
+    if raster.is_empty:
+        return None
+    from moviepy.editor import ImageClip, VideoClip
+    alpha = np.ascontiguousarray(raster.rgba[..., 3])
+    mask = VideoClip(make_frame=lambda t: alpha * (1.0 / 255.0), ismask=True, duration=duration)
+    clip = ImageClip(np.ascontiguousarray(raster.rgba[..., :3]), duration=duration)
+    return clip.set_position((raster.x, raster.y)).set_mask(mask)
+
+
+def _audio_duration(audio_path: str) -> float:
+    """Duração do áudio em segundos (0.0 se não for possível ler)."""
+    try:
+        from moviepy.editor import AudioFileClip
+        ac = AudioFileClip(audio_path)
+        duration = ac.duration
+        ac.close()
+        return float(duration or 0.0)
+    except Exception:
+        return 0.0
+
+
+def _resolve_render_engine(engine: Optional[str]) -> str:
+    """
+    Normaliza o motor de render (None → DEFAULT_RENDER_ENGINE). Valor desconhecido → ValueError.
+    "ffmpeg" só é usado se passar na verificação de paridade com o motor NumPy (senão → "numpy").
+    """
+    name = (engine or DEFAULT_RENDER_ENGINE or "moviepy").strip().lower()
+    if name not in RENDER_ENGINES:
+        raise ValueError(f"Motor de render desconhecido: {name!r}. Use um de: {', '.join(RENDER_ENGINES)}")
+    if name == "ffmpeg":
+        from core.ffmpeg_graph import check_parity
+        ok, diff = check_parity()
+        if not ok:
+            logger.warning("Motor ffmpeg difere do NumPy (diferença média %.2f); usando o motor numpy.", diff)
+            return "numpy"
+    return name
+
+
+_music_beds: Dict[Tuple[str, int], Any] = {}
+
+
+def _music_bed(music_path: str) -> Any:
+    """Música ambiente decodificada e atenuada (−18 dB), memoizada por (arquivo, mtime); uma trilha por vez."""
+    from pydub import AudioSegment
+
+    key = (os.path.abspath(music_path), os.stat(music_path).st_mtime_ns)
+    if key not in _music_beds:
+        _music_beds.clear()
+        _music_beds[key] = AudioSegment.from_file(music_path) - 18
+    return _music_beds[key]
+
+
+def _mix_narration_audio(
+    voice_audio_path: str,
+    narration_end: float,
+    total_duration: float,
+    output_path: str,
+    music_path: Optional[str] = None,
+    music_volume: float = 0.18,
+) -> str:
+    """
+    Mixa o áudio final num arquivo (para motores que muxam áudio pronto no ffmpeg):
+    voz até narration_end + silêncio até total_duration; música ambiente −18 dB × music_volume.
+    Mesma mixagem do CompositeAudioClip do caminho MoviePy.
+    """
+    import math
+    from pydub import AudioSegment
+
+    total_ms = int(round(total_duration * 1000))
+    voice = AudioSegment.from_file(voice_audio_path)[: int(narration_end * 1000)]
+    track = voice + AudioSegment.silent(duration=max(0, total_ms - len(voice)), frame_rate=voice.frame_rate)
+    if music_path and os.path.isfile(music_path):
+        try:
+            music = _music_bed(music_path)[:total_ms] + 20 * math.log10(max(music_volume, 1e-4))
+            track = track.overlay(music)
+        except Exception as e:
+            logger.warning("Música ignorada na mixagem: %s", e)
+    track[:total_ms].export(output_path, format="wav")
+    return output_path
+
+
+# Estatísticas do último export por caminho de saída (frames, tempo, fps, motor) → métricas da execução
+_export_stats: Dict[str, Dict[str, Any]] = {}
+_export_stats_lock = threading.Lock()
+
+
+def _write_moviepy(clip: Any, output_path: str, fps: int, encode: Optional[EncoderProfile], n_frames: int) -> None:
+    """write_videofile do MoviePy com eventos de progresso (core.progress) em vez do silêncio de logger=None."""
+    with track_progress("export", output_path, total=n_frames, unit="frames", engine="moviepy") as progress:
+        clip.write_videofile(
+            output_path,
+            fps=fps,
+            logger=moviepy_logger(progress),
+            **(encode or get_encoder_profile()).moviepy_kwargs(),
+        )
+
+
+def _note_export(output_path: str, engine: str, frames: int, seconds: float) -> None:
+    with _export_stats_lock:
+        _export_stats[output_path] = {
+            "engine": engine,
+            "frames": int(frames),
+            "encode_seconds": round(float(seconds), 3),
+            "encode_fps": round(frames / max(float(seconds), 1e-6), 2),
+        }
+
+
+def _pop_export_stats(output_path: str) -> Dict[str, Any]:
+    with _export_stats_lock:
+        return _export_stats.pop(output_path, {})
+
+
+def _export_plan(
+    engine: str,
+    plan: Any,
+    output_path: str,
+    voice_audio_path: str,
+    narration_end: float,
+    music_path: Optional[str],
+    music_volume: float,
+    encode: Optional[EncoderProfile] = None,
+    segments: Optional[List[Dict[str, Any]]] = None,
+) -> Optional[Dict[str, float]]:
+    """
+    Exporta um RenderPlan com o motor "numpy", "ffmpeg", "sliced" ou "incremental"
+    (áudio mixado antes, muxado pelo ffmpeg).
+    encode: perfil de encode (padrão get_encoder_profile()). segments: frases (manifesto do motor incremental).
+    Retorna estatísticas {"frames", "seconds", "fps"} ou None se o motor falhar (→ fallback MoviePy).
+    """
+    profile = encode or get_encoder_profile()
+    encode_kwargs = profile.engine_kwargs()
+    if profile.threads and engine in ("numpy", "ffmpeg"):
+        encode_kwargs["threads"] = profile.threads
+    mixed_audio = os.path.splitext(output_path)[0] + "_mix.wav"
+    try:
+        with profile_section("audio_mix"):
+            _mix_narration_audio(voice_audio_path, narration_end, plan.duration, mixed_audio, music_path, music_volume)
+        plan.audio_path = mixed_audio
+        logger.info("[5/6] Exportando MP4 (motor %s, %d frames)...", engine, plan.n_frames)
+        with profile_section("compose_encode"), track_progress(
+            "export", output_path, total=plan.n_frames, unit="frames", engine=engine,
+        ) as progress:
+            if engine == "ffmpeg":
+                from core.ffmpeg_graph import render_plan_ffmpeg
+                return render_plan_ffmpeg(plan, output_path, progress=progress, **encode_kwargs)
+            if engine == "sliced":
+                from core.sliced_encoder import render_plan_sliced
+                return render_plan_sliced(plan, output_path, progress=progress, **encode_kwargs)
+            if engine == "incremental":
+                from core.incremental_render import render_plan_incremental
+                return render_plan_incremental(plan, output_path, segments=segments, progress=progress, **encode_kwargs)
+            from core.frame_compositor import render_plan_numpy
+            return render_plan_numpy(plan, output_path, progress=progress, **encode_kwargs)
+    except Exception as e:
+        logger.warning("Motor %s falhou (%s); usando MoviePy como fallback.", engine, e)
+        return None
+    finally:
+        plan.audio_path = None
+        if os.path.exists(mixed_audio):
+            os.remove(mixed_audio)
+
+
+def _periodic_ken_burns(engine: Optional[str]) -> bool:
+    """Zoom em períodos fixos só no motor incremental (trechos reaproveitáveis); nos demais, rampa no vídeo todo."""
+    return (engine or DEFAULT_RENDER_ENGINE or "").strip().lower() == "incremental"
+
+
+def _ken_burns_layers(bg_np: np.ndarray, duration: float, periodic: bool = False) -> List[BackgroundLayer]:
+    """
+    Camadas de fundo cobrindo [0, duration]. Padrão: uma só, zoom 1.0 → KEN_BURNS_ZOOM do início ao fim.
+    periodic=True (motor incremental): períodos fixos de KEN_BURNS_PERIOD s (aproxima, afasta, aproxima...);
+    o último passa do fim do vídeo, então cada período tem a mesma curva seja qual for a duração.
+    """
+    if not periodic:
+        return [BackgroundLayer(bg_np, 0.0, duration, 1.0, KEN_BURNS_ZOOM)]
+    layers: List[BackgroundLayer] = []
+    start, zoom_in = 0.0, True
+    while not layers or start < duration:
+        z_start, z_end = (1.0, KEN_BURNS_ZOOM) if zoom_in else (KEN_BURNS_ZOOM, 1.0)
+        layers.append(BackgroundLayer(bg_np, start, start + KEN_BURNS_PERIOD, z_start, z_end))
+        start += KEN_BURNS_PERIOD
+        zoom_in = not zoom_in
+    return layers
+
+
+def _ken_burns_clip(layers: Sequence[BackgroundLayer], duration: float, fps: int) -> Any:
+    """VideoClip do MoviePy com as mesmas camadas de zoom do RenderPlan (fallback)."""
+    from moviepy.editor import VideoClip
+
+    if len(layers) == 1:
+        layer = layers[0]
+        return KenBurnsZoom(layer.image, (WIDTH, HEIGHT), layer.zoom_start, layer.zoom_end, duration, fps).to_clip()
+
+    zooms = [
+        (layer, KenBurnsZoom(layer.image, (WIDTH, HEIGHT), layer.zoom_start, layer.zoom_end, layer.end - layer.start, fps))
+        for layer in layers
+    ]
+
+    def make_frame(t: float) -> np.ndarray:
+        for layer, zoom in zooms:
+            if t < layer.end:
+                return zoom.frame_at(t - layer.start)
+        layer, zoom = zooms[-1]
+        return zoom.frame_at(t - layer.start)
+
+    return VideoClip(make_frame=make_frame, duration=duration)
+
+
+def compose_synced_video(
+    background_image: Image.Image,
+    phrase_segments: List[Dict[str, Any]],
+    reference_title: str,
+    voice_audio_path: str,
+    output_path: str,
+    music_path: Optional[str] = None,
+    music_volume: float = 0.18,
+    fps: int = FPS,
+    crossfade: float = CROSSFADE_DURATION,
+    engine: Optional[str] = None,
+    encode: Optional[EncoderProfile] = None,
+) -> str:
+    """
+    Compõe vídeo com arquitetura de 3 camadas fixas.
+    Camada 1: um único fundo (graduado uma vez; zoom contínuo 1.0→1.06, em ritmo fixo no incremental).
+    Camada 2: um único header (referência bíblica, nunca re-renderizado).
+    Camada 3: overlays só do verso, com crossfade suave entre segmentos.
+    engine: "numpy" | "ffmpeg" | "sliced" | "incremental" | "moviepy" (ver RENDER_ENGINES); se o motor falhar,
+    cai no MoviePy. "incremental" grava <saída>.manifest.json e só recodifica os trechos alterados.
+    encode: perfil de encode (core.encoder_profiles; padrão get_encoder_profile(), rascunho usa "draft").
+    """
+    engine = _resolve_render_engine(engine)
+    logger.info("[4/6] Compondo vídeo sincronizado (3 camadas): %d frases + referência", len(phrase_segments))
+    t_compose = time.monotonic()
+    voice_duration = _audio_duration(voice_audio_path)
+    durs = [max(0.5, s["end"] - s["start"]) for s in phrase_segments]
+    narration_end = sum(durs)
+    if narration_end < 0.5:
+        narration_end = voice_duration
+        durs = [narration_end] if phrase_segments else []
+    ref_dur = REFERENCE_FRAME_DURATION_SYNC
+    total_duration = narration_end + ref_dur
+
+    # —— Camada 1: um único fundo, zoom contínuo do início ao fim (ritmo fixo no incremental) ——
+    bg_np = _make_graded_bg_np(background_image, golden=True)
+    bg_layers = _ken_burns_layers(bg_np, total_duration, periodic=_periodic_ken_burns(engine))
+
+    # —— Camadas 2 e 3 rasterizadas de uma vez (pool de processos; ordem dos jobs preservada) ——
+    from core.overlay_pool import render_overlays
+    jobs = [("header", (reference_title, WIDTH, HEADER_HEIGHT), {})]
+    jobs += [("verse", (seg["text"],), {}) for seg in phrase_segments]
+    jobs.append(("verse", (reference_title,), {"is_reference": True}))
+    rasters = render_overlays(jobs)
+
+    # —— Camada 2: um único header (referência no topo), nunca re-renderizado ——
+    header_raster = _header_layer_raster(rasters[0])
+
+    # —— Camada 3: overlays só do verso; troca no exato momento da pronúncia ——
+    # (start, dur, fade_in, fade_out, recorte) — renderizados uma vez, usados por qualquer motor
+    verse_layers: List[Tuple[float, float, float, float, OverlayRaster]] = []
+    for i, seg in enumerate(phrase_segments):
+        dur = durs[i]
+        start = sum(durs[:i])  # início exato do segmento (timestamps da voz)
+        fade_in = min(0.4, dur * 0.2) if i == 0 else min(0.35, dur * 0.2)
+        fade_out = min(crossfade, dur * 0.3)
+        verse_layers.append((start, dur, fade_in, fade_out, rasters[1 + i]))
+
+    # Referência: começa no fim da narração, crossfade com último verso
+    start_ref = narration_end - crossfade
+    ref_dur_ext = ref_dur + crossfade
+    verse_layers.append((
+        start_ref,
+        ref_dur_ext,
+        min(crossfade, ref_dur * 0.25),
+        min(0.8, ref_dur * 0.4),
+        rasters[-1],
+    ))
+    logger.info("      → Camada 1: fundo único | Camada 2: header único | Camada 3: %d overlays verso", len(verse_layers))
+
+    os.makedirs(os.path.dirname(output_path) or "outputs", exist_ok=True)
+    n_frames = int(round(total_duration * fps))
+    if engine != "moviepy":
+        from core.render_plan import RenderPlan, overlay_layer_from_raster
+
+        plan = RenderPlan(size=(WIDTH, HEIGHT), fps=fps, duration=total_duration, backgrounds=bg_layers)
+        for start, dur, fade_in, fade_out, raster in [(0.0, total_duration, 0.0, 0.0, header_raster)] + verse_layers:
+            layer = overlay_layer_from_raster(raster, start, start + dur, fade_in, fade_out)
+            if layer is not None:
+                plan.overlays.append(layer)
+        stats = _export_plan(
+            engine, plan, output_path, voice_audio_path, min(narration_end, voice_duration), music_path, music_volume,
+            encode, segments=phrase_segments,
+        )
+        if stats is not None:
+            _note_export(output_path, engine, stats["frames"], stats["seconds"])
+            total_elapsed = time.monotonic() - t_compose
+            logger.info(
+                "[5/6] Vídeo exportado em %.1fs (%s: %d frames em %.1fs = %.1f fps): %s (%.1fs, %d frases)",
+                total_elapsed, engine, stats["frames"], stats["seconds"], stats["fps"], output_path, total_duration, len(phrase_segments),
+            )
+            return output_path
+
+    from moviepy.editor import (
+        AudioFileClip,
+        CompositeVideoClip,
+        CompositeAudioClip,
+        concatenate_audioclips,
+    )
+    from moviepy.video.fx.all import fadein, fadeout
+    from moviepy.audio.AudioClip import AudioClip
+
+    voice_clip = AudioFileClip(voice_audio_path)
+    bg_clip = _ken_burns_clip(bg_layers, total_duration, fps)
+
+    header_clip = _raster_clip(header_raster, total_duration)
+
+    verse_clips = []
+    for start, dur, fade_in, fade_out, raster in verse_layers:
+        clip = _raster_clip(raster, dur)
+        if clip is None:
+            continue
+        clip = clip.set_start(start).fx(fadein, fade_in).fx(fadeout, fade_out)
+        verse_clips.append(clip)
+
+    final = CompositeVideoClip(
+        [bg_clip] + ([header_clip] if header_clip is not None else []) + verse_clips, size=(WIDTH, HEIGHT)
+    )
+    final = final.set_duration(total_duration)
+
+    voice_trimmed = voice_clip.subclip(0, min(narration_end, voice_clip.duration))
+    try:
+        silence = AudioClip(lambda t: np.zeros(1), duration=ref_dur, fps=44100)
+        voice_with_silence = concatenate_audioclips([voice_trimmed, silence])
+    except Exception:
+        voice_with_silence = voice_trimmed
+
+    if music_path and os.path.isfile(music_path):
+        try:
+            from pydub import AudioSegment
+            music = AudioSegment.from_file(music_path)
+            music = music - 18
+            music = music[: int(total_duration * 1000)]
+            music_path_trimmed = voice_audio_path.replace(".mp3", "_music_sync.mp3")
+            music.export(music_path_trimmed, format="mp3")
+            music_clip = AudioFileClip(music_path_trimmed)
+            music_clip = music_clip.volumex(music_volume).set_duration(total_duration)
+            voice_only = voice_with_silence.volumex(1.0)
+            if voice_only.duration > total_duration:
+                voice_only = voice_only.subclip(0, total_duration)
+            final_audio = CompositeAudioClip([music_clip, voice_only])
+            final = final.set_audio(final_audio)
+            music_clip.close()
+            if os.path.exists(music_path_trimmed):
+                os.remove(music_path_trimmed)
+        except Exception as e:
+            logger.warning("Música sync ignorada: %s", e)
+            final = final.set_audio(voice_with_silence)
+    else:
+        final = final.set_audio(voice_with_silence)
+
+    logger.info("[5/6] Exportando MP4 (MoviePy; pode levar 2–5 min; aguarde)...")
+    t_export = time.monotonic()
+    try:
+        with profile_section("compose_encode"):
+            _write_moviepy(final, output_path, fps, encode, n_frames)
+    except Exception as e:
+        logger.error("Erro ao exportar vídeo: %s", e)
+        raise
+    export_elapsed = time.monotonic() - t_export
+    voice_clip.close()
+    bg_clip.close()
+    if header_clip is not None:
+        header_clip.close()
+    for c in verse_clips:
+        c.close()
+    final.close()
+    _note_export(output_path, "moviepy", n_frames, export_elapsed)
+    total_elapsed = time.monotonic() - t_compose
+    logger.info(
+        "[5/6] Vídeo exportado em %.1fs (MoviePy: %d frames em %.1fs = %.1f fps): %s (%.1fs, %d frases)",
+        total_elapsed, n_frames, export_elapsed, n_frames / max(export_elapsed, 1e-6), output_path, total_duration, len(phrase_segments),
+    )
+    return output_path
+
+
+# =============================================================================
+# PIPELINE UNIFICADO
+# =============================================================================
+
+def _find_ambient_music(assets_dir: Optional[str] = None) -> Optional[str]:
+    """Procura música ambiente em assets/ (ambient*.mp3, music/*.mp3, etc.)."""
+    base = Path(__file__).resolve().parents[1]
+    path = (base / (assets_dir or ASSETS_DIR_DEFAULT)) if assets_dir else (base / ASSETS_DIR_DEFAULT)
+    if not path.exists():
+        return None
+    for pattern in ("ambient*.mp3", "music/*.mp3", "*.mp3"):
+        for f in sorted(path.glob(pattern)):
+            if f.is_file():
+                return str(f)
+    return None
+
+
+def _narration_inputs(body_text: str) -> Tuple[List[str], str, Any, str]:
+    """Etapa 0 (preparação textual) + chave do cache de narração: (blocos, texto do TTS, cache, chave)."""
+    from core.psalm_text_preparation import prepare_psalm_for_narration
+    from core.render_cache import get_narration_cache
+
+    # Etapa 0 — Preparação textual: cadência, pausas naturais, equilíbrio visual
+    with profile_section("text"):
+        prepared = prepare_psalm_for_narration(body_text)
+    segments_prep = prepared.get("segments") or []
+    text_for_tts = prepared.get("normalized") or body_text
+
+    cache = get_narration_cache()
+    key = cache.key({
+        "voice": EDGE_TTS_VOICE,
+        "segments": segments_prep,
+        "text": text_for_tts,
+        "phrase_words": [PHRASE_MIN_WORDS, PHRASE_MAX_WORDS],
+    })
+    return segments_prep, text_for_tts, cache, key
+
+
+# Narrações sendo sintetizadas por core.narration_prefetch, por chave do cache de narração.
+# Quem precisa da mesma narração espera o Future em vez de chamar o edge-tts de novo.
+_pending_narrations: Dict[str, Future] = {}
+_pending_narrations_lock = threading.Lock()
+
+
+def _register_pending_narration(key: str) -> Future:
+    """Marca a chave como em síntese; o dono chama set_result(None) ao terminar (com ou sem sucesso)."""
+    future: Future = Future()
+    with _pending_narrations_lock:
+        _pending_narrations[key] = future
+    future.add_done_callback(lambda _: _forget_pending_narration(key, future))
+    return future
+
+
+def _forget_pending_narration(key: str, future: Future) -> None:
+    with _pending_narrations_lock:
+        if _pending_narrations.get(key) is future:
+            del _pending_narrations[key]
+
+
+async def _prepare_narration_async(
+    body_text: str,
+    voice_path: str,
+    tts_limit: Optional[Any] = None,
+    inputs: Optional[Tuple[List[str], str, Any, str]] = None,
+    info: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Dict[str, Any]], str]:
+    """
+    Preparação textual + TTS + sincronização (etapas 0–3), com cache de narração
+    (core.render_cache.NarrationCache): mesmo texto/voz → voz e tempos reaproveitados, sem edge-tts.
+    edge-tts e forced alignment rodam no event loop; cache, duração do áudio e merge em threads.
+    inputs: resultado de _narration_inputs já calculado (etapa "text" do grafo); None → calcula aqui.
+    Narração do mesmo texto em pré-síntese (core.narration_prefetch) → espera por ela e lê do cache.
+    info: dict preenchido com "tts_chars" (caracteres enviados ao edge-tts) e "narration_cached" (métricas).
+    Retorna (phrase_segments, caminho da voz). phrase_segments vazio → fluxo de retenção.
+    """
+    import asyncio
+
+    inputs = inputs or await asyncio.to_thread(_narration_inputs, body_text)
+    pending = _pending_narrations.get(inputs[3])
+    if pending is not None:
+        logger.info("[2/6] Aguardando a narração já em síntese antecipada...")
+        await asyncio.wrap_future(pending)
+    return await _synthesize_narration_async(body_text, voice_path, inputs, tts_limit, info)
+
+
+async def _synthesize_narration_async(
+    body_text: str,
+    voice_path: str,
+    inputs: Tuple[List[str], str, Any, str],
+    tts_limit: Optional[Any] = None,
+    info: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Dict[str, Any]], str]:
+    """Etapas 1–3 de _prepare_narration_async a partir de inputs: cache de narração, TTS, alinhamento."""
+    import asyncio
+
+    segments_prep, text_for_tts, cache, key = inputs
+    info = info if info is not None else {}
+    cached = await asyncio.to_thread(cache.load, key, voice_path)
+    info.update({"tts_chars": 0, "narration_cached": cached is not None})
+    if cached is not None:
+        logger.info("[2/6] Narração reaproveitada do cache (%d frases): sem TTS nem alinhamento", len(cached))
+        return cached, voice_path
+
+    phrase_segments: List[Dict[str, Any]] = []
+    if len(segments_prep) >= 2:
+        # Narração por blocos: cada bloco = 1 áudio, merge, tempos exatos (ritmo + sincronização perfeita)
+        logger.info("[2/6] Gerando voz por blocos (cadência preparada)...")
+        info["tts_chars"] = sum(len((t or "").strip()) for t in segments_prep)
+        with profile_section("tts"):
+            phrase_segments, voice_path = await _generate_voice_from_segments_async(segments_prep, voice_path, tts_limit)
+    else:
+        # Um único bloco ou preparação não quebrou: TTS único + forced alignment ou fallback
+        info["tts_chars"] = len(text_for_tts.strip())
+        with profile_section("tts"):
+            if tts_limit is not None:
+                async with tts_limit:
+                    await generate_voice_async(text_for_tts, voice_path)
+            else:
+                await generate_voice_async(text_for_tts, voice_path)
+        logger.info("[3/6] Obtendo duração do áudio e segmentando texto...")
+        voice_duration = await asyncio.to_thread(_audio_duration, voice_path)
+        if voice_duration < 1.0:
+            voice_duration = 25.0
+        with profile_section("alignment"):
+            words = await get_forced_alignment_async(voice_path, text_for_tts)
+            if words:
+                phrase_segments = segment_into_phrases(words, min_words=PHRASE_MIN_WORDS, max_words=PHRASE_MAX_WORDS)
+                logger.info("[3/6] Sincronização por Forced Alignment: %d frases", len(phrase_segments))
+        if not phrase_segments:
+            phrase_segments = _fallback_segment_by_pauses(text_for_tts, voice_duration)
+            logger.info("[3/6] Fallback por pontuação: %d frases, duração proporcional", len(phrase_segments))
+    await asyncio.to_thread(cache.store, key, voice_path, phrase_segments)
+    return phrase_segments, voice_path
+
+
+def _prepare_narration(
+    body_text: str,
+    voice_path: str,
+    inputs: Optional[Tuple[List[str], str, Any, str]] = None,
+    info: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Dict[str, Any]], str]:
+    """Versão síncrona de _prepare_narration_async (um event loop por vídeo, não um por bloco)."""
+    import asyncio
+    return asyncio.run(_prepare_narration_async(body_text, voice_path, inputs=inputs, info=info))
+
+
+def _rendition_filename(filename: str, aspect: str, primary: bool, draft: bool) -> str:
+    """Nome do arquivo da rendition: a proporção principal mantém o nome; as demais ganham _1x1, _16x9..."""
+    root, ext = os.path.splitext(filename)
+    if not primary:
+        root += "_" + aspect.replace(":", "x")
+    if draft:
+        root += "_draft"
+    return root + (ext or ".mp4")
+
+
+def _video_cache_params(
+    title: str,
+    body_text: str,
+    assets_dir: Optional[str],
+    music: Optional[str],
+    layouts: Sequence[Tuple[str, Tuple[int, int]]],
+    fps: int,
+    encode: EncoderProfile,
+    render_engine: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Todas as entradas que determinam o vídeo final (chave de core.render_cache.VideoCache)."""
+    from core.render_cache import file_content_hash
+    layout_sigs = {aspect: _overlay_layout_signature(layout) for aspect, layout in layouts}
+    return {
+        "pipeline": PIPELINE_VERSION,
+        "title": title,
+        "text": body_text,
+        "voice": EDGE_TTS_VOICE,
+        "phrase_words": [PHRASE_MIN_WORDS, PHRASE_MAX_WORDS],
+        "background": file_content_hash(str(_select_background_path(assets_dir))),
+        "music": file_content_hash(music) if music else "",
+        "font": _brand_font_fingerprint(),
+        "layouts": layout_sigs,
+        "fps": fps,
+        "encode": encode.cache_key(),
+        "ken_burns": "periodic" if _periodic_ken_burns(render_engine) else "ramp",
+    }
+
+
+_claimed_outputs: set = set()
+_claimed_outputs_lock = threading.Lock()
+
+
+def _claim_output_path(path: str) -> str:
+    """
+    Reserva um caminho de saída no processo: nomes com timestamp por segundo colidem quando vários vídeos
+    começam no mesmo segundo (core.async_pipeline). Ocupado → sufixo _2, _3...
+    """
+    root, ext = os.path.splitext(path)
+    with _claimed_outputs_lock:
+        candidate, n = path, 1
+        while candidate in _claimed_outputs:
+            n += 1
+            candidate = f"{root}_{n}{ext}"
+        _claimed_outputs.add(candidate)
+    return candidate
+
+
+@dataclass
+class _PipelineJob:
+    """Entradas resolvidas de uma execução do pipeline (comuns às versões síncrona e assíncrona)."""
+
+    title: str
+    body_text: str
+    assets_dir: Optional[str]
+    aspects: List[str]
+    layouts: List[Tuple[str, Tuple[int, int]]]
+    video_paths: Dict[str, str]
+    voice_path: str
+    music: Optional[str]
+    fps: int
+    encode: EncoderProfile
+    draft: bool
+    render_engine: Optional[str]
+    cache_key: str = ""
+    # Contadores dos caches do processo no início da execução (métricas por execução = atual − início)
+    cache_baseline: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # Pico de RSS desta execução ({"self", "tree"} em MB), medido pelo core.memory_sampler quando ligado
+    run_peak_rss_mb: Optional[Dict[str, Optional[float]]] = None
+
+
+def _process_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Contadores acumulados no processo de cada cache de core.render_cache."""
+    from core.render_cache import get_background_cache, get_narration_cache, get_overlay_cache, get_video_cache
+
+    return {
+        "background": get_background_cache().stats(),
+        "overlay": get_overlay_cache().stats(),
+        "narration": get_narration_cache().stats(),
+        "video": get_video_cache().stats(),
+    }
+
+
+def _cache_delta(job: "_PipelineJob", name: str) -> Dict[str, int]:
+    """Contadores do cache name desde o início da execução (os do processo acumulam entre execuções)."""
+    before = job.cache_baseline.get(name, {})
+    return {k: v - before.get(k, 0) for k, v in _process_cache_stats()[name].items()}
+
+
+def _record_run_memory(job: "_PipelineJob", sampler: Optional[Any]) -> None:
+    """Guarda no job o pico de RSS da sessão de amostragem desta execução (None → sessão externa ou desligada)."""
+    if sampler is None:
+        return
+    data = sampler.as_dict()
+    job.run_peak_rss_mb = {"self": data["rss_peak_mb"], "tree": data["tree_rss_peak_mb"]}
+
+
+def _new_pipeline_job(
+    title: str,
+    body_text: str,
+    output_dir: str,
+    assets_dir: Optional[str],
+    music_path: Optional[str],
+    output_filename: Optional[str],
+    render_engine: Optional[str],
+    draft: bool,
+    aspect_ratios: Optional[Sequence[str]],
+    encoder_profile: Optional[str],
+) -> _PipelineJob:
+    """Resolve proporções, fps, perfil, caminhos de saída e a chave do cache de vídeos (hash do fundo/música)."""
+    from datetime import datetime
+    from core.render_cache import get_video_cache
+
+    cache_baseline = _process_cache_stats()
+    os.makedirs(output_dir, exist_ok=True)
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    aspects = parse_aspect_ratios(aspect_ratios)
+    fps = DRAFT_FPS if draft else FPS
+    encode = get_encoder_profile(DRAFT_ENCODER_PROFILE if draft else encoder_profile)
+
+    logger.info(
+        "Pipeline Salmo do Dia (sincronizado) – Iniciando (%s%s)",
+        ", ".join(aspects),
+        f"; rascunho × {DRAFT_SCALE:g} @ {fps} fps" if draft else "",
+    )
+
+    music = music_path or _find_ambient_music(assets_dir)
+    base_name = output_filename or os.path.basename(
+        _claim_output_path(os.path.join(output_dir, f"salmo_cinematic_{ts}.mp4"))
+    )
+    layouts = [(a, draft_layout(ASPECT_LAYOUTS[a]) if draft else ASPECT_LAYOUTS[a]) for a in aspects]
+    job = _PipelineJob(
+        title=title,
+        body_text=body_text,
+        assets_dir=assets_dir,
+        aspects=aspects,
+        layouts=layouts,
+        video_paths={
+            a: os.path.join(output_dir, _rendition_filename(base_name, a, i == 0, draft)) for i, a in enumerate(aspects)
+        },
+        voice_path=_claim_output_path(os.path.join(output_dir, f"voice_salmo_{ts}.mp3")),
+        music=music,
+        fps=fps,
+        encode=encode,
+        draft=draft,
+        render_engine=render_engine,
+        cache_baseline=cache_baseline,
+    )
+    job.cache_key = get_video_cache().key(_video_cache_params(
+        title, body_text, assets_dir, music, layouts, fps, encode, render_engine
+    ))
+    return job
+
+
+def _emit_run_metrics(
+    job: _PipelineJob,
+    status: str,
+    t_start: float,
+    mode: str,
+    renditions: Optional[Dict[str, str]] = None,
+    exports: Optional[Dict[str, Dict[str, Any]]] = None,
+    narration: Optional[Dict[str, Any]] = None,
+    stages: Optional[Dict[str, Any]] = None,
+    caches: Optional[Dict[str, Dict[str, int]]] = None,
+    error: Optional[str] = None,
+) -> None:
+    """Registro estruturado da execução (core.run_metrics): JSON Lines e, se configurado, Prometheus."""
+    from core.run_metrics import emit_run_record
+
+    layouts = dict(job.layouts)
+    rendition_fields: Dict[str, Dict[str, Any]] = {}
+    for aspect, path in (renditions or {}).items():
+        entry: Dict[str, Any] = {
+            "path": path,
+            "size": list(layouts[aspect]),
+            "bytes": os.path.getsize(path) if os.path.isfile(path) else None,
+        }
+        entry.update((exports or {}).get(aspect, {}))
+        rendition_fields[aspect] = entry
+    stages = stages or {}
+    narration = narration or {}
+    emit_run_record({
+        "status": status,
+        "mode": mode,
+        "error": error,
+        "title": job.title,
+        "pipeline_version": PIPELINE_VERSION,
+        "cache_key": job.cache_key,
+        "engine": (job.render_engine or DEFAULT_RENDER_ENGINE),
+        "encoder_profile": job.encode.name,
+        "draft": job.draft,
+        "fps": job.fps,
+        "aspects": job.aspects,
+        "wall_seconds": round(time.monotonic() - t_start, 3),
+        "stages": stages.get("seconds", {}),
+        "critical_path": stages.get("critical_path", []),
+        "renditions": rendition_fields,
+        "tts_chars": narration.get("tts_chars"),
+        "narration_cached": narration.get("narration_cached"),
+        "cache": caches or {},
+        "run_peak_rss_mb": job.run_peak_rss_mb,
+    })
+
+
+def _cached_pipeline_result(job: _PipelineJob, t_start: float, mode: str = "sync") -> Optional[dict]:
+    """Resultado do pipeline a partir do cache de vídeos finais (None se não houver entrada)."""
+    from core.render_cache import get_video_cache
+
+    video_cache = get_video_cache()
+    cached = video_cache.load(job.cache_key, job.video_paths, job.voice_path)
+    if cached is None:
+        return None
+    primary = job.video_paths[job.aspects[0]]
+    logger.info(
+        "[6/6] Vídeo reaproveitado do cache de render (%s) em %.1fs: %s",
+        job.cache_key[:12], time.monotonic() - t_start, primary,
+    )
+    video_stats = _cache_delta(job, "video")
+    _emit_run_metrics(job, "cached", t_start, mode, renditions=job.video_paths, caches={"video": video_stats})
+    return {
+        "video_path": primary,
+        "audio_path": job.voice_path,
+        "duration_seconds": cached.get("duration_seconds"),
+        "draft": job.draft,
+        "renditions": job.video_paths,
+        "video_cache": video_stats,
+    }
+
+
+def _render_rendition(
+    job: _PipelineJob,
+    aspect: str,
+    layout: Tuple[int, int],
+    phrase_segments: List[Dict[str, Any]],
+    retention_texts: Optional[Tuple[str, str, str, str]],
+    voice_path: str,
+) -> str:
+    """Uma proporção: só geometria (fundo, overlays, composição e encode). Retorna o caminho do MP4."""
+    video_path = job.video_paths[aspect]
+    if len(job.aspects) > 1:
+        logger.info("      Rendition %s (%dx%d): %s", aspect, layout[0], layout[1], video_path)
+    with render_layout(*layout), profile_section("render"):
+        with profile_section("background"):
+            bg = load_background(job.assets_dir)
+        if retention_texts is not None:
+            hook_text, part2_text, part3_text, reference_text = retention_texts
+            from core.overlay_pool import render_overlays
+            retention_jobs = [
+                ("retention", (0, hook_text, reference_text, (WIDTH, HEIGHT)), {"golden_light": False}),
+                ("retention", (1, part2_text, reference_text, (WIDTH, HEIGHT)), {"golden_light": False}),
+                ("retention", (2, part3_text, reference_text, (WIDTH, HEIGHT)), {"golden_light": True}),
+                ("retention", (3, "", reference_text, (WIDTH, HEIGHT)), {"golden_light": False}),
+            ]
+            overlay_images = render_overlays(retention_jobs)
+            compose_retention_video(
+                background_image=bg,
+                overlay_images=overlay_images,
+                voice_audio_path=voice_path,
+                segment_texts=retention_texts,
+                output_path=video_path,
+                music_path=job.music,
+                fps=job.fps,
+                engine=job.render_engine,
+                encode=job.encode,
+            )
+        else:
+            compose_synced_video(
+                background_image=bg,
+                phrase_segments=phrase_segments,
+                reference_title=job.title,
+                voice_audio_path=voice_path,
+                output_path=video_path,
+                music_path=job.music,
+                fps=job.fps,
+                engine=job.render_engine,
+                encode=job.encode,
+            )
+    return video_path
+
+
+def _retention_texts_for(job: _PipelineJob, phrase_segments: List[Dict[str, Any]]) -> Optional[Tuple[str, str, str, str]]:
+    if phrase_segments:
+        if job.music:
+            logger.info("      Música ambiente: %s", job.music)
+        return None
+    logger.info("[3/6] Usando fluxo de retenção (4 frames fixos)")
+    return split_script_for_retention(job.title, job.body_text)
+
+
+def _prefetch_background(job: _PipelineJob, layout: Tuple[int, int]) -> None:
+    """Fundo recortado (memo do processo) e graduado (cache persistente) da proporção, antes do render."""
+    from core.render_cache import get_background_cache
+
+    with render_layout(*layout), profile_section("background"):
+        bg = load_background(job.assets_dir)
+        if get_background_cache().enabled:
+            _make_graded_bg_np(bg, golden=True)
+
+
+def _prefetch_overlays(job: _PipelineJob, layout: Tuple[int, int], segments_prep: List[str]) -> int:
+    """
+    Rasteriza no cache de overlays o que já se sabe antes da voz: header e referência (título) e, na narração
+    por blocos, um verso por bloco (mesmo texto que a voz vai cronometrar). Retorna quantos overlays.
+    """
+    from core.overlay_pool import render_overlays
+    from core.render_cache import get_overlay_cache
+
+    if not get_overlay_cache().enabled:
+        return 0
+    with render_layout(*layout):
+        jobs = [("header", (job.title, WIDTH, HEADER_HEIGHT), {}), ("verse", (job.title,), {"is_reference": True})]
+        if len(segments_prep) >= 2:
+            jobs += [("verse", (text.strip(),), {}) for text in segments_prep if (text or "").strip()]
+        render_overlays(jobs)
+    return len(jobs)
+
+
+def _memory_report_base(video_path: str) -> str:
+    """Relatório de memória (SALMO_MEMORY_REPORT) ao lado do vídeo: <vídeo>.memory.json / .memory.txt."""
+    return os.path.splitext(video_path)[0] + ".memory"
+
+
+def _finish_pipeline(
+    job: _PipelineJob,
+    renditions: Dict[str, str],
+    voice_path: str,
+    t_start: float,
+    bg_cache: Dict[str, int],
+    ov_cache: Dict[str, int],
+    exports: Optional[Dict[str, Dict[str, Any]]] = None,
+    narration: Optional[Dict[str, Any]] = None,
+    stages: Optional[Dict[str, Any]] = None,
+    mode: str = "sync",
+) -> dict:
+    """
+    Registra as estatísticas de cache, grava o vídeo no cache de render, emite as métricas da execução
+    (core.run_metrics) e monta o resultado.
+    """
+    from core.render_cache import get_video_cache
+
+    narration_cache = _cache_delta(job, "narration")
+    video_cache = get_video_cache()
+    logger.info("      Cache de fundos: %d hit(s), %d miss(es)", bg_cache["hits"], bg_cache["misses"])
+    logger.info(
+        "      Cache de overlays: %d hit(s), %d miss(es), %d removido(s)",
+        ov_cache["hits"], ov_cache["misses"], ov_cache["evictions"],
+    )
+    logger.info("      Cache de narração: %d hit(s), %d miss(es)", narration_cache["hits"], narration_cache["misses"])
+    video_cache.store(job.cache_key, renditions, voice_path, {"title": job.title, "duration_seconds": None})
+    video_stats = _cache_delta(job, "video")
+
+    total_elapsed = time.monotonic() - t_start
+    logger.info("[6/6] Pipeline concluído com sucesso em %.1fs total", total_elapsed)
+    _emit_run_metrics(
+        job, "ok", t_start, mode, renditions=renditions, exports=exports, narration=narration, stages=stages,
+        caches={
+            "background": bg_cache,
+            "overlay": ov_cache,
+            "narration": narration_cache,
+            "video": video_stats,
+        },
+    )
+    return {
+        "video_path": renditions[job.aspects[0]],
+        "audio_path": voice_path,
+        "duration_seconds": None,
+        "draft": job.draft,
+        "renditions": renditions,
+        "background_cache": bg_cache,
+        "overlay_cache": ov_cache,
+        "narration_cache": narration_cache,
+        "video_cache": video_stats,
+    }
+
+
+def run_cinematic_salmo_pipeline(
+    title: str,
+    body_text: str,
+    output_dir: str = "outputs",
+    assets_dir: Optional[str] = None,
+    music_path: Optional[str] = None,
+    output_filename: Optional[str] = None,
+    render_engine: Optional[str] = None,
+    draft: bool = False,
+    aspect_ratios: Optional[Sequence[str]] = None,
+    use_cache: bool = True,
+    encoder_profile: Optional[str] = None,
+    extra_stages: Optional[Sequence["Stage"]] = None,
+) -> dict:
+    """
+    Pipeline cinematográfico sincronizado: texto acompanha a voz.
+    - Preparação textual: normalização, cadência (pausas por pontuação), equilíbrio visual.
+    - Se vários blocos: TTS por bloco + merge → sincronização exata. Senão: TTS único + Forced Alignment ou fallback.
+    - Cada frame = duração real da fala; crossfade suave; tipografia premium.
+    - render_engine: "numpy" | "ffmpeg" | "sliced" | "incremental" | "moviepy" (None → SALMO_RENDER_ENGINE / DEFAULT_RENDER_ENGINE).
+    - draft: rascunho rápido (layout × DRAFT_SCALE, DRAFT_FPS, perfil "draft"). Voz e tempos ficam no cache de
+      narração: o render final seguinte do mesmo texto não chama o TTS de novo.
+    - aspect_ratios: proporções a renderizar (ASPECT_LAYOUTS; padrão ["9:16"]). Narração, tempos, texto e
+      música são calculados uma vez; por proporção só muda a geometria (fundo recortado, header, caixa do verso).
+      A primeira é a principal (video_path); todas ficam em "renditions".
+    - use_cache: consulta o cache de vídeos finais (core.render_cache.VideoCache; chave = título, texto, voz,
+      hash do fundo e da música, layout, fps/encode, PIPELINE_VERSION). Hit → MP4 e voz devolvidos sem render.
+      False (--no-cache) → renderiza de novo e substitui a entrada.
+    - encoder_profile: perfil de encode do render final (core.encoder_profiles; None → padrão do processo/canal).
+    - extra_stages: etapas do chamador (core.stage_graph.Stage) no mesmo grafo, ex.: descrições por rede social,
+      que só dependem do texto. Resultados em "stage_results" (também no hit do cache de vídeos).
+    Etapas em grafo (core.stage_graph): text → narration → render:<proporção>, com background:<proporção> e
+    overlays:<proporção> (pré-aquecimento dos caches) rodando enquanto o TTS espera a rede. Duração por etapa
+    e caminho crítico no log e em "stages". Cada execução (ok, do cache ou com erro) gera um registro de
+    métricas (core.run_metrics: JSON Lines e, opcionalmente, Prometheus). Com SALMO_MEMORY_REPORT=1, RSS e
+    maiores alocações por etapa vão para <vídeo>.memory.json/.txt (core.memory_sampler).
+    Não pode ser chamado de dentro de um event loop: use core.async_pipeline.run_cinematic_salmo_pipeline_async.
+    """
+    from core.stage_graph import Stage, run_stages
+
+    t_pipeline_start = time.monotonic()
+    job = _new_pipeline_job(
+        title, body_text, output_dir, assets_dir, music_path, output_filename,
+        render_engine, draft, aspect_ratios, encoder_profile,
+    )
+    extra = list(extra_stages or [])
+
+    # —— Cache do resultado final: mesmas entradas → MP4 e voz já exportados ——
+    cached = _cached_pipeline_result(job, t_pipeline_start) if use_cache else None
+    if cached is not None:
+        if extra:
+            report = run_stages(extra, label="Etapas extras")
+            cached["stage_results"] = {s.name: report.results.get(s.name) for s in extra}
+        return cached
+
+    narration_info: Dict[str, Any] = {}
+    exports: Dict[str, Dict[str, Any]] = {}
+
+    def _narrate(r: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], str, Optional[Tuple[str, str, str, str]]]:
+        with profile_section("narration"):
+            phrase_segments, voice_path = _prepare_narration(body_text, job.voice_path, r["text"], narration_info)
+        return phrase_segments, voice_path, _retention_texts_for(job, phrase_segments)
+
+    def _render(r: Dict[str, Any], aspect: str, layout: Tuple[int, int]) -> str:
+        phrase_segments, voice_path, retention_texts = r["narration"]
+        path = _render_rendition(job, aspect, layout, phrase_segments, retention_texts, voice_path)
+        exports[aspect] = _pop_export_stats(path)
+        return path
+
+    # —— Etapas compartilhadas por todas as proporções (uma vez por job) ——
+    stages = [
+        Stage("text", lambda r: _narration_inputs(body_text)),
+        Stage("narration", _narrate, deps=("text",)),
+    ]
+    # —— Por proporção: só geometria. Layout é global do processo → uma etapa "layout" por vez ——
+    for aspect, layout in job.layouts:
+        stages += [
+            Stage(f"background:{aspect}", lambda r, lo=layout: _prefetch_background(job, lo),
+                  exclusive="layout", optional=True),
+            Stage(f"overlays:{aspect}", lambda r, lo=layout: _prefetch_overlays(job, lo, r["text"][0]),
+                  deps=("text",), exclusive="layout", optional=True),
+        ]
+    for aspect, layout in job.layouts:
+        stages.append(Stage(
+            f"render:{aspect}", lambda r, a=aspect, lo=layout: _render(r, a, lo),
+            deps=("narration", f"background:{aspect}", f"overlays:{aspect}"), exclusive="layout",
+        ))
+    try:
+        with sampling_memory(_memory_report_base(job.video_paths[job.aspects[0]])) as sampler:
+            # Com --profile / --memory-report, uma etapa por vez: perfis e picos de memória atribuídos a uma etapa só
+            try:
+                report = run_stages(stages + extra, max_workers=1 if instrumented() else None, label="Etapas do pipeline")
+            finally:
+                _record_run_memory(job, sampler)
+    except Exception as e:
+        _emit_run_metrics(job, "error", t_pipeline_start, "sync", narration=narration_info, error=str(e))
+        raise
+
+    phrase_segments, voice_path, _ = report.results["narration"]
+    renditions = {aspect: report.results[f"render:{aspect}"] for aspect, _ in job.layouts}
+    result = _finish_pipeline(
+        job, renditions, voice_path, t_pipeline_start,
+        _cache_delta(job, "background"), _cache_delta(job, "overlay"),
+        exports=exports, narration=narration_info, stages=report.as_dict(),
+    )
+    result["stages"] = report.as_dict()
+    if extra:
+        result["stage_results"] = {s.name: report.results.get(s.name) for s in extra}
+    return result
@@ -0,0 +1,343 @@
+"""
+Entregáveis por plataforma a partir do master renderizado.
+
+O pipeline grava um único MP4 de 12 Mbps; cada destino tem outro ponto ideal de bitrate/tamanho.
+- Perfis de entrega por qualidade: CRF com teto VBV (capped CRF) → texto sobre fundo quase estático
+  gasta só os bits de que precisa, sem passar de maxrate nas transições
+- Um único processo ffmpeg: o master é decodificado uma vez, split no filter graph,
+  uma saída codificada por perfil distinto (destinos com o mesmo perfil compartilham o arquivo)
+- Perfil "master" = o próprio arquivo, sem re-encode (YouTube reprocessa tudo no servidor)
+- Limite de tamanho por destino (TwitterPublisher.MAX_VIDEO_SIZE; PUBLISH_MAX_MB_<DESTINO> define um alvo):
+  arquivo acima do limite → encode em duas passagens no bitrate que cabe, antes do upload
+- Falhas isoladas por destino: perfil que não codifica → o destino publica o master; destino com limite
+  que não fica abaixo dele (2 passagens falhou ou ainda acima) → erro do destino, sem upload
+- Relatório por destino: MB, kbps médio e, com PUBLISH_QUALITY_REPORT=1, SSIM contra o master
+- Entregáveis mais novos que o master são reaproveitados (republicação não re-codifica)
+"""
+
+import os
+import re
+import logging
+import subprocess
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from core.encoder_profiles import rate_control_args
+from core.frame_compositor import ffmpeg_binary
+
+logger = logging.getLogger(__name__)
+
+# Perfis de entrega: H.264 capped CRF (crf + maxrate/bufsize) + AAC
+DELIVERY_PROFILES: Dict[str, Dict[str, str]] = {
+    "high": {"crf": "20", "maxrate": "10000k", "bufsize": "20000k", "audio_bitrate": "192k"},
+    "standard": {"crf": "23", "maxrate": "6500k", "bufsize": "13000k", "audio_bitrate": "128k"},
+    "compact": {"crf": "26", "maxrate": "4000k", "bufsize": "8000k", "audio_bitrate": "128k"},
+}
+MASTER_PROFILE = "master"
+
+# Perfil de cada destino (IDs de core.publishers.dispatcher; ausente → master)
+DESTINATION_PROFILES: Dict[str, str] = {
+    "youtube": MASTER_PROFILE,
+    "tiktok": "high",
+    "facebook": "high",
+    "instagram": "standard",
+    "twitter": "standard",
+    "linkedin": "standard",
+    "kwai": "compact",
+    "pinterest": "compact",
+}
+
+# Margem sob o limite no encode por tamanho (mux, variação do rate control)
+SIZE_FIT_MARGIN = 0.94
+FIT_AUDIO_BITRATE = "128k"
+
+__all__ = [
+    "DELIVERY_PROFILES",
+    "DESTINATION_PROFILES",
+    "MASTER_PROFILE",
+    "deliverable_path",
+    "deliverable_report",
+    "destination_size_limits",
+    "encode_deliverables",
+    "fit_to_size",
+    "size_limit_errors",
+]
+
+
+def deliverable_path(master_path: str, profile: str) -> str:
+    """Arquivo do entregável: <master>_<perfil>.mp4 ao lado do master."""
+    if profile == MASTER_PROFILE:
+        return master_path
+    stem, _ = os.path.splitext(master_path)
+    return f"{stem}_{profile}.mp4"
+
+
+def _is_fresh(path: str, master_path: str) -> bool:
+    return os.path.isfile(path) and os.path.getsize(path) > 0 and os.path.getmtime(path) >= os.path.getmtime(master_path)
+
+
+def _rate_args(params: Dict[str, str]) -> List[str]:
+    """Capped CRF (crf + maxrate/bufsize) ou ABR (bitrate) conforme o perfil."""
+    return rate_control_args(params.get("bitrate"), params.get("crf"), params.get("maxrate"), params.get("bufsize"))
+
+
+def _kbps(value: str) -> float:
+    value = value.strip().lower()
+    if value.endswith("k"):
+        return float(value[:-1])
+    if value.endswith("m"):
+        return float(value[:-1]) * 1000
+    return float(value) / 1000
+
+
+def destination_size_limits(destinations: Sequence[str]) -> Dict[str, int]:
+    """
+    Limite de tamanho (bytes) por destino: limites das plataformas (ex.: TwitterPublisher.MAX_VIDEO_SIZE)
+    e alvos de PUBLISH_MAX_MB_<DESTINO> (ex.: PUBLISH_MAX_MB_YOUTUBE=80 em dias de upload lento).
+    Vale o menor dos dois; destino sem limite fica de fora.
+    """
+    limits: Dict[str, int] = {}
+    if "twitter" in destinations:
+        from core.twitter_publisher import TwitterPublisher
+        limits["twitter"] = TwitterPublisher.MAX_VIDEO_SIZE
+    for dest in destinations:
+        raw = os.getenv(f"PUBLISH_MAX_MB_{dest.upper()}", "").strip()
+        if not raw:
+            continue
+        try:
+            target = int(float(raw) * 1024 * 1024)
+        except ValueError:
+            logger.warning("PUBLISH_MAX_MB_%s inválido: %r", dest.upper(), raw)
+            continue
+        limits[dest] = min(limits.get(dest, target), target)
+    return limits
+
+
+def size_limit_errors(path: str, destinations: Sequence[str]) -> Dict[str, str]:
+    """Destinos cujo limite de tamanho (destination_size_limits) path ultrapassa → {destino: motivo}."""
+    size = os.path.getsize(path)
+    return {
+        dest: f"{size / 1024 / 1024:.1f} MB acima do limite de {limit / 1024 / 1024:.1f} MB"
+        for dest, limit in destination_size_limits(destinations).items()
+        if size > limit
+    }
+
+
+def _probe_duration(path: str) -> float:
+    """Duração (s) lida do cabeçalho pelo próprio ffmpeg (sem depender do ffprobe)."""
+    proc = subprocess.run([ffmpeg_binary(), "-hide_banner", "-i", path], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    m = re.search(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)", proc.stderr.decode("utf-8", "replace"))
+    if not m:
+        raise RuntimeError(f"Duração não encontrada: {path}")
+    h, mnt, sec = m.groups()
+    return int(h) * 3600 + int(mnt) * 60 + float(sec)
+
+
+def fit_to_size(
+    master_path: str,
+    output_path: str,
+    max_bytes: int,
+    codec: str = "libx264",
+    preset: str = "medium",
+    audio_bitrate: str = FIT_AUDIO_BITRATE,
+) -> str:
+    """
+    Encode em duas passagens com bitrate médio calculado para caber em max_bytes (× SIZE_FIT_MARGIN).
+    Raises:
+        RuntimeError: ffmpeg encerrou com erro ou o limite é pequeno demais para a duração.
+    """
+    duration = max(0.1, _probe_duration(master_path))
+    total_kbps = max_bytes * SIZE_FIT_MARGIN * 8 / 1000 / duration
+    video_kbps = int(total_kbps - _kbps(audio_bitrate))
+    if video_kbps < 100:
+        raise RuntimeError(f"Limite de {max_bytes / 1024 / 1024:.1f} MB pequeno demais para {duration:.0f}s de vídeo")
+    rate = ["-b:v", f"{video_kbps}k", "-maxrate", f"{int(video_kbps * 1.5)}k", "-bufsize", f"{video_kbps * 2}k"]
+    tmp = output_path + ".part.mp4"
+    with tempfile.TemporaryDirectory(prefix="salmo_2pass_") as work_dir:
+        passlog = os.path.join(work_dir, "x264")
+        base = [ffmpeg_binary(), "-y", "-loglevel", "error", "-i", master_path, "-c:v", codec, "-preset", preset]
+        base += rate + ["-pix_fmt", "yuv420p", "-passlogfile", passlog]
+        passes = [
+            base + ["-pass", "1", "-an", "-f", "mp4", os.devnull],
+            base + ["-pass", "2", "-map", "0:v:0", "-map", "0:a?", "-c:a", "aac", "-b:a", audio_bitrate,
+                    "-movflags", "+faststart", tmp],
+        ]
+        for cmd in passes:
+            proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, cwd=work_dir)
+            if proc.returncode != 0:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                err = proc.stderr.decode("utf-8", "replace").strip()
+                raise RuntimeError(f"ffmpeg (2 passagens) falhou (código {proc.returncode}): {err[-400:]}")
+    os.replace(tmp, output_path)
+    return output_path
+
+
+def _encode_profiles(master_path: str, profiles: Sequence[str], codec: str, preset: str) -> None:
+    """
+    Codifica os perfis numa única passada do ffmpeg (master decodificado uma vez, split no filter graph).
+    Raises:
+        FileNotFoundError: ffmpeg ausente.
+        RuntimeError: ffmpeg encerrou com erro (nenhum arquivo parcial fica no disco).
+    """
+    n = len(profiles)
+    labels = "".join(f"[v{i}]" for i in range(n))
+    cmd = [ffmpeg_binary(), "-y", "-loglevel", "error", "-i", master_path,
+           "-filter_complex", f"[0:v]split={n}{labels}"]
+    tmp_paths = []
+    for i, profile in enumerate(profiles):
+        params = DELIVERY_PROFILES[profile]
+        tmp = deliverable_path(master_path, profile) + ".part.mp4"
+        tmp_paths.append(tmp)
+        cmd += ["-map", f"[v{i}]", "-map", "0:a?", "-c:v", codec, "-preset", preset]
+        cmd += _rate_args(params)
+        cmd += [
+            "-pix_fmt", "yuv420p", "-c:a", "aac", "-b:a", params["audio_bitrate"], "-movflags", "+faststart",
+            tmp,
+        ]
+    t0 = time.monotonic()
+    proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if proc.returncode != 0:
+        for tmp in tmp_paths:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        err = proc.stderr.decode("utf-8", "replace").strip()
+        raise RuntimeError(f"ffmpeg (entregáveis) falhou (código {proc.returncode}): {err[-400:]}")
+    for profile, tmp in zip(profiles, tmp_paths):
+        os.replace(tmp, deliverable_path(master_path, profile))
+    logger.info("Entregáveis gerados em uma passada (%s) em %.1fs", ", ".join(profiles), time.monotonic() - t0)
+
+
+def _fit_destination(master_path: str, dest: str, path: str, limit: int, codec: str, preset: str) -> str:
+    """
+    Arquivo do destino dentro do limite: path se já couber, senão encode em 2 passagens (reaproveitado se
+    fresco). Raises RuntimeError/OSError se não houver como ficar abaixo do limite.
+    """
+    size = os.path.getsize(path)
+    if size <= limit:
+        return path
+    stem, _ = os.path.splitext(master_path)
+    fit_path = f"{stem}_{dest}_{limit // 1024}kb.mp4"
+    if _is_fresh(fit_path, master_path) and os.path.getsize(fit_path) <= limit:
+        return fit_path
+    logger.info(
+        "  %s: %.1f MB acima do limite de %.1f MB → encode em 2 passagens",
+        dest, size / 1024 / 1024, limit / 1024 / 1024,
+    )
+    fit_to_size(master_path, fit_path, limit, codec=codec, preset=preset)
+    fit_size = os.path.getsize(fit_path)
+    if fit_size > limit:
+        raise RuntimeError(
+            f"ainda acima do limite após 2 passagens ({fit_size / 1024 / 1024:.1f} MB > {limit / 1024 / 1024:.1f} MB)"
+        )
+    return fit_path
+
+
+def encode_deliverables(
+    master_path: str,
+    destinations: Sequence[str],
+    codec: str = "libx264",
+    preset: str = "medium",
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Gera, numa só passada do ffmpeg, os entregáveis que os destinos pedem; o que passar do limite
+    do destino (destination_size_limits) é refeito em duas passagens para caber.
+    Falhas ficam no destino: se a passada única falhar, cada perfil é tentado sozinho e o destino de um perfil
+    que falhou recebe o master; destino que não cabe no limite de jeito nenhum vai para os erros.
+    Retorna ({destino: caminho do arquivo a publicar}, {destino: motivo para não publicar}).
+    Raises:
+        FileNotFoundError: master ausente.
+    """
+    if not os.path.isfile(master_path):
+        raise FileNotFoundError(f"Master não encontrado: {master_path}")
+
+    by_dest = {d: DESTINATION_PROFILES.get(d, MASTER_PROFILE) for d in destinations}
+    profiles: List[str] = []
+    for profile in by_dest.values():
+        if profile != MASTER_PROFILE and profile not in profiles:
+            profiles.append(profile)
+    pending = [p for p in profiles if not _is_fresh(deliverable_path(master_path, p), master_path)]
+
+    failed: Dict[str, str] = {}
+    if pending:
+        try:
+            _encode_profiles(master_path, pending, codec, preset)
+        except Exception as e:
+            if len(pending) == 1:
+                failed[pending[0]] = str(e)
+            else:
+                logger.warning("Passada única dos entregáveis falhou (%s); codificando perfil a perfil.", e)
+                for profile in pending:
+                    try:
+                        _encode_profiles(master_path, [profile], codec, preset)
+                    except Exception as e_profile:
+                        failed[profile] = str(e_profile)
+
+    paths: Dict[str, str] = {}
+    for dest, profile in by_dest.items():
+        if profile in failed:
+            logger.warning("  %s: entregável %s indisponível (%s); usando o master.", dest, profile, failed[profile])
+            paths[dest] = master_path
+        else:
+            paths[dest] = deliverable_path(master_path, profile)
+
+    # Limites de tamanho: refazer em duas passagens o que não cabe (antes do upload, não depois)
+    errors: Dict[str, str] = {}
+    for dest, limit in destination_size_limits(list(by_dest)).items():
+        try:
+            paths[dest] = _fit_destination(master_path, dest, paths[dest], limit, codec, preset)
+        except Exception as e:
+            logger.error("  %s: sem arquivo dentro do limite (%s); destino não será publicado.", dest, e)
+            errors[dest] = str(e)
+            del paths[dest]
+    return paths, errors
+
+
+def _ssim(reference: str, distorted: str) -> Optional[float]:
+    """SSIM médio (All) do distorted contra o reference (mesmo tamanho de quadro)."""
+    cmd = [ffmpeg_binary(), "-hide_banner", "-i", distorted, "-i", reference,
+           "-lavfi", "[0:v][1:v]ssim", "-f", "null", "-"]
+    proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    m = re.search(r"All:\s*([0-9.]+)", proc.stderr.decode("utf-8", "replace"))
+    return float(m.group(1)) if m else None
+
+
+def deliverable_report(master_path: str, paths: Dict[str, str], quality: Optional[bool] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Tamanho (MB) e bitrate médio (kbps) de cada entregável; quality=True (ou PUBLISH_QUALITY_REPORT=1)
+    mede também o SSIM contra o master (uma decodificação extra por arquivo distinto).
+    """
+    if quality is None:
+        quality = os.getenv("PUBLISH_QUALITY_REPORT", "0").strip().lower() in ("1", "true", "yes", "on")
+    try:
+        duration: Optional[float] = max(0.1, _probe_duration(master_path))
+    except Exception as e:
+        logger.warning("Duração do master indisponível para o relatório (%s); kbps omitido.", e)
+        duration = None
+    per_file: Dict[str, Dict[str, Any]] = {}
+    report: Dict[str, Dict[str, Any]] = {}
+    for dest, path in paths.items():
+        if path not in per_file:
+            try:
+                size = os.path.getsize(path)
+                entry: Dict[str, Any] = {
+                    "file": os.path.basename(path),
+                    "mb": round(size / 1024 / 1024, 2),
+                    "kbps": round(size * 8 / 1000 / duration) if duration else None,
+                }
+                if quality and path != master_path:
+                    entry["ssim"] = _ssim(master_path, path)
+            except Exception as e:
+                logger.warning("  %s: relatório do entregável indisponível: %s", dest, e)
+                entry = {"file": os.path.basename(path), "error": str(e)}
+            per_file[path] = entry
+        report[dest] = per_file[path]
+        e = per_file[path]
+        if "mb" in e:
+            logger.info(
+                "  %s → %s: %.1f MB%s%s", dest, e["file"], e["mb"],
+                f", {e['kbps']} kbps" if e.get("kbps") is not None else "",
+                f", SSIM {e['ssim']:.4f}" if e.get("ssim") is not None else "",
+            )
+    return report
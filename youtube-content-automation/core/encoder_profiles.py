@@ -0,0 +1,155 @@
+"""
+Registro de perfis de encode compartilhado pelos geradores de vídeo.
+
+Um perfil = codec, preset, controle de taxa (bitrate médio ou CRF com teto VBV), threads e áudio.
+- cinematic_salmo_pipeline (todos os motores, inclusive o fallback MoviePy)
+- synced_video_generator.create_synced_video e video_generator._create_video (MoviePy)
+Escolha do perfil: argumento explícito → perfil padrão do processo (set_default_encoder_profile, definido
+por canal a partir de encoder_profile em config/channels.yaml) → SALMO_ENCODER_PROFILE → "balanced".
+Para comparar perfis na máquina atual: python3 scripts/benchmark_encoder_profiles.py
+"""
+
+import os
+import logging
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "EncoderProfile",
+    "ENCODER_PROFILES",
+    "channel_encoder_profile",
+    "get_encoder_profile",
+    "rate_control_args",
+    "set_default_encoder_profile",
+]
+
+
+def rate_control_args(
+    bitrate: Optional[str] = None,
+    crf: Optional[int] = None,
+    maxrate: Optional[str] = None,
+    bufsize: Optional[str] = None,
+) -> List[str]:
+    """Argumentos de taxa do ffmpeg: -crf (com teto -maxrate/-bufsize = capped CRF) ou -b:v."""
+    args: List[str] = ["-crf", str(crf)] if crf is not None else ["-b:v", bitrate or "12000k"]
+    if maxrate:
+        args += ["-maxrate", maxrate, "-bufsize", bufsize or maxrate]
+    return args
+
+
+@dataclass(frozen=True)
+class EncoderProfile:
+    """Parâmetros de encode H.264/AAC. crf definido → capped CRF (bitrate ignorado)."""
+
+    name: str
+    preset: str = "medium"
+    bitrate: Optional[str] = "12000k"
+    crf: Optional[int] = None
+    maxrate: Optional[str] = None
+    bufsize: Optional[str] = None
+    threads: Optional[int] = None  # None → o motor decide (ffmpeg: automático)
+    codec: str = "libx264"
+    audio_bitrate: str = "192k"
+
+    def video_args(self) -> List[str]:
+        """-c:v, -preset e controle de taxa para um comando ffmpeg."""
+        return ["-c:v", self.codec, "-preset", self.preset] + rate_control_args(
+            self.bitrate, self.crf, self.maxrate, self.bufsize
+        )
+
+    def engine_kwargs(self) -> Dict[str, Any]:
+        """Argumentos dos motores render_plan_* (numpy, ffmpeg, sliced, incremental)."""
+        return {
+            "codec": self.codec,
+            "preset": self.preset,
+            "bitrate": self.bitrate or "12000k",
+            "crf": self.crf,
+            "maxrate": self.maxrate,
+            "bufsize": self.bufsize,
+            "audio_bitrate": self.audio_bitrate,
+        }
+
+    def moviepy_kwargs(self) -> Dict[str, Any]:
+        """Argumentos de write_videofile do MoviePy (CRF/teto via ffmpeg_params)."""
+        extra: List[str] = []
+        if self.crf is not None:
+            extra = rate_control_args(None, self.crf, self.maxrate, self.bufsize)
+        elif self.maxrate:
+            extra = ["-maxrate", self.maxrate, "-bufsize", self.bufsize or self.maxrate]
+        return {
+            "codec": self.codec,
+            "audio_codec": "aac",
+            "bitrate": None if self.crf is not None else self.bitrate,
+            "audio_bitrate": self.audio_bitrate,
+            "preset": self.preset,
+            "threads": self.threads,
+            "ffmpeg_params": extra or None,
+        }
+
+    def cache_key(self) -> Dict[str, Any]:
+        """Campos que mudam o arquivo gerado (chave dos caches de vídeo)."""
+        return {
+            "codec": self.codec, "preset": self.preset, "bitrate": None if self.crf is not None else self.bitrate,
+            "crf": self.crf, "maxrate": self.maxrate, "bufsize": self.bufsize, "audio_bitrate": self.audio_bitrate,
+        }
+
+
+ENCODER_PROFILES: Dict[str, EncoderProfile] = {
+    # Conferência rápida (--draft): qualidade só para checar texto e tempo
+    "draft": EncoderProfile("draft", preset="ultrafast", bitrate="1500k"),
+    # Padrão de publicação (o antigo 12 Mbps / medium)
+    "balanced": EncoderProfile("balanced", preset="medium", bitrate="12000k"),
+    # Cópia de arquivo: CRF baixo, preset lento
+    "archive": EncoderProfile("archive", preset="slow", bitrate=None, crf=16, audio_bitrate="256k"),
+    # Upload limitado: qualidade constante com teto de bitrate
+    "size-capped": EncoderProfile("size-capped", preset="medium", bitrate=None, crf=23, maxrate="6000k", bufsize="12000k", audio_bitrate="128k"),
+}
+
+_default_profile: Optional[str] = None
+
+
+def set_default_encoder_profile(name: Optional[str]) -> None:
+    """Perfil usado quando nenhum é passado explicitamente (None → volta ao SALMO_ENCODER_PROFILE)."""
+    global _default_profile
+    if name is not None:
+        get_encoder_profile(name)  # valida
+    _default_profile = name
+
+
+def get_encoder_profile(name: Optional[str] = None) -> EncoderProfile:
+    """
+    Perfil pelo nome (None → padrão do processo → SALMO_ENCODER_PROFILE → "balanced").
+    SALMO_ENCODER_THREADS, se definido, fixa threads em qualquer perfil.
+    Raises:
+        ValueError: Perfil desconhecido.
+    """
+    key = (name or _default_profile or os.getenv("SALMO_ENCODER_PROFILE", "") or "balanced").strip().lower()
+    if key not in ENCODER_PROFILES:
+        raise ValueError(f"Perfil de encode desconhecido: {key!r}. Use um de: {', '.join(ENCODER_PROFILES)}")
+    profile = ENCODER_PROFILES[key]
+    threads = os.getenv("SALMO_ENCODER_THREADS", "").strip()
+    if threads.isdigit():
+        profile = replace(profile, threads=int(threads))
+    return profile
+
+
+def channel_encoder_profile(channel_id: str, config: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """encoder_profile do canal em config/channels.yaml (None se não definido)."""
+    if config is None:
+        try:
+            import yaml
+            path = Path(__file__).resolve().parents[1] / "config" / "channels.yaml"
+            with open(path, "r", encoding="utf-8") as f:
+                config = yaml.safe_load(f) or {}
+        except Exception as e:
+            logger.debug("channels.yaml indisponível para perfil de encode: %s", e)
+            return None
+    chan = (config.get("channels") or {}).get(channel_id) or {}
+    name = chan.get("encoder_profile")
+    if name and str(name).strip().lower() not in ENCODER_PROFILES:
+        logger.warning("Canal %s: encoder_profile %r desconhecido; usando o padrão", channel_id, name)
+        return None
+    return str(name).strip().lower() if name else None
@@ -0,0 +1,268 @@
+"""
+Motor de render por filter graph do ffmpeg.
+
+Converte o RenderPlan num único filter_complex — nenhum trabalho por frame em Python:
+- Fundo: imagem ampliada uma vez (ZOOM_SUPERSAMPLE×) → zoompan centralizado, zoom linear por frame
+  (mesma curva e enquadramento do KenBurnsZoom do motor NumPy; crop inteiro no fundo ampliado ≈ sub-pixel)
+- Vários fundos (retenção): segmentos concatenados com concat
+- Overlays: PNG RGBA em loop → fade alpha in/out → setpts(início) → overlay=enable='between(t,..)'
+O ffmpeg faz toda a composição em C, multi-thread, e muxa o áudio já mixado.
+check_parity() compara o motor com render_plan_numpy num plano curto; o pipeline só usa este motor se passar.
+"""
+
+import os
+import math
+import logging
+import shutil
+import subprocess
+import tempfile
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from core.render_plan import BackgroundLayer, OverlayLayer, RenderPlan
+from core.frame_compositor import ffmpeg_binary
+from core.encoder_profiles import rate_control_args
+from core.progress import ProgressTracker
+
+logger = logging.getLogger(__name__)
+
+# Ampliação do fundo antes do zoompan (crop em pixels inteiros → erro de enquadramento ≤ 1/N px na saída)
+ZOOM_SUPERSAMPLE = 4
+# Diferença média absoluta (0–255, RGB) máxima por frame amostrado para o motor passar em check_parity
+PARITY_MAX_MEAN_DIFF = 3.0
+
+__all__ = [
+    "PARITY_MAX_MEAN_DIFF",
+    "ZOOM_SUPERSAMPLE",
+    "build_filter_graph",
+    "check_parity",
+    "render_plan_ffmpeg",
+]
+
+
+def _num(value: float) -> str:
+    """Número curto e estável para expressões do ffmpeg."""
+    return f"{value:.4f}".rstrip("0").rstrip(".") or "0"
+
+
+def _center_crop(image: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
+    """Centro do fundo no tamanho de saída (o KenBurnsZoom enquadra o centro da fonte em escala 1:1)."""
+    w, h = size
+    src_h, src_w = image.shape[:2]
+    if src_w <= w and src_h <= h:
+        return image
+    x0, y0 = max(0, (src_w - w) // 2), max(0, (src_h - h) // 2)
+    return image[y0:y0 + min(h, src_h), x0:x0 + min(w, src_w)]
+
+
+def build_filter_graph(plan: RenderPlan, work_dir: str) -> Tuple[List[str], str, str]:
+    """
+    Grava as camadas do plano como PNG em work_dir e monta o grafo.
+    Retorna (argumentos de entrada do ffmpeg, filter_complex, rótulo da saída de vídeo).
+    Entradas: fundos (na ordem do plano), depois overlays (z-order).
+    Cada fundo é um único frame: ampliado uma vez e expandido em frames pelo zoompan (d = frames do segmento).
+    """
+    w, h = plan.size
+    fps = plan.fps
+    inputs: List[str] = []
+    chains: List[str] = []
+    n_in = 0
+
+    # —— Fundos: uma entrada por segmento; PNG gravado uma vez por imagem distinta ——
+    written: Dict[int, str] = {}
+    bg_labels: List[str] = []
+    # Fronteiras em frames: fundo i cobre os frames com start_i <= n/fps (o último vai até o fim do plano)
+    bounds = [int(math.ceil(bg.start * fps - 1e-6)) for bg in plan.backgrounds[1:]]
+    bounds = [0] + bounds + [plan.n_frames]
+    for i, bg in enumerate(plan.backgrounds):
+        key = id(bg.image)
+        if key not in written:
+            path = os.path.join(work_dir, f"bg_{len(written):02d}.png")
+            Image.fromarray(np.ascontiguousarray(_center_crop(bg.image, plan.size))).save(path, compress_level=1)
+            written[key] = path
+        n_frames = max(1, bounds[i + 1] - bounds[i])
+        seg_dur = max(0.01, bg.end - bg.start)
+        inputs += ["-i", written[key]]
+        # zoom(on) = BackgroundLayer.zoom_at((primeiro frame + on) / fps); x/y mantêm o recorte centralizado
+        offset = bounds[i] - bg.start * fps
+        zoom = (
+            f"{_num(bg.zoom_start)}+{_num(bg.zoom_end - bg.zoom_start)}"
+            f"*min(1,max(0,(on+{_num(offset)})/{_num(seg_dur * fps)}))"
+        )
+        label = f"bg{i}"
+        chains.append(
+            f"[{n_in}:v]scale=w=iw*{ZOOM_SUPERSAMPLE}:h=ih*{ZOOM_SUPERSAMPLE}:flags=lanczos,"
+            f"zoompan=z='{zoom}':x='iw/2-iw/zoom/2':y='ih/2-ih/zoom/2':d={n_frames}:s={w}x{h}:fps={fps},"
+            f"setsar=1,format=rgb24[{label}]"
+        )
+        bg_labels.append(label)
+        n_in += 1
+    if len(bg_labels) > 1:
+        chains.append("".join(f"[{lb}]" for lb in bg_labels) + f"concat=n={len(bg_labels)}:v=1:a=0[base0]")
+    else:
+        chains.append(f"[{bg_labels[0]}]null[base0]")
+
+    # —— Overlays: PNG recortado + posição; fade no alpha; habilitado só no intervalo ——
+    base = "base0"
+    for j, layer in enumerate(plan.overlays):
+        path = os.path.join(work_dir, f"ov_{j:03d}.png")
+        rgba = np.dstack([layer.rgb, layer.alpha])
+        Image.fromarray(rgba, "RGBA").save(path, compress_level=1)
+        dur = max(1.0 / fps, layer.duration)
+        inputs += ["-loop", "1", "-framerate", str(fps), "-t", _num(dur), "-i", path]
+        fx = ["format=rgba"]
+        if layer.fade_in > 0:
+            fx.append(f"fade=t=in:st=0:d={_num(layer.fade_in)}:alpha=1")
+        if layer.fade_out > 0:
+            fx.append(f"fade=t=out:st={_num(max(0.0, dur - layer.fade_out))}:d={_num(layer.fade_out)}:alpha=1")
+        fx.append(f"setpts=PTS-STARTPTS+{_num(layer.start)}/TB")
+        chains.append(f"[{n_in}:v]{','.join(fx)}[ov{j}]")
+        out = f"base{j + 1}"
+        chains.append(
+            f"[{base}][ov{j}]overlay=x={layer.x}:y={layer.y}:eof_action=pass:"
+            f"enable='between(t,{_num(layer.start)},{_num(layer.end)})'[{out}]"
+        )
+        base = out
+        n_in += 1
+
+    chains.append(f"[{base}]format=yuv420p[vout]")
+    return inputs, ";".join(chains), "vout"
+
+
+def _run_with_progress(cmd: List[str], progress: ProgressTracker) -> Tuple[int, str]:
+    """Roda o ffmpeg com -progress no stdout (linhas chave=valor) e repassa frame=N ao tracker."""
+    cmd = cmd[:1] + ["-progress", "pipe:1", "-nostats"] + cmd[1:]
+    # stderr em arquivo: com -loglevel error é pequeno, mas um pipe não lido pode travar o ffmpeg
+    with tempfile.TemporaryFile() as err_file:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err_file)
+        for raw in proc.stdout:
+            key, _, value = raw.decode("ascii", "replace").strip().partition("=")
+            if key == "frame" and value.isdigit():
+                progress.update(int(value))
+        proc.wait()
+        err_file.seek(0)
+        return proc.returncode, err_file.read().decode("utf-8", "replace").strip()
+
+
+def render_plan_ffmpeg(
+    plan: RenderPlan,
+    output_path: str,
+    codec: str = "libx264",
+    bitrate: str = "12000k",
+    preset: str = "medium",
+    crf: Optional[int] = None,
+    maxrate: Optional[str] = None,
+    bufsize: Optional[str] = None,
+    threads: int = 0,
+    audio_bitrate: str = "192k",
+    progress: Optional[ProgressTracker] = None,
+) -> Dict[str, float]:
+    """
+    Renderiza o plano inteiramente no ffmpeg (filter_complex). threads=0 → automático (todos os núcleos).
+    crf definido → capped CRF (maxrate/bufsize) em vez de bitrate médio.
+    progress: frames codificados, lidos do -progress do ffmpeg (core.progress).
+    Retorna {"frames", "seconds", "fps"}.
+    Raises:
+        FileNotFoundError: ffmpeg ausente.
+        RuntimeError: ffmpeg encerrou com erro.
+    """
+    if not plan.backgrounds:
+        raise ValueError("RenderPlan sem fundo.")
+    os.makedirs(os.path.dirname(output_path) or "outputs", exist_ok=True)
+    work_dir = tempfile.mkdtemp(prefix="salmo_graph_", dir=os.path.dirname(output_path) or None)
+    try:
+        inputs, graph, vout = build_filter_graph(plan, work_dir)
+        n_inputs = len(plan.backgrounds) + len(plan.overlays)
+        cmd = [ffmpeg_binary(), "-y", "-loglevel", "error"] + inputs
+        if plan.audio_path:
+            cmd += ["-i", plan.audio_path]
+        cmd += ["-filter_complex", graph, "-map", f"[{vout}]"]
+        if plan.audio_path:
+            cmd += ["-map", f"{n_inputs}:a:0", "-c:a", "aac", "-b:a", audio_bitrate]
+        cmd += [
+            "-c:v", codec, "-preset", preset, *rate_control_args(bitrate, crf, maxrate, bufsize), "-r", str(plan.fps),
+            "-threads", str(threads), "-t", f"{plan.duration:.3f}", "-movflags", "+faststart",
+            output_path,
+        ]
+        t0 = time.monotonic()
+        if progress is not None and progress.active:
+            returncode, err = _run_with_progress(cmd, progress)
+        else:
+            proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            returncode, err = proc.returncode, proc.stderr.decode("utf-8", "replace").strip()
+        elapsed = time.monotonic() - t0
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg (filter graph) falhou (código {returncode}): {err[-400:]}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    frames = plan.n_frames
+    return {"frames": float(frames), "seconds": elapsed, "fps": frames / max(elapsed, 1e-6)}
+
+
+def _parity_plan() -> RenderPlan:
+    """Plano curto e pequeno: dois fundos (zoom in e out, concat) e um overlay com fades."""
+    w, h, fps = 216, 384, 30
+    yy, xx = np.mgrid[0:h, 0:w].astype(np.float32)
+    blobs = np.sin(xx / 17.0) * np.cos(yy / 23.0)
+    image = np.dstack([
+        xx * 255.0 / w,
+        yy * 255.0 / h,
+        127.5 + 100.0 * blobs,
+    ]).clip(0, 255).astype(np.uint8)
+    rgb = np.full((48, 160, 3), 235, dtype=np.uint8)
+    alpha = np.zeros((48, 160), dtype=np.uint8)
+    alpha[8:40, 8:152] = 220
+    return RenderPlan(
+        size=(w, h),
+        fps=fps,
+        duration=1.0,
+        backgrounds=[
+            BackgroundLayer(image, 0.0, 0.5, 1.0, 1.08),
+            BackgroundLayer(image, 0.5, 1.0, 1.08, 1.0),
+        ],
+        overlays=[OverlayLayer(rgb, alpha, 28, 168, 0.1, 0.9, fade_in=0.2, fade_out=0.2)],
+    )
+
+
+def _decode_rgb(path: str, size: Tuple[int, int]) -> np.ndarray:
+    w, h = size
+    proc = subprocess.run(
+        [ffmpeg_binary(), "-loglevel", "error", "-i", path, "-f", "rawvideo", "-pix_fmt", "rgb24", "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True,
+    )
+    return np.frombuffer(proc.stdout, dtype=np.uint8).reshape(-1, h, w, 3)
+
+
+@lru_cache(maxsize=1)
+def check_parity(max_mean_diff: float = PARITY_MAX_MEAN_DIFF) -> Tuple[bool, float]:
+    """
+    Renderiza um plano de teste com este motor e com render_plan_numpy e compara frame a frame
+    (diferença média absoluta em RGB, 0–255). Retorna (passou, pior diferença); memoizado por processo.
+    Erro de render/decodificação → (False, inf).
+    """
+    from core.frame_compositor import render_plan_numpy
+
+    plan = _parity_plan()
+    work_dir = tempfile.mkdtemp(prefix="salmo_parity_")
+    try:
+        ref_path = os.path.join(work_dir, "numpy.mp4")
+        out_path = os.path.join(work_dir, "ffmpeg.mp4")
+        encode = {"preset": "ultrafast", "crf": 12}
+        render_plan_numpy(plan, ref_path, workers=1, threads=1, **encode)
+        render_plan_ffmpeg(plan, out_path, threads=1, **encode)
+        ref, out = _decode_rgb(ref_path, plan.size), _decode_rgb(out_path, plan.size)
+        if len(ref) != len(out):
+            logger.warning("Paridade ffmpeg × NumPy: %d frame(s) × %d", len(out), len(ref))
+            return False, float("inf")
+        worst = max(float(np.abs(a.astype(np.int16) - b).mean()) for a, b in zip(ref, out))
+    except Exception as e:
+        logger.warning("Paridade ffmpeg × NumPy não verificada: %s", e)
+        return False, float("inf")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    logger.debug("Paridade ffmpeg × NumPy: pior diferença média %.2f (limite %.2f)", worst, max_mean_diff)
+    return worst <= max_mean_diff, worst
@@ -0,0 +1,304 @@
+"""
+Compositor NumPy de frames crus → pipe único do ffmpeg.
+
+Alternativa ao CompositeVideoClip do MoviePy (que mistura camada por camada em Python):
+- Fundo: KenBurnsZoom (fundo renderizado uma vez + tabela de crops sub-pixel por frame)
+- Overlays: alpha blending inteiro (int16) só dentro do bounding box de cada camada
+- Fades: rampas de opacidade pré-calculadas por frame (sem cálculo por pixel)
+Os frames RGB24 são escritos num único processo ffmpeg (stdin) e muxados com o áudio já mixado.
+Modo paralelo (workers > 1, SALMO_COMPOSITE_WORKERS): processos compõem frames direto em slots de
+core.shared_frames.FrameBufferPool e o coordenador os escreve em ordem no mesmo ffmpeg (pixels sem pickle).
+"""
+
+import os
+import shutil
+import logging
+import multiprocessing
+import subprocess
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from core.encoder_profiles import rate_control_args
+from core.ken_burns import KenBurnsZoom
+from core.progress import ProgressTracker
+from core.render_plan import RenderPlan, OverlayLayer
+
+logger = logging.getLogger(__name__)
+
+# Processos de composição do render NumPy (SALMO_COMPOSITE_WORKERS); 1 → compõe no processo atual
+DEFAULT_COMPOSITE_WORKERS = max(1, int(os.getenv("SALMO_COMPOSITE_WORKERS", "1") or 1))
+# Frames consecutivos por tarefa de um worker (menos IPC por frame)
+COMPOSITE_BATCH = 4
+
+__all__ = [
+    "DEFAULT_COMPOSITE_WORKERS",
+    "ffmpeg_binary",
+    "iter_frames_parallel",
+    "NumpyFrameCompositor",
+    "raw_input_args",
+    "pipe_frames",
+    "render_plan_numpy",
+]
+
+
+def ffmpeg_binary() -> str:
+    """
+    Caminho do ffmpeg: FFMPEG_BINARY (env) → binário do imageio-ffmpeg (o mesmo do MoviePy) → PATH.
+    Raises:
+        FileNotFoundError: Se nenhum ffmpeg for encontrado.
+    """
+    env_bin = os.getenv("FFMPEG_BINARY")
+    if env_bin and env_bin.strip() and env_bin.strip() != "ffmpeg-imageio":
+        return env_bin.strip()
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        pass
+    found = shutil.which("ffmpeg")
+    if not found:
+        raise FileNotFoundError("ffmpeg não encontrado (instale FFmpeg ou imageio-ffmpeg).")
+    return found
+
+
+class NumpyFrameCompositor:
+    """
+    Gera cada frame do RenderPlan com NumPy.
+    Rampas de opacidade (0–128) e intervalos de frames de cada overlay são pré-calculados no construtor.
+    """
+
+    def __init__(self, plan: RenderPlan):
+        if not plan.backgrounds:
+            raise ValueError("RenderPlan sem fundo.")
+        self.plan = plan
+        self.width, self.height = plan.size
+        self.n_frames = plan.n_frames
+        self._frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        # Um motor de zoom por fundo (imagem escalada uma vez; crops pré-calculados)
+        self._zooms = [
+            (bg, int(round(bg.start * plan.fps)), KenBurnsZoom(bg.image, plan.size, bg.zoom_start, bg.zoom_end, bg.end - bg.start, plan.fps))
+            for bg in plan.backgrounds
+        ]
+        # (layer, frame inicial, frame final, rampa 0–128, rgb int16, alpha int16 0–128)
+        self._layers: List[Tuple[OverlayLayer, int, int, np.ndarray, np.ndarray, np.ndarray]] = []
+        times = np.arange(self.n_frames, dtype=np.float64) / plan.fps
+        for layer in plan.overlays:
+            f0 = max(0, int(np.ceil(layer.start * plan.fps - 1e-9)))
+            f1 = min(self.n_frames, int(np.ceil(layer.end * plan.fps - 1e-9)))
+            if f1 <= f0:
+                continue
+            ramp = np.round(layer.opacity_at(times[f0:f1]) * 128.0).astype(np.int16)
+            rgb = layer.rgb.astype(np.int16)
+            alpha = ((layer.alpha.astype(np.int16) + 1) >> 1)[..., None]
+            self._layers.append((layer, f0, f1, ramp, rgb, alpha))
+
+    def _blend(self, frame: np.ndarray, layer: OverlayLayer, rgb: np.ndarray, alpha: np.ndarray, opacity: int) -> None:
+        """
+        Alpha blending in-place no bounding box do overlay: dst + ((src − dst) · a) >> 7,
+        com a = alpha · opacity em ponto fixo 0–128 (cabe em int16, sem float).
+        """
+        x, y = layer.x, layer.y
+        h, w = alpha.shape[:2]
+        fx0, fy0 = max(0, x), max(0, y)
+        fx1, fy1 = min(self.width, x + w), min(self.height, y + h)
+        if fx1 <= fx0 or fy1 <= fy0:
+            return
+        sy, sx = slice(fy0 - y, fy1 - y), slice(fx0 - x, fx1 - x)
+        a = alpha[sy, sx]
+        if opacity < 128:
+            a = (a * opacity) >> 7
+        dst = frame[fy0:fy1, fx0:fx1]
+        diff = rgb[sy, sx] - dst
+        diff *= a
+        diff >>= 7
+        diff += dst
+        dst[...] = diff
+
+    def render_frame(self, index: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Frame index (0..n_frames-1) como array (H, W, 3) uint8. O buffer é reutilizado entre chamadas;
+        out (ex.: slot de memória compartilhada) recebe o frame no lugar do buffer interno.
+        """
+        frame = self._frame if out is None else out
+        t = index / self.plan.fps
+        active = self.plan.background_at(t)
+        for bg, first_frame, zoom in self._zooms:
+            if bg is active:
+                zoom.frame(index - first_frame, out=frame)
+                break
+        for layer, f0, f1, ramp, rgb, alpha in self._layers:
+            if f0 <= index < f1:
+                opacity = int(ramp[index - f0])
+                if opacity > 0:
+                    self._blend(frame, layer, rgb, alpha, opacity)
+        return frame
+
+    def iter_frames(self, start: int = 0, stop: Optional[int] = None) -> Iterator[np.ndarray]:
+        """Frames [start, stop) (padrão: todos). Acesso aleatório: qualquer intervalo é válido."""
+        stop = self.n_frames if stop is None else min(stop, self.n_frames)
+        for i in range(max(0, start), stop):
+            yield self.render_frame(i)
+
+
+_worker_compositor: Optional[NumpyFrameCompositor] = None
+_worker_frames = None
+
+
+def _init_composite_worker(plan_handle, frames_handle) -> None:
+    """Initializer: plano a partir da memória compartilhada (sem cópia dos pixels) + slots de saída."""
+    global _worker_compositor, _worker_frames
+    from core.shared_frames import attach_plan
+    _worker_compositor = NumpyFrameCompositor(attach_plan(plan_handle))
+    _worker_frames = frames_handle
+
+
+def _composite_batch(task: Tuple[int, List[int]]) -> int:
+    """Compõe os frames start, start+1, ... direto nos slots indicados. Retorna quantos compôs."""
+    start, slots = task
+    for offset, slot in enumerate(slots):
+        _worker_compositor.render_frame(start + offset, out=_worker_frames.view(slot))
+    return len(slots)
+
+
+def iter_frames_parallel(plan: RenderPlan, workers: int, batch: int = COMPOSITE_BATCH) -> Iterator[np.ndarray]:
+    """
+    Frames do plano em ordem, compostos por `workers` processos em slots de memória compartilhada.
+    Cada frame entregue é uma view do slot, válida até o próximo (mesmo contrato de render_frame).
+    Até 2 lotes por worker em andamento: os workers compõem enquanto o coordenador escreve no ffmpeg.
+    Workers via forkserver/spawn, nunca fork (thread de narração com asyncio + SSL pode estar ativa).
+    """
+    from core.shared_frames import FrameBufferPool, SharedPlan
+
+    n = plan.n_frames
+    w, h = plan.size
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    with SharedPlan(plan, label="plano (compositor)") as shared, \
+            FrameBufferPool((h, w, 3), workers * batch * 2, label="frames (compositor)") as frames, \
+            ProcessPoolExecutor(
+                max_workers=workers, mp_context=ctx,
+                initializer=_init_composite_worker, initargs=(shared.handle, frames.handle),
+            ) as pool:
+        pending: deque = deque()
+        next_frame = 0
+
+        def _fill() -> None:
+            nonlocal next_frame
+            while next_frame < n and frames.available >= min(batch, n - next_frame):
+                slots = [frames.acquire() for _ in range(min(batch, n - next_frame))]
+                pending.append((slots, pool.submit(_composite_batch, (next_frame, slots))))
+                next_frame += len(slots)
+
+        try:
+            _fill()
+            while pending:
+                slots, future = pending[0]
+                future.result()
+                for slot in slots:
+                    yield frames.view(slot)
+                pending.popleft()
+                for slot in slots:
+                    frames.release(slot)
+                _fill()
+        finally:
+            # Consumidor parou antes do fim (ex.: ffmpeg fechou o pipe): devolve os slots dos lotes restantes
+            for slots, future in pending:
+                future.cancel()
+            for slots, future in pending:
+                try:
+                    future.result()
+                except Exception:
+                    pass
+                for slot in slots:
+                    frames.release(slot)
+
+
+def raw_input_args(plan: RenderPlan) -> List[str]:
+    """Argumentos do ffmpeg para ler RGB24 cru do stdin no tamanho/fps do plano."""
+    w, h = plan.size
+    return ["-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{w}x{h}", "-r", str(plan.fps), "-i", "-"]
+
+
+def pipe_frames(
+    cmd: List[str],
+    frames: Iterable[np.ndarray],
+    expected: int,
+    on_frame: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Escreve os frames no stdin de um processo ffmpeg (cmd) e espera o término.
+    on_frame(n): chamado após cada frame escrito (progresso). Retorna o número de frames escritos.
+    Raises:
+        RuntimeError: ffmpeg encerrou com erro ou antes de receber todos os frames.
+    """
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    n = 0
+    try:
+        for frame in frames:
+            proc.stdin.write(memoryview(frame).cast("B"))
+            n += 1
+            if on_frame is not None:
+                on_frame(n)
+    except BrokenPipeError:
+        pass
+    finally:
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        err = proc.stderr.read().decode("utf-8", "replace") if proc.stderr else ""
+        proc.wait()
+    if proc.returncode != 0 or n < expected:
+        raise RuntimeError(f"ffmpeg (pipe NumPy) falhou (código {proc.returncode}): {err.strip()[-400:]}")
+    return n
+
+
+def render_plan_numpy(
+    plan: RenderPlan,
+    output_path: str,
+    codec: str = "libx264",
+    bitrate: str = "12000k",
+    preset: str = "medium",
+    crf: Optional[int] = None,
+    maxrate: Optional[str] = None,
+    bufsize: Optional[str] = None,
+    threads: int = 4,
+    audio_bitrate: str = "192k",
+    workers: Optional[int] = None,
+    progress: Optional[ProgressTracker] = None,
+) -> Dict[str, float]:
+    """
+    Renderiza o plano com NumpyFrameCompositor e escreve RGB24 cru num único ffmpeg (stdin).
+    crf definido → capped CRF (maxrate/bufsize) em vez de bitrate médio (core.encoder_profiles).
+    workers > 1 → composição em processos com frames em memória compartilhada (iter_frames_parallel);
+    None → DEFAULT_COMPOSITE_WORKERS. progress: frames escritos no ffmpeg (core.progress).
+    Retorna {"frames", "seconds", "fps"}.
+    Raises:
+        FileNotFoundError: ffmpeg ausente.
+        RuntimeError: ffmpeg encerrou com erro.
+    """
+    if not plan.backgrounds:
+        raise ValueError("RenderPlan sem fundo.")
+    workers = DEFAULT_COMPOSITE_WORKERS if workers is None else max(1, workers)
+    cmd = [ffmpeg_binary(), "-y", "-loglevel", "error"] + raw_input_args(plan)
+    if plan.audio_path:
+        cmd += ["-i", plan.audio_path, "-map", "0:v:0", "-map", "1:a:0", "-c:a", "aac", "-b:a", audio_bitrate]
+    cmd += [
+        "-c:v", codec, "-preset", preset, *rate_control_args(bitrate, crf, maxrate, bufsize), "-pix_fmt", "yuv420p",
+        "-threads", str(threads), "-t", f"{plan.duration:.3f}", "-movflags", "+faststart",
+        output_path,
+    ]
+    os.makedirs(os.path.dirname(output_path) or "outputs", exist_ok=True)
+    t0 = time.monotonic()
+    if workers > 1:
+        logger.info("      Composição em %d processo(s) (frames em memória compartilhada)", workers)
+        frames = iter_frames_parallel(plan, workers)
+    else:
+        frames = NumpyFrameCompositor(plan).iter_frames()
+    n = pipe_frames(cmd, frames, plan.n_frames, on_frame=progress.update if progress is not None and progress.active else None)
+    elapsed = time.monotonic() - t0
+    return {"frames": float(n), "seconds": elapsed, "fps": n / max(elapsed, 1e-6)}
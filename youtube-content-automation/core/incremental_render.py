@@ -0,0 +1,247 @@
+"""
+Re-render incremental: só os trechos cujas entradas mudaram são compostos e codificados.
+
+A timeline do RenderPlan é dividida em trechos de CHUNK_GOPS GOPs (fronteiras em keyframe, como as fatias
+de core.sliced_encoder). Cada trecho recebe uma assinatura do que define seus pixels:
+- Fundo ativo: hash da imagem graduada + escala do master do KenBurnsZoom + zoom de cada frame do trecho
+- Overlays que aparecem no trecho: hash do recorte RGBA, posição e opacidade de cada frame do trecho
+- Tamanho, fps, frames do trecho e parâmetros de encode
+Só valores efetivamente usados nos frames do trecho entram (não o início/fim das camadas): um overlay que
+termina mais tarde, ou um fundo que continua além do trecho, não invalida os trechos anteriores.
+Trecho com assinatura já codificada (core.render_cache.EncodedChunkCache) → reaproveitado como está.
+Os demais são codificados em paralelo; junção com concat + stream copy e áudio muxado uma vez.
+
+Manifesto ao lado do vídeo (<saída>.manifest.json): frases (hash do texto, início/fim) e trechos
+(frames, assinatura, bytes, reaproveitado ou não).
+Correção de texto que não altera a duração (ex.: só a legenda) refaz apenas os trechos da frase;
+mudança na duração da narração desloca os tempos das frases seguintes → refaz os trechos a partir da
+frase editada (com este motor, o zoom do fundo no pipeline tem ritmo fixo desde t=0 e não depende da duração total).
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.render_plan import BackgroundLayer, RenderPlan
+from core.progress import ProgressTracker
+from core.sliced_encoder import DEFAULT_SLICES, concat_slices, encode_slices, gop_codec_args, gop_frames
+
+logger = logging.getLogger(__name__)
+
+# GOPs por trecho: menor → re-encode mais localizado, mais arquivos na junção
+CHUNK_GOPS = 2
+
+__all__ = [
+    "CHUNK_GOPS",
+    "chunk_ranges",
+    "chunk_signatures",
+    "manifest_path",
+    "render_plan_incremental",
+]
+
+
+def chunk_ranges(n_frames: int, gop: int, gops_per_chunk: int = CHUNK_GOPS) -> List[Tuple[int, int]]:
+    """Intervalos [a, b) de gop × gops_per_chunk frames (o último pode ser menor). Independe da duração total."""
+    size = max(1, gop * max(1, gops_per_chunk))
+    return [(a, min(n_frames, a + size)) for a in range(0, n_frames, size)]
+
+
+def _digest(*arrays: np.ndarray) -> str:
+    h = hashlib.sha256()
+    for arr in arrays:
+        h.update(str(arr.shape).encode("ascii"))
+        h.update(np.ascontiguousarray(arr).data)
+    return h.hexdigest()[:24]
+
+
+def _t(value: float) -> str:
+    return f"{value:.6f}"
+
+
+def _frame_zooms(bg: BackgroundLayer, frames: np.ndarray, fps: int) -> np.ndarray:
+    """Zoom de cada frame (índices absolutos) — mesma curva e origem que o KenBurnsZoom do compositor."""
+    local = (frames - int(round(bg.start * fps))) / fps
+    duration = max(0.01, bg.end - bg.start)
+    zooms = bg.zoom_start + (bg.zoom_end - bg.zoom_start) * np.minimum(1.0, np.maximum(0.0, local) / duration)
+    return np.round(zooms, 9)
+
+
+def chunk_signatures(
+    plan: RenderPlan,
+    ranges: Sequence[Tuple[int, int]],
+    encode: Dict[str, Any],
+    chunk_cache: Any,
+) -> List[str]:
+    """Assinatura de cada trecho: fundo(s) ativo(s) + overlays visíveis + tamanho/fps + encode."""
+    fps = plan.fps
+    n_frames = plan.n_frames
+    bg_images = [_digest(bg.image) for bg in plan.backgrounds]
+    # Mesmo intervalo de frames e rampa de opacidade (0–128) que o NumpyFrameCompositor usa para cada overlay
+    overlays = []
+    for layer in plan.overlays:
+        f0 = max(0, int(np.ceil(layer.start * fps - 1e-9)))
+        f1 = min(n_frames, int(np.ceil(layer.end * fps - 1e-9)))
+        if f1 <= f0:
+            continue
+        ramp = np.round(layer.opacity_at(np.arange(f0, f1, dtype=np.float64) / fps) * 128.0).astype(np.int16)
+        overlays.append((f0, f1, ramp, [_digest(layer.rgb, layer.alpha), layer.x, layer.y]))
+
+    bg_index = {id(bg): i for i, bg in enumerate(plan.backgrounds)}
+    signatures = []
+    for a, b in ranges:
+        frames_by_bg: Dict[int, List[int]] = {}
+        for i in range(a, b):
+            frames_by_bg.setdefault(bg_index[id(plan.background_at(i / fps))], []).append(i)
+        backgrounds = []
+        for idx, frames in frames_by_bg.items():
+            bg = plan.backgrounds[idx]
+            zooms = _frame_zooms(bg, np.asarray(frames), fps)
+            backgrounds.append([bg_images[idx], _t(max(bg.zoom_start, bg.zoom_end)), frames[0], _digest(zooms)])
+        visible = []
+        for f0, f1, ramp, sig in overlays:
+            lo, hi = max(a, f0), min(b, f1)
+            if lo < hi:
+                visible.append(sig + [lo, _digest(ramp[lo - f0:hi - f0])])
+        params = {
+            "size": list(plan.size),
+            "fps": fps,
+            "frames": [a, b],
+            "encode": encode,
+            "backgrounds": backgrounds,
+            "overlays": visible,
+        }
+        signatures.append(chunk_cache.key(params))
+    return signatures
+
+
+def manifest_path(output_path: str) -> str:
+    return os.path.splitext(output_path)[0] + ".manifest.json"
+
+
+def _segment_entries(segments: Optional[Sequence[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    out = []
+    for i, seg in enumerate(segments or []):
+        text = str(seg.get("text", ""))
+        out.append({
+            "index": i,
+            "text_sha256": hashlib.sha256(text.encode("utf-8")).hexdigest()[:16],
+            "start": round(float(seg.get("start", 0.0)), 3),
+            "end": round(float(seg.get("end", 0.0)), 3),
+        })
+    return out
+
+
+def render_plan_incremental(
+    plan: RenderPlan,
+    output_path: str,
+    segments: Optional[Sequence[Dict[str, Any]]] = None,
+    codec: str = "libx264",
+    bitrate: str = "12000k",
+    preset: str = "medium",
+    crf: Optional[int] = None,
+    maxrate: Optional[str] = None,
+    bufsize: Optional[str] = None,
+    audio_bitrate: str = "192k",
+    progress: Optional[ProgressTracker] = None,
+) -> Dict[str, float]:
+    """
+    Renderiza o plano reaproveitando trechos já codificados com a mesma assinatura; só os alterados
+    são compostos e codificados. segments (frases com text/start/end) entram no manifesto.
+    progress: frames a codificar (total = frames dos trechos não reaproveitados).
+    Retorna {"frames", "seconds", "fps", "chunks", "reused"} — frames = frames efetivamente codificados.
+    Raises:
+        FileNotFoundError: ffmpeg ausente.
+        RuntimeError: ffmpeg encerrou com erro (trecho ou junção).
+    """
+    from core.render_cache import get_chunk_cache
+
+    if not plan.backgrounds:
+        raise ValueError("RenderPlan sem fundo.")
+    cache = get_chunk_cache()
+    gop = gop_frames(plan.fps)
+    ranges = chunk_ranges(plan.n_frames, gop)
+    encode = {
+        "codec": codec, "bitrate": None if crf is not None else bitrate, "preset": preset, "gop": gop,
+        "crf": crf, "maxrate": maxrate, "bufsize": bufsize,
+    }
+    t0 = time.monotonic()
+    signatures = chunk_signatures(plan, ranges, encode, cache)
+
+    os.makedirs(os.path.dirname(output_path) or "outputs", exist_ok=True)
+    work_dir = tempfile.mkdtemp(prefix="salmo_chunks_", dir=os.path.dirname(output_path) or None)
+    try:
+        paths: List[Optional[str]] = []
+        pending: List[int] = []
+        for i, sig in enumerate(signatures):
+            hit = cache.lookup(sig)
+            paths.append(str(hit) if hit else None)
+            if hit is None:
+                pending.append(i)
+
+        n = 0
+        if pending:
+            workers = max(1, min(DEFAULT_SLICES, len(pending)))
+            threads = max(1, (os.cpu_count() or 1) // workers)
+            codec_args = gop_codec_args(gop, codec, bitrate, preset, threads, crf, maxrate, bufsize)
+            targets = {
+                i: (cache.temp_path(signatures[i]) if cache.enabled else Path(work_dir) / f"chunk_{i:04d}.mp4")
+                for i in pending
+            }
+            jobs = [(ranges[i][0], ranges[i][1], str(targets[i]), codec_args) for i in pending]
+            if progress is not None:
+                progress.set_total(sum(stop - start for start, stop, _, _ in jobs))
+            logger.info(
+                "      Render incremental: %d de %d trechos a codificar (GOP %d frames, %d processo(s))",
+                len(jobs), len(ranges), gop, workers,
+            )
+            try:
+                n = sum(r[0] for r in encode_slices(plan, jobs, workers=workers, progress=progress))
+                for i in pending:
+                    paths[i] = str(cache.commit(signatures[i], targets[i]) if cache.enabled else targets[i])
+            finally:
+                for tmp in targets.values():
+                    if cache.enabled and tmp.exists():
+                        tmp.unlink()
+        else:
+            if progress is not None:
+                progress.set_total(0)
+            logger.info("      Render incremental: todos os %d trechos reaproveitados (só junção)", len(ranges))
+
+        concat_slices(plan, [p for p in paths if p], work_dir, output_path, audio_bitrate)
+        chunk_bytes = [os.path.getsize(p) for p in paths if p]
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    manifest = {
+        "size": list(plan.size),
+        "fps": plan.fps,
+        "duration": round(plan.duration, 3),
+        "encode": encode,
+        "segments": _segment_entries(segments),
+        "chunks": [
+            {"frames": [a, b], "signature": sig, "bytes": size, "reused": i not in pending}
+            for i, ((a, b), sig, size) in enumerate(zip(ranges, signatures, chunk_bytes))
+        ],
+    }
+    try:
+        with open(manifest_path(output_path), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+    except OSError as e:
+        logger.warning("Não foi possível gravar o manifesto do render: %s", e)
+
+    elapsed = time.monotonic() - t0
+    return {
+        "frames": float(n),
+        "seconds": elapsed,
+        "fps": n / max(elapsed, 1e-6),
+        "chunks": float(len(ranges)),
+        "reused": float(len(ranges) - len(pending)),
+    }
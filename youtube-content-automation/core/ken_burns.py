@@ -0,0 +1,110 @@
+"""
+Motor de zoom Ken Burns pré-calculado.
+
+Substitui bg_clip.resize(lambda t: ...) do MoviePy, que reamostra o fundo inteiro com PIL
+para um tamanho MAIOR a cada frame. Aqui:
+- O fundo é renderizado uma única vez na escala máxima do zoom (LANCZOS)
+- Uma tabela de retângulos de crop (sub-pixel, um por frame) é calculada no construtor
+- Cada frame = crop sub-pixel + redução para o tamanho de saída (PIL resize com box, em C)
+Mesmo enquadramento do resize + set_position("center") do MoviePy.
+"""
+
+import math
+import logging
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "KenBurnsZoom",
+]
+
+
+class KenBurnsZoom:
+    """
+    Zoom linear zoom_start → zoom_end ao longo de duration (s), centralizado.
+
+    Uso:
+        zoom = KenBurnsZoom(bg_np, (1080, 1920), 1.0, 1.06, duration=30.0, fps=30)
+        for frame in zoom.iter_frames(): ...       # gerador (compositor NumPy)
+        clip = zoom.to_clip()                       # VideoClip do MoviePy (make_frame = frame_at)
+    """
+
+    def __init__(
+        self,
+        image: Union[np.ndarray, Image.Image],
+        size: Tuple[int, int],
+        zoom_start: float,
+        zoom_end: float,
+        duration: float,
+        fps: int,
+        resample: int = Image.Resampling.BILINEAR,
+    ):
+        src = image if isinstance(image, Image.Image) else Image.fromarray(np.ascontiguousarray(image))
+        self.size = size
+        self.zoom_start = float(zoom_start)
+        self.zoom_end = float(zoom_end)
+        self.duration = max(0.01, float(duration))
+        self.fps = fps
+        self.resample = resample
+        self.n_frames = max(1, int(math.ceil(self.duration * fps - 1e-9)))
+
+        # Fundo renderizado uma vez na escala máxima: todo frame é um crop + redução (nunca ampliação)
+        self.src_size = src.size
+        self.max_zoom = max(self.zoom_start, self.zoom_end, 1e-3)
+        master_size = (int(math.ceil(src.size[0] * self.max_zoom)), int(math.ceil(src.size[1] * self.max_zoom)))
+        self.master = src.convert("RGB").resize(master_size, Image.Resampling.LANCZOS)
+
+        # Tabela de crops (x0, y0, x1, y1) em coordenadas do master, um por frame
+        t = np.arange(self.n_frames, dtype=np.float64) / fps
+        zooms = self.zoom_start + (self.zoom_end - self.zoom_start) * np.minimum(1.0, t / self.duration)
+        self.crop_table = self._crop_boxes(zooms)
+
+    def _crop_boxes(self, zooms: np.ndarray) -> np.ndarray:
+        """
+        Retângulos sub-pixel centralizados para cada fator de zoom (vetorizado).
+        Região visível na fonte = (W/z) × (H/z) no centro; no master, escalada por master/fonte.
+        """
+        w, h = self.size
+        master_w, master_h = self.master.size
+        half_w = (w / 2.0) / zooms * (master_w / self.src_size[0])
+        half_h = (h / 2.0) / zooms * (master_h / self.src_size[1])
+        cx, cy = master_w / 2.0, master_h / 2.0
+        boxes = np.stack([cx - half_w, cy - half_h, cx + half_w, cy + half_h], axis=1)
+        boxes[:, 0::2] = np.clip(boxes[:, 0::2], 0.0, master_w)
+        boxes[:, 1::2] = np.clip(boxes[:, 1::2], 0.0, master_h)
+        return boxes
+
+    def zoom_at(self, t: float) -> float:
+        return self.zoom_start + (self.zoom_end - self.zoom_start) * min(1.0, max(0.0, t) / self.duration)
+
+    def frame(self, index: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Frame index (0..n_frames-1) como (H, W, 3) uint8. Se out for dado, escreve nele."""
+        index = min(max(0, index), self.n_frames - 1)
+        box = tuple(float(v) for v in self.crop_table[index])
+        img = self.master.resize(self.size, self.resample, box=box)
+        if out is None:
+            return np.asarray(img)
+        out[...] = np.asarray(img)
+        return out
+
+    def frame_at(self, t: float) -> np.ndarray:
+        """Frame no instante t (s). Tempos múltiplos de 1/fps usam a tabela; os demais, crop exato."""
+        pos = t * self.fps
+        index = int(round(pos))
+        if abs(pos - index) < 1e-6:
+            return self.frame(index)
+        box = tuple(float(v) for v in self._crop_boxes(np.array([self.zoom_at(t)]))[0])
+        return np.asarray(self.master.resize(self.size, self.resample, box=box))
+
+    def iter_frames(self) -> Iterator[np.ndarray]:
+        for i in range(self.n_frames):
+            yield self.frame(i)
+
+    def to_clip(self):
+        """VideoClip do MoviePy que entrega frames a partir da tabela (substitui ImageClip.resize(lambda))."""
+        from moviepy.editor import VideoClip
+        return VideoClip(make_frame=self.frame_at, duration=self.duration)
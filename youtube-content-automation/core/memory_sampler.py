@@ -0,0 +1,410 @@
+"""
+Amostragem de memória por etapa (opt-in) para achar onde o render estoura a memória dos workers.
+
+Com SALMO_MEMORY_REPORT=1 (main.py --memory-report), cada execução do pipeline liga um MemorySampler:
+- Nas fronteiras de etapa (as mesmas seções de core.stage_profiler.profile_section: text, tts, alignment,
+  overlays, background, render, compose_encode...): RSS na entrada e na saída, pico do tracemalloc durante a
+  etapa e as N linhas que mais alocaram nela (diferença entre snapshots do tracemalloc na entrada e na saída)
+- Numa thread, a cada SALMO_MEMORY_INTERVAL segundos: RSS do processo e dos filhos (ffmpeg, workers) e memória
+  rastreada pelo tracemalloc. Os picos entre fronteiras (o export do MoviePy/ffmpeg) vêm dessas amostras
+- Orçamento (SALMO_MEMORY_BUDGET_MB, 0 = sem limite): RSS do processo + filhos acima dele gera um aviso no log
+  com a etapa em andamento (uma vez por etapa) e fica marcado no relatório
+Relatório ao lado do vídeo: <vídeo>.memory.json (entradas por etapa, amostras, picos) e <vídeo>.memory.txt.
+RSS vem de /proc (Linux); fora dele só o tracemalloc é medido.
+"""
+
+import os
+import io
+import json
+import logging
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Intervalo entre amostras de RSS (SALMO_MEMORY_INTERVAL, segundos)
+DEFAULT_MEMORY_INTERVAL = max(0.02, float(os.getenv("SALMO_MEMORY_INTERVAL", "0.2") or 0.2))
+# RSS (processo + filhos) acima do qual a etapa em andamento é apontada no log (SALMO_MEMORY_BUDGET_MB); 0 → sem limite
+DEFAULT_MEMORY_BUDGET_MB = float(os.getenv("SALMO_MEMORY_BUDGET_MB", "0") or 0)
+# Linhas que mais alocaram, por etapa (SALMO_MEMORY_TOP)
+DEFAULT_MEMORY_TOP = max(1, int(os.getenv("SALMO_MEMORY_TOP", "10") or 10))
+
+_MB = 1024 * 1024
+
+__all__ = [
+    "DEFAULT_MEMORY_BUDGET_MB",
+    "DEFAULT_MEMORY_INTERVAL",
+    "DEFAULT_MEMORY_TOP",
+    "MemorySampler",
+    "active_sampler",
+    "memory_report_enabled",
+    "rss_bytes",
+    "sampling_memory",
+    "start_memory_sampling",
+    "stop_memory_sampling",
+    "tree_rss_bytes",
+]
+
+_sampler: Optional["MemorySampler"] = None
+_sampler_lock = threading.Lock()
+
+
+def memory_report_enabled() -> bool:
+    return os.getenv("SALMO_MEMORY_REPORT", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def rss_bytes(pid: Any = "self") -> Optional[int]:
+    """RSS atual do processo (/proc/<pid>/statm); None fora do Linux ou se o processo já terminou."""
+    try:
+        with open(f"/proc/{pid}/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _children(pid: int) -> List[int]:
+    found: List[int] = []
+    try:
+        tasks = os.listdir(f"/proc/{pid}/task")
+    except OSError:
+        return found
+    for tid in tasks:
+        try:
+            with open(f"/proc/{pid}/task/{tid}/children", "r") as f:
+                found += [int(c) for c in f.read().split()]
+        except (OSError, ValueError):
+            continue
+    return found
+
+
+def tree_rss_bytes() -> Optional[int]:
+    """RSS do processo somado ao de todos os descendentes vivos (o que conta para o limite do container)."""
+    own = rss_bytes()
+    if own is None:
+        return None
+    total, pending, seen = own, _children(os.getpid()), set()
+    while pending:
+        pid = pending.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        total += rss_bytes(pid) or 0
+        pending += _children(pid)
+    return total
+
+
+def _mb(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value / _MB, 1)
+
+
+class _MemorySection:
+    """Uma entrada de etapa: RSS nas fronteiras, picos amostrados e snapshot do tracemalloc na entrada."""
+
+    def __init__(self, sampler: "MemorySampler", name: str):
+        self.sampler = sampler
+        self.name = name
+        self.thread = threading.current_thread().name
+        self.start = 0.0
+        self.end = 0.0
+        self.rss_start: Optional[int] = None
+        self.rss_end: Optional[int] = None
+        self.rss_peak = 0
+        self.tree_peak = 0
+        self.traced_peak = 0
+        self.over_budget = False
+        self.top: List[Dict[str, Any]] = []
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def __enter__(self) -> "_MemorySection":
+        self.sampler._enter(self)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.sampler._exit(self)
+
+    def observe(self, rss: Optional[int], tree: Optional[int]) -> None:
+        if rss is not None:
+            self.rss_peak = max(self.rss_peak, rss)
+        if tree is not None:
+            self.tree_peak = max(self.tree_peak, tree)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.name,
+            "thread": self.thread,
+            "start_s": round(self.start, 3),
+            "end_s": round(self.end, 3),
+            "rss_start_mb": _mb(self.rss_start),
+            "rss_end_mb": _mb(self.rss_end),
+            "rss_delta_mb": _mb(self.rss_end - self.rss_start) if None not in (self.rss_start, self.rss_end) else None,
+            "rss_peak_mb": _mb(self.rss_peak or None),
+            "tree_rss_peak_mb": _mb(self.tree_peak or None),
+            "traced_peak_mb": _mb(self.traced_peak),
+            "over_budget": self.over_budget,
+            "top_allocations": self.top,
+        }
+
+
+class MemorySampler:
+    """
+    Sessão de amostragem do processo: entradas de etapa (em ordem), amostras periódicas e avisos de orçamento.
+    Liga o tracemalloc se ainda não estiver ligado (e o desliga em stop()).
+    """
+
+    def __init__(
+        self,
+        budget_mb: Optional[float] = None,
+        top: Optional[int] = None,
+        interval: Optional[float] = None,
+    ):
+        budget = DEFAULT_MEMORY_BUDGET_MB if budget_mb is None else budget_mb
+        self.budget_bytes = int(budget * _MB) if budget > 0 else 0
+        self.top = DEFAULT_MEMORY_TOP if top is None else max(1, top)
+        self.interval = DEFAULT_MEMORY_INTERVAL if interval is None else max(0.02, interval)
+        self.started = datetime.now()
+        self.sections: List[_MemorySection] = []
+        self.samples: List[List[Optional[float]]] = []
+        self.warnings: List[str] = []
+        self._active: List[_MemorySection] = []
+        self._warned: set = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._owns_tracemalloc = False
+        self._t0 = time.monotonic()
+
+    def start(self) -> "MemorySampler":
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        self._t0 = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="memory-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._sample()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    def section(self, name: str) -> ContextManager[Any]:
+        return _MemorySection(self, name)
+
+    # —— Fronteiras ——
+
+    def _fold_traced_peak(self) -> None:
+        """Pico do tracemalloc desde o último reset vale para todas as etapas ativas; zera para a próxima janela."""
+        if not tracemalloc.is_tracing():
+            return
+        peak = tracemalloc.get_traced_memory()[1]
+        for active in self._active:
+            active.traced_peak = max(active.traced_peak, peak)
+        tracemalloc.reset_peak()
+
+    def _enter(self, section: _MemorySection) -> None:
+        snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        rss, tree = rss_bytes(), tree_rss_bytes()
+        with self._lock:
+            self._fold_traced_peak()
+            section.start = time.monotonic() - self._t0
+            section.rss_start = rss
+            section.observe(rss, tree)
+            section._snapshot = snapshot
+            self._active.append(section)
+            self.sections.append(section)
+
+    def _exit(self, section: _MemorySection) -> None:
+        rss, tree = rss_bytes(), tree_rss_bytes()
+        with self._lock:
+            self._fold_traced_peak()
+            section.end = time.monotonic() - self._t0
+            section.rss_end = rss
+            for active in self._active:
+                active.observe(rss, tree)
+            self._check_budget(tree if tree is not None else rss)
+            self._active.remove(section)
+            before, section._snapshot = section._snapshot, None
+        if before is not None and tracemalloc.is_tracing():
+            section.top = self._top_allocations(before, tracemalloc.take_snapshot())
+
+    def _top_allocations(self, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot) -> List[Dict[str, Any]]:
+        """Linhas que mais cresceram durante a etapa (sem os arquivos do próprio tracemalloc)."""
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+        growth = sorted((d for d in diff if d.size_diff > 0), key=lambda d: d.size_diff, reverse=True)
+        return [
+            {
+                "where": f"{d.traceback[0].filename}:{d.traceback[0].lineno}",
+                "size_diff_kb": round(d.size_diff / 1024, 1),
+                "size_kb": round(d.size / 1024, 1),
+                "count_diff": d.count_diff,
+            }
+            for d in growth[: self.top]
+        ]
+
+    # —— Amostragem periódica ——
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        rss, tree = rss_bytes(), tree_rss_bytes()
+        traced = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        with self._lock:
+            self.samples.append([round(time.monotonic() - self._t0, 3), _mb(rss), _mb(tree), _mb(traced)])
+            for active in self._active:
+                active.observe(rss, tree)
+                if traced is not None:
+                    active.traced_peak = max(active.traced_peak, traced)
+            self._check_budget(tree if tree is not None else rss)
+
+    def _innermost(self) -> List[_MemorySection]:
+        """Etapas ativas sem etapa interna ativa na mesma thread (as que estão de fato rodando)."""
+        leaves: Dict[str, _MemorySection] = {}
+        for active in self._active:
+            leaves[active.thread] = active
+        return list(leaves.values())
+
+    def _check_budget(self, used: Optional[int]) -> None:
+        if not self.budget_bytes or used is None or used <= self.budget_bytes:
+            return
+        for active in self._active:
+            active.over_budget = True
+        culprits = self._innermost()
+        names = ", ".join(s.name for s in culprits) or "(fora de etapa)"
+        if names in self._warned:
+            return
+        self._warned.add(names)
+        message = (
+            f"Memória acima do orçamento na etapa {names}: {used / _MB:.0f} MB (processo + filhos) "
+            f"> {self.budget_bytes / _MB:.0f} MB"
+        )
+        self.warnings.append(message)
+        logger.warning("⚠️ %s", message)
+
+    # —— Relatório ——
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            rss_peak = max((s[1] for s in self.samples if s[1] is not None), default=None)
+            tree_peak = max((s[2] for s in self.samples if s[2] is not None), default=None)
+            return {
+                "started": self.started.isoformat(timespec="seconds"),
+                "pid": os.getpid(),
+                "budget_mb": _mb(self.budget_bytes or None),
+                "interval_s": self.interval,
+                "rss_peak_mb": max(filter(None, [rss_peak] + [_mb(s.rss_peak or None) for s in self.sections]), default=None),
+                "tree_rss_peak_mb": max(filter(None, [tree_peak] + [_mb(s.tree_peak or None) for s in self.sections]), default=None),
+                "warnings": list(self.warnings),
+                "stages": [s.as_dict() for s in self.sections],
+                "samples": {"columns": ["t_s", "rss_mb", "tree_rss_mb", "traced_mb"], "rows": list(self.samples)},
+            }
+
+    def write(self, report_base: str) -> Dict[str, str]:
+        """Grava <report_base>.json e <report_base>.txt; retorna {"json": ..., "txt": ...}."""
+        data = self.as_dict()
+        os.makedirs(os.path.dirname(report_base) or ".", exist_ok=True)
+        json_path, txt_path = report_base + ".json", report_base + ".txt"
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(txt_path, "w", encoding="utf-8") as f:
+            f.write(_format_report(data))
+        return {"json": json_path, "txt": txt_path}
+
+
+def _format_report(data: Dict[str, Any]) -> str:
+    def fmt(value: Optional[float]) -> str:
+        return "—" if value is None else f"{value:.1f}"
+
+    out = io.StringIO()
+    out.write(f"Memória por etapa — {data['started']} (pid {data['pid']})\n")
+    out.write(
+        f"Pico RSS: processo {fmt(data['rss_peak_mb'])} MB, processo + filhos {fmt(data['tree_rss_peak_mb'])} MB"
+        f"; orçamento {fmt(data['budget_mb']) + ' MB' if data['budget_mb'] else 'não definido'}\n"
+    )
+    for warning in data["warnings"]:
+        out.write(f"⚠️ {warning}\n")
+    out.write(
+        f"\n  {'etapa':<16} {'início':>7} {'fim':>7} {'RSS in':>8} {'RSS out':>8} {'Δ':>7} "
+        f"{'pico':>8} {'+filhos':>8} {'traced':>8}\n"
+    )
+    for stage in data["stages"]:
+        flag = " !" if stage["over_budget"] else ""
+        out.write(
+            f"  {stage['stage']:<16} {stage['start_s']:>7.1f} {stage['end_s']:>7.1f} {fmt(stage['rss_start_mb']):>8} "
+            f"{fmt(stage['rss_end_mb']):>8} {fmt(stage['rss_delta_mb']):>7} {fmt(stage['rss_peak_mb']):>8} "
+            f"{fmt(stage['tree_rss_peak_mb']):>8} {fmt(stage['traced_peak_mb']):>8}{flag}\n"
+        )
+    for stage in data["stages"]:
+        if not stage["top_allocations"]:
+            continue
+        out.write(f"\n{stage['stage']} ({stage['start_s']:.1f}s): linhas que mais alocaram\n")
+        for entry in stage["top_allocations"]:
+            out.write(f"  {entry['size_diff_kb']:>10.1f} KB  {entry['count_diff']:>+8d}  {entry['where']}\n")
+    return out.getvalue()
+
+
+def active_sampler() -> Optional[MemorySampler]:
+    return _sampler
+
+
+def start_memory_sampling(
+    budget_mb: Optional[float] = None,
+    top: Optional[int] = None,
+    interval: Optional[float] = None,
+) -> MemorySampler:
+    """Liga a amostragem de memória no processo (uma sessão por vez)."""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is not None:
+            raise RuntimeError("Já existe uma amostragem de memória ativa.")
+        _sampler = MemorySampler(budget_mb, top, interval).start()
+        return _sampler
+
+
+def stop_memory_sampling(report_base: Optional[str] = None) -> Dict[str, str]:
+    """Encerra a sessão; com report_base, grava <report_base>.json/.txt. Retorna os caminhos gravados."""
+    global _sampler
+    with _sampler_lock:
+        sampler, _sampler = _sampler, None
+    if sampler is None:
+        return {}
+    sampler.stop()
+    if report_base is None:
+        return {}
+    paths = sampler.write(report_base)
+    data = sampler.as_dict()
+    logger.info(
+        "      Memória: pico RSS %s MB (com filhos %s MB); relatório em %s",
+        data["rss_peak_mb"], data["tree_rss_peak_mb"], paths["txt"],
+    )
+    return paths
+
+
+@contextmanager
+def sampling_memory(report_base: str) -> Iterator[Optional[MemorySampler]]:
+    """
+    Amostragem em volta de um bloco se SALMO_MEMORY_REPORT estiver ligado e nenhuma sessão estiver ativa
+    (a sessão de fora grava o relatório dela). Relatório gravado mesmo se o bloco falhar.
+    """
+    if not memory_report_enabled() or _sampler is not None:
+        yield None
+        return
+    sampler = start_memory_sampling()
+    try:
+        yield sampler
+    finally:
+        try:
+            stop_memory_sampling(report_base)
+        except OSError as e:
+            logger.warning("Relatório de memória não gravado em %s: %s", report_base, e)
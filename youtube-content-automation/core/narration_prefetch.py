@@ -0,0 +1,206 @@
+"""
+Pipelining entre itens: a narração dos próximos itens (preparação textual, edge-tts, alinhamento) é sintetizada
+numa thread própria enquanto o item atual compõe e codifica. A CPU não fica parada no TTS, nem a rede no encode.
+
+- O resultado vai para o cache de narração (core.render_cache.NarrationCache): quando o pipeline do item chega
+  à narração, é um hit, sem rede. Se a pré-síntese do mesmo texto ainda estiver rodando, o pipeline espera
+  por ela em vez de chamar o edge-tts de novo
+- Backpressure: no máximo depth itens à frente do atual (SALMO_PREFETCH_DEPTH), até max_ahead_mb de áudio
+  sintetizado e ainda não consumido (SALMO_PREFETCH_MAX_MB) e, se configurado, RSS do processo abaixo de
+  SALMO_PREFETCH_MAX_RSS_MB (Linux; 0 = sem limite). Atingido um limite, a thread espera o item atual avançar
+- Falha na pré-síntese só gera aviso: o item sintetiza normalmente quando chegar a vez dele
+Uso: run_pipelined(items, text_of, process) ou NarrationPrefetcher(textos) com begin(i) antes de cada item.
+"""
+
+import os
+import asyncio
+import logging
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from core.memory_sampler import rss_bytes
+
+logger = logging.getLogger(__name__)
+
+# Itens com narração sintetizada à frente do atual (SALMO_PREFETCH_DEPTH); 0 desliga
+DEFAULT_PREFETCH_DEPTH = max(0, int(os.getenv("SALMO_PREFETCH_DEPTH", "1") or 0))
+# Áudio pré-sintetizado e ainda não consumido (SALMO_PREFETCH_MAX_MB)
+DEFAULT_PREFETCH_MAX_MB = float(os.getenv("SALMO_PREFETCH_MAX_MB", "64") or 64)
+# Teto de RSS do processo para iniciar uma pré-síntese (SALMO_PREFETCH_MAX_RSS_MB); 0 → sem teto
+DEFAULT_PREFETCH_MAX_RSS_MB = float(os.getenv("SALMO_PREFETCH_MAX_RSS_MB", "0") or 0)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+__all__ = [
+    "DEFAULT_PREFETCH_DEPTH",
+    "DEFAULT_PREFETCH_MAX_MB",
+    "DEFAULT_PREFETCH_MAX_RSS_MB",
+    "NarrationPrefetcher",
+    "run_pipelined",
+]
+
+
+class NarrationPrefetcher:
+    """
+    Pré-síntese da narração de texts[i] (None → item sem narração a antecipar) em ordem, numa thread.
+    O consumidor chama begin(i) ao iniciar o item i: itens ≤ i deixam de ser antecipados e liberam a cota.
+    """
+
+    def __init__(
+        self,
+        texts: Sequence[Optional[str]],
+        depth: Optional[int] = None,
+        max_ahead_mb: Optional[float] = None,
+        max_rss_mb: Optional[float] = None,
+    ):
+        self._texts = list(texts)
+        self.depth = DEFAULT_PREFETCH_DEPTH if depth is None else max(0, depth)
+        self.max_ahead_bytes = int((DEFAULT_PREFETCH_MAX_MB if max_ahead_mb is None else max_ahead_mb) * 1024 * 1024)
+        rss_mb = DEFAULT_PREFETCH_MAX_RSS_MB if max_rss_mb is None else max_rss_mb
+        self.max_rss_bytes = int(rss_mb * 1024 * 1024) if rss_mb > 0 else 0
+        self._current = -1
+        self._closed = False
+        self._ahead: Dict[int, int] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self.prefetched = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def start(self) -> "NarrationPrefetcher":
+        from core.render_cache import get_narration_cache
+
+        if self._thread is not None or self.depth == 0 or not any(self._texts):
+            return self
+        if not get_narration_cache().enabled:
+            logger.info("Pré-síntese da narração desativada: cache de narração desligado (SALMO_NARRATION_CACHE=0)")
+            return self
+        logger.info(
+            "Pré-síntese da narração: até %d item(ns) à frente, %.0f MB de áudio%s",
+            self.depth, self.max_ahead_bytes / 1024 / 1024,
+            f", RSS até {self.max_rss_bytes / 1024 / 1024:.0f} MB" if self.max_rss_bytes else "",
+        )
+        self._thread = threading.Thread(target=self._run, name="narration-prefetch", daemon=True)
+        self._thread.start()
+        return self
+
+    def begin(self, index: int) -> None:
+        """O consumidor começou o item index: a janela de antecipação avança."""
+        with self._cond:
+            self._current = max(self._current, index)
+            for i in [i for i in self._ahead if i <= self._current]:
+                del self._ahead[i]
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Para de antecipar; espera a síntese em andamento terminar (ela fica no cache)."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            logger.info(
+                "Pré-síntese da narração: %d sintetizada(s), %d já em cache, %d falha(s)",
+                self.prefetched, self.skipped, self.failed,
+            )
+
+    def __enter__(self) -> "NarrationPrefetcher":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _blocked(self, index: int) -> Optional[str]:
+        """Motivo para ainda não antecipar o item index (None → pode)."""
+        if index > self._current + self.depth:
+            return "profundidade"
+        if sum(self._ahead.values()) >= self.max_ahead_bytes:
+            return "áudio à frente"
+        if self.max_rss_bytes:
+            rss = rss_bytes()
+            if rss is not None and rss >= self.max_rss_bytes:
+                return f"RSS {rss / 1024 / 1024:.0f} MB"
+        return None
+
+    def _run(self) -> None:
+        for index, text in enumerate(self._texts):
+            if not text:
+                continue
+            with self._cond:
+                reason = None
+                while not self._closed and index > self._current:
+                    blocked = self._blocked(index)
+                    if blocked is None:
+                        break
+                    if blocked != reason:
+                        logger.debug("Pré-síntese do item %d aguardando (%s)", index + 1, blocked)
+                        reason = blocked
+                    # Timeout: o RSS muda sem notify
+                    self._cond.wait(timeout=1.0)
+                if self._closed:
+                    return
+                if index <= self._current:
+                    continue  # o consumidor já chegou nele
+            self._prefetch(index, text)
+
+    def _prefetch(self, index: int, text: str) -> None:
+        from core import cinematic_salmo_pipeline as pipeline
+
+        t0 = time.monotonic()
+        try:
+            inputs = pipeline._narration_inputs(text)
+        except Exception as e:
+            logger.warning("Pré-síntese do item %d: preparação textual falhou (%s)", index + 1, e)
+            self.failed += 1
+            return
+        cache, key = inputs[2], inputs[3]
+        if cache.contains(key) or key in pipeline._pending_narrations:
+            self.skipped += 1
+            return
+
+        future = pipeline._register_pending_narration(key)
+        tmp_dir = tempfile.mkdtemp(prefix="salmo_prefetch_")
+        voice_path = os.path.join(tmp_dir, "voice.mp3")
+        try:
+            asyncio.run(pipeline._synthesize_narration_async(text, voice_path, inputs))
+            size = os.path.getsize(voice_path)
+            with self._cond:
+                if index > self._current:
+                    self._ahead[index] = size
+            self.prefetched += 1
+            logger.info(
+                "Narração do item %d pré-sintetizada em %.1fs (%d KB)", index + 1, time.monotonic() - t0, size // 1024,
+            )
+        except Exception as e:
+            self.failed += 1
+            logger.warning("Pré-síntese da narração do item %d falhou (sintetiza na vez dele): %s", index + 1, e)
+        finally:
+            future.set_result(None)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def run_pipelined(
+    items: Sequence[T],
+    text_of: Callable[[T], Optional[str]],
+    process: Callable[[T], R],
+    depth: Optional[int] = None,
+    max_ahead_mb: Optional[float] = None,
+    max_rss_mb: Optional[float] = None,
+) -> List[R]:
+    """
+    process(item) em sequência, com a narração dos próximos itens em pré-síntese.
+    text_of(item): texto narrado pelo item (o mesmo body_text do pipeline) ou None se não houver.
+    Uma exceção em process interrompe a sequência (a pré-síntese em andamento termina e vai para o cache).
+    """
+    texts = [text_of(item) for item in items]
+    results: List[R] = []
+    with NarrationPrefetcher(texts, depth, max_ahead_mb, max_rss_mb) as prefetcher:
+        for index, item in enumerate(items):
+            prefetcher.begin(index)
+            results.append(process(item))
+    return results
@@ -0,0 +1,119 @@
+"""
+Rasterização de overlays em paralelo (pool de processos).
+
+Cada job = (tipo, args, kwargs) de render_verse_only_overlay / render_header_band / render_retention_frame.
+- FontManager carregado uma vez por worker (initializer), não a cada overlay
+- Layout (WIDTH × HEIGHT: rascunho, outras proporções) repassado do processo pai ao worker
+- Worker devolve só o bounding box RGBA + offset (resultado compacto para o IPC)
+- Ordem dos resultados = ordem dos jobs (montagem da timeline determinística)
+- Cache de overlays (core.render_cache) consultado dentro do worker; contadores somados no processo pai
+- Workers via forkserver/spawn, nunca fork: o estágio overlays:<aspect> roda em paralelo à thread da narração
+  (event loop asyncio + SSL), e fork nesse estado pode herdar locks presos
+"""
+
+import os
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from core.render_plan import OverlayRaster
+
+logger = logging.getLogger(__name__)
+
+# Workers do pool (SALMO_OVERLAY_WORKERS); 0 ou 1 → render sequencial no processo atual
+DEFAULT_OVERLAY_WORKERS = int(os.getenv("SALMO_OVERLAY_WORKERS", str(min(4, os.cpu_count() or 1))) or 1)
+# Abaixo disso, o custo de subir o pool supera o ganho
+MIN_JOBS_FOR_POOL = 3
+
+OverlayJob = Tuple[str, Tuple[Any, ...], Dict[str, Any]]
+
+# forkserver quando disponível (workers saem de um servidor limpo, sem as threads do pai); senão spawn
+_POOL_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+__all__ = [
+    "DEFAULT_OVERLAY_WORKERS",
+    "OverlayRaster",
+    "render_overlays",
+]
+
+
+_worker_fonts_dir: Optional[str] = None
+
+
+def _init_worker(fonts_dir: Optional[str], layout: Tuple[int, int]) -> None:
+    """Initializer: aplica o layout do processo pai e carrega a fonte de marca uma única vez no worker."""
+    global _worker_fonts_dir
+    from core.cinematic_salmo_pipeline import _get_brand_font_manager, _brand_font_fingerprint, set_render_layout
+    _worker_fonts_dir = fonts_dir
+    set_render_layout(*layout)
+    _get_brand_font_manager(fonts_dir)
+    _brand_font_fingerprint(fonts_dir)
+
+
+def _render_job(job: OverlayJob, fonts_dir: Optional[str] = None) -> Tuple[OverlayRaster, Dict[str, int]]:
+    from core import cinematic_salmo_pipeline as pipeline
+    from core.render_cache import get_overlay_cache
+
+    renderers = {
+        "verse": pipeline.render_verse_only_overlay,
+        "header": pipeline.render_header_band,
+        "retention": pipeline.render_retention_frame,
+    }
+    kind, args, kwargs = job
+    cache = get_overlay_cache()
+    before = cache.stats()
+    raster = pipeline._cached_overlay(kind, renderers[kind], *args, fonts_dir=fonts_dir, **kwargs)
+    after = cache.stats()
+    return raster, {k: after[k] - before[k] for k in after}
+
+
+def _render_job_in_worker(job: OverlayJob) -> Tuple[OverlayRaster, Dict[str, int]]:
+    return _render_job(job, _worker_fonts_dir)
+
+
+def render_overlays(
+    jobs: Sequence[OverlayJob],
+    fonts_dir: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> List[OverlayRaster]:
+    """
+    Renderiza os jobs (tipo, args, kwargs) e retorna os recortes na mesma ordem.
+    workers=None → DEFAULT_OVERLAY_WORKERS. Falha do pool → render sequencial.
+    """
+    from core.stage_profiler import profile_section
+
+    with profile_section("overlays"):
+        return _render_overlays(jobs, fonts_dir, workers)
+
+
+def _render_overlays(
+    jobs: Sequence[OverlayJob],
+    fonts_dir: Optional[str],
+    workers: Optional[int],
+) -> List[OverlayRaster]:
+    n_workers = DEFAULT_OVERLAY_WORKERS if workers is None else workers
+    n_workers = max(1, min(n_workers, len(jobs)))
+    results: Optional[List[Tuple[OverlayRaster, Dict[str, int]]]] = None
+    if n_workers > 1 and len(jobs) >= MIN_JOBS_FOR_POOL:
+        from core import cinematic_salmo_pipeline as pipeline
+        layout = (pipeline.WIDTH, pipeline.HEIGHT)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context(_POOL_START_METHOD),
+                initializer=_init_worker,
+                initargs=(fonts_dir, layout),
+            ) as pool:
+                results = list(pool.map(_render_job_in_worker, jobs, chunksize=max(1, len(jobs) // (n_workers * 4))))
+            logger.info("      Overlays rasterizados em paralelo: %d jobs, %d workers", len(jobs), n_workers)
+        except (OSError, RuntimeError) as e:
+            logger.warning("Pool de overlays indisponível (%s); renderizando em sequência", e)
+            results = None
+    if results is None:
+        # Em processo: o cache local já contabiliza hits/misses
+        return [_render_job(job, fonts_dir)[0] for job in jobs]
+
+    from core.render_cache import get_overlay_cache
+    get_overlay_cache().merge_stats([delta for _, delta in results])
+    return [raster for raster, _ in results]
@@ -0,0 +1,297 @@
+"""
+Eventos de progresso estruturados: export (frames), TTS e upload (bytes), com taxa atual e ETA.
+
+Dois destinos, ambos opcionais:
+- Callbacks no processo: add_progress_listener(fn) → fn(evento) para cada evento (exceção no callback só gera aviso)
+- JSON Lines: SALMO_PROGRESS_FILE=<arquivo> (main.py --progress-file; "-" → stderr). Uma linha por evento, anexada;
+  herdado pelos workers de render (--batch, pipeline assíncrono), que escrevem no mesmo arquivo
+Evento: {"event": "progress", "kind": "export"|"tts"|"upload", "phase": "start"|"progress"|"end"|"error",
+"target" (MP4, MP3 ou arquivo enviado), "done", "total", "unit" ("frames"|"bytes"), "pct", "rate" (unidades/s na
+última janela; fps no export), "avg_rate", "eta_s", "elapsed_s", "ts", "pid", "job" (SALMO_JOB_ID) e campos extras
+(engine, platform...)}. Eventos "progress" saem no máximo a cada SALMO_PROGRESS_INTERVAL segundos por alvo:
+um job sem eventos por vários intervalos está parado.
+Sem callback nem arquivo, track() devolve um rastreador nulo (sem custo nos loops de frames).
+"""
+
+import os
+import sys
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Intervalo mínimo entre eventos "progress" do mesmo alvo (SALMO_PROGRESS_INTERVAL, segundos)
+DEFAULT_PROGRESS_INTERVAL = max(0.05, float(os.getenv("SALMO_PROGRESS_INTERVAL", "1.0") or 1.0))
+
+ProgressListener = Callable[[Dict[str, Any]], None]
+
+__all__ = [
+    "DEFAULT_PROGRESS_INTERVAL",
+    "ProgressListener",
+    "ProgressTracker",
+    "add_progress_listener",
+    "moviepy_logger",
+    "polling",
+    "progress_enabled",
+    "remove_progress_listener",
+    "track",
+]
+
+_listeners: List[ProgressListener] = []
+_write_lock = threading.Lock()
+_failed_listeners: set = set()
+
+
+def add_progress_listener(listener: ProgressListener) -> ProgressListener:
+    """Registra um callback de eventos de progresso neste processo; retorna o próprio callback."""
+    if listener not in _listeners:
+        _listeners.append(listener)
+    return listener
+
+
+def remove_progress_listener(listener: ProgressListener) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def _progress_file() -> Optional[str]:
+    return os.getenv("SALMO_PROGRESS_FILE", "").strip() or None
+
+
+def progress_enabled() -> bool:
+    return bool(_listeners) or _progress_file() is not None
+
+
+def _emit(event: Dict[str, Any]) -> None:
+    for listener in list(_listeners):
+        try:
+            listener(event)
+        except Exception as e:
+            if id(listener) not in _failed_listeners:
+                _failed_listeners.add(id(listener))
+                logger.warning("Callback de progresso falhou (ignorado daqui em diante no log): %s", e)
+    path = _progress_file()
+    if path is None:
+        return
+    line = json.dumps(event, ensure_ascii=False, default=str) + "\n"
+    try:
+        with _write_lock:
+            if path == "-":
+                sys.stderr.write(line)
+                sys.stderr.flush()
+            else:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(line)
+    except OSError as e:
+        logger.warning("Evento de progresso não gravado em %s: %s", path, e)
+
+
+class ProgressTracker:
+    """
+    Progresso de um alvo (um MP4, um MP3, um upload). update(done)/advance(n) de qualquer thread;
+    start/finish/fail (ou with) emitem os eventos de início e fim sempre, os intermediários com throttle.
+    """
+
+    active = True
+
+    def __init__(
+        self,
+        kind: str,
+        target: str,
+        total: Optional[float] = None,
+        unit: str = "frames",
+        interval: Optional[float] = None,
+        **fields: Any,
+    ):
+        self.kind = kind
+        self.target = target
+        self.total = total
+        self.unit = unit
+        self.interval = DEFAULT_PROGRESS_INTERVAL if interval is None else interval
+        self.fields = fields
+        self.done = 0.0
+        self._t0 = time.monotonic()
+        self._last_t = self._t0
+        self._last_done = 0.0
+        self._rate: Optional[float] = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def set_total(self, total: Optional[float]) -> None:
+        self.total = total
+
+    def _event(self, phase: str, **extra: Any) -> Dict[str, Any]:
+        elapsed = time.monotonic() - self._t0
+        avg = self.done / elapsed if elapsed > 0 and self.done else None
+        rate = self._rate if self._rate is not None else avg
+        remaining = max(0.0, self.total - self.done) if self.total is not None else None
+        event: Dict[str, Any] = {
+            "event": "progress",
+            "kind": self.kind,
+            "phase": phase,
+            "target": self.target,
+            "done": int(self.done) if float(self.done).is_integer() else round(self.done, 3),
+            "total": self.total,
+            "unit": self.unit,
+            "pct": round(100.0 * self.done / self.total, 1) if self.total else None,
+            "rate": round(rate, 2) if rate is not None else None,
+            "avg_rate": round(avg, 2) if avg is not None else None,
+            "eta_s": round(remaining / rate, 1) if remaining is not None and rate else None,
+            "elapsed_s": round(elapsed, 2),
+            "ts": datetime.now().astimezone().isoformat(timespec="milliseconds"),
+            "pid": os.getpid(),
+        }
+        job = os.getenv("SALMO_JOB_ID", "").strip()
+        if job:
+            event["job"] = job
+        event.update(self.fields)
+        event.update(extra)
+        return event
+
+    def start(self) -> "ProgressTracker":
+        with self._lock:
+            self._t0 = self._last_t = time.monotonic()
+            event = self._event("start")
+        _emit(event)
+        return self
+
+    def update(self, done: float) -> None:
+        """Total processado até agora (frames escritos, bytes recebidos/enviados)."""
+        now = time.monotonic()
+        with self._lock:
+            if self._closed:
+                return
+            self.done = done
+            window = now - self._last_t
+            if window < self.interval:
+                return
+            current = (done - self._last_done) / window
+            # Média móvel: fps estável sem esconder uma queda (encoder travado → rate cai em poucos eventos)
+            self._rate = current if self._rate is None else 0.5 * self._rate + 0.5 * current
+            self._last_t, self._last_done = now, done
+            event = self._event("progress")
+        _emit(event)
+
+    def advance(self, n: float = 1) -> None:
+        self.update(self.done + n)
+
+    def finish(self, **extra: Any) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self.total is not None and self.done > self.total:
+                self.total = self.done  # estimativa de frames do MoviePy pode ficar 1 abaixo
+            elapsed = time.monotonic() - self._t0
+            self._rate = self.done / elapsed if elapsed > 0 else None
+            event = self._event("end", **extra)
+        _emit(event)
+
+    def fail(self, error: Any) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            event = self._event("error", error=str(error))
+        _emit(event)
+
+    def __enter__(self) -> "ProgressTracker":
+        return self.start()
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc is not None:
+            self.fail(exc)
+        else:
+            self.finish()
+
+
+class _NullTracker(ProgressTracker):
+    """Sem destinos: nenhum evento, nenhum relógio."""
+
+    active = False
+
+    def __init__(self) -> None:
+        self.done = 0.0
+        self.total = None
+
+    def set_total(self, total: Optional[float]) -> None:
+        pass
+
+    def start(self) -> "ProgressTracker":
+        return self
+
+    def update(self, done: float) -> None:
+        pass
+
+    def advance(self, n: float = 1) -> None:
+        pass
+
+    def finish(self, **extra: Any) -> None:
+        pass
+
+    def fail(self, error: Any) -> None:
+        pass
+
+
+_NULL_TRACKER = _NullTracker()
+
+
+def track(kind: str, target: str, total: Optional[float] = None, unit: str = "frames", **fields: Any) -> ProgressTracker:
+    """Rastreador para um alvo (nulo se não houver callback nem SALMO_PROGRESS_FILE)."""
+    if not progress_enabled():
+        return _NULL_TRACKER
+    return ProgressTracker(kind, target, total, unit, **fields)
+
+
+@contextmanager
+def polling(
+    tracker: Optional[ProgressTracker],
+    read: Callable[[], float],
+    interval: Optional[float] = None,
+) -> Iterator[None]:
+    """
+    Lê read() (ex.: contador de frames compartilhado com os workers) numa thread e repassa ao tracker
+    enquanto o bloco roda. Sem tracker ou tracker nulo → nada é iniciado.
+    """
+    if tracker is None or not tracker.active:
+        yield
+        return
+    stop = threading.Event()
+    period = tracker.interval if interval is None else interval
+
+    def _poll() -> None:
+        while not stop.wait(period):
+            tracker.update(read())
+
+    thread = threading.Thread(target=_poll, name="progress-poll", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+        tracker.update(read())
+
+
+def moviepy_logger(tracker: ProgressTracker) -> Any:
+    """
+    Logger do write_videofile (proglog) que repassa o índice do frame ao tracker.
+    Tracker nulo → None (o MoviePy fica em silêncio, como antes).
+    """
+    if not tracker.active:
+        return None
+    import proglog
+
+    class _MoviePyProgress(proglog.ProgressBarLogger):
+        def bars_callback(self, bar: str, attr: str, value: Any, old_value: Any = None) -> None:
+            # "t": frames do vídeo; "chunk": áudio, escrito antes e rápido
+            if bar == "t" and attr == "index":
+                tracker.update(value + 1)
+
+    return _MoviePyProgress()
@@ -0,0 +1,574 @@
+"""
+Caches persistentes do pipeline cinematográfico (em disco, compartilhados entre execuções e workers).
+
+- GradedBackgroundCache: fundos já graduados (dark cinematic + glow) em .npy, lidos com memory mapping
+  → lotes e workers concorrentes compartilham uma única cópia (page cache do SO).
+  Chave = hash dos pixels do fundo (já recortado) + parâmetros de grading + flag golden + versão do cache.
+- OverlayCache: overlays de texto (verso, header, retenção) como RGBA recortado + offset (.npz comprimido),
+  devolvidos como core.render_plan.OverlayRaster.
+  Chave = texto/argumentos + hash dos arquivos de fonte + constantes de layout. Eviction LRU por tamanho.
+- NarrationCache: voz (TTS) + tempos das frases (alinhamento) por texto/voz — um rascunho e o render
+  final (ou várias proporções) usam a mesma narração, sem sintetizar de novo.
+- EncodedChunkCache: trechos de vídeo já codificados (alinhados ao GOP) por assinatura das entradas
+  → re-render incremental (core.incremental_render) só codifica o que mudou. Eviction LRU por tamanho.
+- VideoCache: resultado final (MP4 de cada proporção + voz) por hash de todas as entradas do render
+  → republicar ou repetir um upload que falhou não renderiza de novo. Eviction LRU por tamanho em disco.
+Escrita atômica (arquivo temporário + os.replace): seguro com vários processos.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Incrementar quando a lógica de grading mudar (invalida entradas antigas)
+BG_CACHE_VERSION = 1
+OVERLAY_CACHE_VERSION = 1
+NARRATION_CACHE_VERSION = 1
+VIDEO_CACHE_VERSION = 1
+CHUNK_CACHE_VERSION = 1
+# Limite do cache de overlays em disco (MB); os menos usados recentemente são removidos
+OVERLAY_CACHE_MAX_MB = float(os.getenv("SALMO_OVERLAY_CACHE_MB", "256") or 256)
+# Limite do cache de vídeos finais em disco (MB)
+VIDEO_CACHE_MAX_MB = float(os.getenv("SALMO_VIDEO_CACHE_MB", "4096") or 4096)
+# Limite do cache de trechos codificados (MB)
+CHUNK_CACHE_MAX_MB = float(os.getenv("SALMO_CHUNK_CACHE_MB", "2048") or 2048)
+
+__all__ = [
+    "default_cache_dir",
+    "image_content_hash",
+    "GradedBackgroundCache",
+    "get_background_cache",
+    "file_content_hash",
+    "OverlayCache",
+    "get_overlay_cache",
+    "NarrationCache",
+    "get_narration_cache",
+    "EncodedChunkCache",
+    "get_chunk_cache",
+    "VideoCache",
+    "get_video_cache",
+]
+
+
+def default_cache_dir() -> Path:
+    """SALMO_CACHE_DIR ou outputs/cache na raiz do projeto."""
+    env_dir = os.getenv("SALMO_CACHE_DIR")
+    if env_dir and env_dir.strip():
+        return Path(env_dir.strip())
+    return Path(__file__).resolve().parents[1] / "outputs" / "cache"
+
+
+def _env_enabled(name: str) -> bool:
+    return os.getenv(name, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+_file_hash_memo: Dict[Tuple[str, int, int], str] = {}
+
+
+def _file_sha256(path: str) -> str:
+    """SHA-256 do arquivo, memoizado por (caminho, mtime, tamanho) no processo."""
+    st = os.stat(path)
+    memo_key = (os.path.abspath(path), int(st.st_mtime_ns), int(st.st_size))
+    cached = _file_hash_memo.get(memo_key)
+    if cached:
+        return cached
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    digest = h.hexdigest()
+    _file_hash_memo[memo_key] = digest
+    return digest
+
+
+def file_content_hash(path: str) -> str:
+    """SHA-256 do arquivo (memoizado no processo); "" se o arquivo não existir."""
+    if not path or not os.path.isfile(path):
+        return ""
+    return _file_sha256(path)
+
+
+def _atomic_write(directory: Path, path: Path, suffix: str, write: Callable[[Any], None]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(suffix=suffix, dir=str(directory))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _copy_file(src: Path, dest: Path) -> None:
+    """
+    Cópia independente de src em dest (temporário + os.replace). Nunca hard link: os motores regravam a saída
+    no lugar (ffmpeg -y), o que alteraria também a entrada do cache ligada ao mesmo inode.
+    """
+    fd, tmp = tempfile.mkstemp(prefix=".tmp_", suffix=dest.suffix, dir=str(dest.parent))
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _evict_lru_files(paths: Iterable[Path], max_bytes: int) -> int:
+    """Apaga os arquivos de mtime mais antigo até o total caber em max_bytes. Retorna quantos saíram."""
+    entries = []
+    total = 0
+    for p in paths:
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, p))
+        total += st.st_size
+    removed = 0
+    for _, size, p in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            p.unlink()
+            total -= size
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def image_content_hash(img: Image.Image) -> str:
+    """
+    Hash de conteúdo da imagem: SHA-256 dos pixels + modo e tamanho (~15 ms num quadro 1080x1920).
+    Os pixels, e não o arquivo de origem: recortes diferentes do mesmo asset no mesmo tamanho não colidem.
+    """
+    return hashlib.sha256(img.tobytes()).hexdigest() + f":{img.mode}:{img.size[0]}x{img.size[1]}"
+
+
+class GradedBackgroundCache:
+    """
+    Cache em disco de fundos graduados (np.ndarray RGB uint8), armazenados como .npy.
+    Leituras usam np.load(mmap_mode="r"): o array retornado é somente leitura.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, enabled: bool = True):
+        self.cache_dir = Path(cache_dir or default_cache_dir()) / "backgrounds"
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def key(self, img: Image.Image, params: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"v": BG_CACHE_VERSION, "src": image_content_hash(img), "params": params},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def get_or_create(
+        self,
+        img: Image.Image,
+        params: Dict[str, Any],
+        build: Callable[[], np.ndarray],
+    ) -> np.ndarray:
+        """Retorna o fundo do cache (memmap) ou chama build(), grava e retorna o resultado."""
+        if not self.enabled:
+            return build()
+        path = self.cache_dir / f"{self.key(img, params)}.npy"
+        if path.is_file():
+            try:
+                arr = np.load(path, mmap_mode="r")
+                with self._lock:
+                    self.hits += 1
+                return arr
+            except (OSError, ValueError) as e:
+                logger.warning("Cache de fundo corrompido (%s), regenerando: %s", path.name, e)
+        with self._lock:
+            self.misses += 1
+        arr = np.ascontiguousarray(build())
+        try:
+            _atomic_write(self.cache_dir, path, ".npy.tmp", lambda f: np.save(f, arr))
+        except OSError as e:
+            logger.warning("Não foi possível gravar cache de fundo: %s", e)
+        return arr
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+_background_cache: Optional[GradedBackgroundCache] = None
+
+
+def get_background_cache() -> GradedBackgroundCache:
+    """Instância compartilhada no processo (SALMO_BG_CACHE=0 desativa)."""
+    global _background_cache
+    if _background_cache is None:
+        _background_cache = GradedBackgroundCache(enabled=_env_enabled("SALMO_BG_CACHE"))
+    return _background_cache
+
+
+class OverlayCache:
+    """
+    Cache em disco de overlays RGBA. Cada entrada guarda só o bounding box não transparente
+    (rgba recortado + offset + tamanho do quadro) em .npz comprimido.
+    Acesso atualiza o mtime da entrada; ao gravar, as entradas mais antigas saem até caber em max_bytes.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, enabled: bool = True, max_bytes: Optional[int] = None):
+        self.cache_dir = Path(cache_dir or default_cache_dir()) / "overlays"
+        self.enabled = enabled
+        self.max_bytes = int(max_bytes if max_bytes is not None else OVERLAY_CACHE_MAX_MB * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def key(self, params: Dict[str, Any]) -> str:
+        payload = json.dumps({"v": OVERLAY_CACHE_VERSION, "params": params}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def _load(self, path: Path):
+        from core.render_plan import OverlayRaster
+        with np.load(path) as data:
+            crop = data["rgba"]
+            x, y = (int(v) for v in data["offset"])
+            w, h = (int(v) for v in data["size"])
+        return OverlayRaster(crop, x, y, (w, h))
+
+    def _store(self, path: Path, raster) -> None:
+        _atomic_write(
+            self.cache_dir,
+            path,
+            ".npz.tmp",
+            lambda f: np.savez_compressed(
+                f,
+                rgba=raster.rgba,
+                offset=np.array((raster.x, raster.y), dtype=np.int32),
+                size=np.array(raster.size, dtype=np.int32),
+            ),
+        )
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove as entradas menos usadas recentemente (mtime) até o total caber em max_bytes."""
+        removed = _evict_lru_files(self.cache_dir.glob("*.npz"), self.max_bytes)
+        if removed:
+            with self._lock:
+                self.evictions += removed
+
+    def get_or_render(self, params: Dict[str, Any], render: Callable[[], Image.Image]):
+        """
+        Overlay recortado (core.render_plan.OverlayRaster) do cache — sem rasterizar texto —
+        ou render() recortado e gravado para as próximas execuções.
+        """
+        from core.render_plan import crop_rgba
+        if not self.enabled:
+            return crop_rgba(np.asarray(render().convert("RGBA")))
+        path = self.cache_dir / f"{self.key(params)}.npz"
+        if path.is_file():
+            try:
+                raster = self._load(path)
+                try:
+                    os.utime(path, None)
+                except OSError:
+                    pass
+                with self._lock:
+                    self.hits += 1
+                return raster
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("Cache de overlay corrompido (%s), regenerando: %s", path.name, e)
+        with self._lock:
+            self.misses += 1
+        raster = crop_rgba(np.asarray(render().convert("RGBA")))
+        try:
+            self._store(path, raster)
+        except OSError as e:
+            logger.warning("Não foi possível gravar cache de overlay: %s", e)
+        return raster
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def merge_stats(self, deltas: Sequence[Dict[str, int]]) -> None:
+        """Soma contadores vindos de workers (core.overlay_pool) aos deste processo."""
+        with self._lock:
+            for d in deltas:
+                self.hits += d.get("hits", 0)
+                self.misses += d.get("misses", 0)
+                self.evictions += d.get("evictions", 0)
+
+
+_overlay_cache: Optional[OverlayCache] = None
+
+
+def get_overlay_cache() -> OverlayCache:
+    """Instância compartilhada no processo (SALMO_OVERLAY_CACHE=0 desativa)."""
+    global _overlay_cache
+    if _overlay_cache is None:
+        _overlay_cache = OverlayCache(enabled=_env_enabled("SALMO_OVERLAY_CACHE"))
+    return _overlay_cache
+
+
+class NarrationCache:
+    """
+    Cache em disco da narração: <chave>/voice.mp3 + <chave>/timings.json (phrase_segments).
+    Entrada gravada num diretório temporário e renomeada de uma vez (nunca lida pela metade).
+    """
+
+    VOICE_FILE = "voice.mp3"
+    TIMINGS_FILE = "timings.json"
+
+    def __init__(self, cache_dir: Optional[Path] = None, enabled: bool = True):
+        self.cache_dir = Path(cache_dir or default_cache_dir()) / "narration"
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, params: Dict[str, Any]) -> str:
+        payload = json.dumps({"v": NARRATION_CACHE_VERSION, "params": params}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def contains(self, key: str) -> bool:
+        """Entrada completa no disco (sem copiar nem contar hit/miss)."""
+        entry = self.cache_dir / key
+        return self.enabled and (entry / self.VOICE_FILE).is_file() and (entry / self.TIMINGS_FILE).is_file()
+
+    def load(self, key: str, voice_dest: str) -> Optional[List[Dict[str, Any]]]:
+        """Copia a voz para voice_dest e retorna phrase_segments; None se não houver entrada."""
+        entry = self.cache_dir / key
+        voice, timings = entry / self.VOICE_FILE, entry / self.TIMINGS_FILE
+        if not (self.enabled and voice.is_file() and timings.is_file()):
+            self.misses += 1
+            return None
+        try:
+            segments = json.loads(timings.read_text(encoding="utf-8"))
+            os.makedirs(os.path.dirname(voice_dest) or ".", exist_ok=True)
+            shutil.copyfile(voice, voice_dest)
+        except (OSError, ValueError) as e:
+            logger.warning("Cache de narração ilegível (%s): %s", key, e)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return segments
+
+    def store(self, key: str, voice_path: str, segments: List[Dict[str, Any]]) -> None:
+        if not self.enabled:
+            return
+        entry = self.cache_dir / key
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = Path(tempfile.mkdtemp(prefix=".tmp_", dir=str(self.cache_dir)))
+            shutil.copyfile(voice_path, tmp / self.VOICE_FILE)
+            (tmp / self.TIMINGS_FILE).write_text(json.dumps(segments, ensure_ascii=False), encoding="utf-8")
+            try:
+                os.rename(tmp, entry)
+            except OSError:
+                shutil.rmtree(tmp, ignore_errors=True)  # outro processo gravou a mesma entrada
+        except OSError as e:
+            logger.warning("Não foi possível gravar cache de narração: %s", e)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+_narration_cache: Optional[NarrationCache] = None
+
+
+def get_narration_cache() -> NarrationCache:
+    """Instância compartilhada no processo (SALMO_NARRATION_CACHE=0 desativa)."""
+    global _narration_cache
+    if _narration_cache is None:
+        _narration_cache = NarrationCache(enabled=_env_enabled("SALMO_NARRATION_CACHE"))
+    return _narration_cache
+
+
+class EncodedChunkCache:
+    """
+    Cache em disco de trechos codificados: <assinatura>.mp4 (só vídeo, começa num IDR, GOP fixo).
+    O encoder grava em temp_path() e commit() publica com os.replace; lookup() atualiza o mtime.
+    Ao gravar, os trechos menos usados recentemente saem até caber em max_bytes.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, enabled: bool = True, max_bytes: Optional[int] = None):
+        self.cache_dir = Path(cache_dir or default_cache_dir()) / "chunks"
+        self.enabled = enabled
+        self.max_bytes = int(max_bytes if max_bytes is not None else CHUNK_CACHE_MAX_MB * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, params: Dict[str, Any]) -> str:
+        payload = json.dumps({"v": CHUNK_CACHE_VERSION, "params": params}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def lookup(self, key: str) -> Optional[Path]:
+        """Arquivo do trecho já codificado ou None."""
+        path = self.cache_dir / f"{key}.mp4"
+        if self.enabled and path.is_file() and path.stat().st_size > 0:
+            try:
+                os.utime(path, None)
+            except OSError:
+                pass
+            self.hits += 1
+            return path
+        self.misses += 1
+        return None
+
+    def temp_path(self, key: str) -> Path:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return self.cache_dir / f".tmp_{key}_{os.getpid()}.mp4"
+
+    def commit(self, key: str, tmp: Path) -> Path:
+        """Publica o trecho codificado em tmp sob a chave; retorna o caminho final."""
+        path = self.cache_dir / f"{key}.mp4"
+        os.replace(tmp, path)
+        self.evictions += _evict_lru_files(self.cache_dir.glob("[!.]*.mp4"), self.max_bytes)
+        return path
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+_chunk_cache: Optional[EncodedChunkCache] = None
+
+
+def get_chunk_cache() -> EncodedChunkCache:
+    """Instância compartilhada no processo (SALMO_CHUNK_CACHE=0 desativa o reaproveitamento)."""
+    global _chunk_cache
+    if _chunk_cache is None:
+        _chunk_cache = EncodedChunkCache(enabled=_env_enabled("SALMO_CHUNK_CACHE"))
+    return _chunk_cache
+
+
+class VideoCache:
+    """
+    Cache em disco do resultado final: <chave>/manifest.json + um MP4 por proporção + voice.mp3.
+    Entrada gravada num diretório temporário e renomeada de uma vez; leitura atualiza o mtime da entrada.
+    Ao gravar, as entradas menos usadas recentemente saem até o total caber em max_bytes.
+    """
+
+    MANIFEST_FILE = "manifest.json"
+    VOICE_FILE = "voice.mp3"
+
+    def __init__(self, cache_dir: Optional[Path] = None, enabled: bool = True, max_bytes: Optional[int] = None):
+        self.cache_dir = Path(cache_dir or default_cache_dir()) / "videos"
+        self.enabled = enabled
+        self.max_bytes = int(max_bytes if max_bytes is not None else VIDEO_CACHE_MAX_MB * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, params: Dict[str, Any]) -> str:
+        payload = json.dumps({"v": VIDEO_CACHE_VERSION, "params": params}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def load(self, key: str, video_dests: Dict[str, str], voice_dest: str) -> Optional[Dict[str, Any]]:
+        """
+        Coloca os MP4 de cada proporção em video_dests[proporção] e a voz em voice_dest (cópias, nunca links para a entrada).
+        Retorna o manifesto gravado; None se não houver entrada completa para todas as proporções.
+        """
+        entry = self.cache_dir / key
+        manifest_path = entry / self.MANIFEST_FILE
+        if not (self.enabled and manifest_path.is_file()):
+            self.misses += 1
+            return None
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            files = manifest.get("renditions", {})
+            if set(video_dests) - set(files):
+                self.misses += 1
+                return None
+            for aspect, dest in video_dests.items():
+                os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+                _copy_file(entry / files[aspect], Path(dest))
+            os.makedirs(os.path.dirname(voice_dest) or ".", exist_ok=True)
+            _copy_file(entry / self.VOICE_FILE, Path(voice_dest))
+            os.utime(entry, None)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Cache de vídeo ilegível (%s): %s", key, e)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return manifest
+
+    def store(self, key: str, renditions: Dict[str, str], voice_path: str, meta: Optional[Dict[str, Any]] = None) -> None:
+        if not self.enabled:
+            return
+        entry = self.cache_dir / key
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = Path(tempfile.mkdtemp(prefix=".tmp_", dir=str(self.cache_dir)))
+            files: Dict[str, str] = {}
+            for aspect, path in renditions.items():
+                name = "video_" + aspect.replace(":", "x") + ".mp4"
+                _copy_file(Path(path), tmp / name)
+                files[aspect] = name
+            _copy_file(Path(voice_path), tmp / self.VOICE_FILE)
+            manifest = dict(meta or {}, renditions=files)
+            (tmp / self.MANIFEST_FILE).write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+            if entry.exists():
+                shutil.rmtree(entry, ignore_errors=True)  # --no-cache: resultado novo substitui o antigo
+            try:
+                os.rename(tmp, entry)
+            except OSError:
+                shutil.rmtree(tmp, ignore_errors=True)  # outro processo gravou a mesma entrada
+        except OSError as e:
+            logger.warning("Não foi possível gravar cache de vídeo: %s", e)
+            return
+        self._evict(keep=entry)
+
+    def _evict(self, keep: Optional[Path] = None) -> None:
+        """Remove as entradas menos usadas recentemente (mtime do diretório) até caber em max_bytes."""
+        entries = []
+        total = 0
+        for d in self.cache_dir.iterdir():
+            if not d.is_dir() or d.name.startswith(".tmp_"):
+                continue
+            try:
+                size = sum(f.stat().st_size for f in d.iterdir() if f.is_file())
+                entries.append((d.stat().st_mtime, size, d))
+            except OSError:
+                continue
+            total += size
+        for _, size, d in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if keep is not None and d == keep:
+                continue
+            shutil.rmtree(d, ignore_errors=True)
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+_video_cache: Optional[VideoCache] = None
+
+
+def get_video_cache() -> VideoCache:
+    """Instância compartilhada no processo (SALMO_VIDEO_CACHE=0 desativa)."""
+    global _video_cache
+    if _video_cache is None:
+        _video_cache = VideoCache(enabled=_env_enabled("SALMO_VIDEO_CACHE"))
+    return _video_cache
@@ -0,0 +1,189 @@
+"""
+Plano de camadas (render plan) do pipeline cinematográfico.
+
+Descreve o vídeo como dados, independente do motor de render:
+- Fundos com zoom contínuo (Ken Burns) por intervalo de tempo
+- Overlays RGBA (header, versos, referência) com início/fim e fades
+- Overlays sempre recortados ao bounding box (OverlayRaster): nunca um RGBA de quadro inteiro por frase
+Os motores (MoviePy, compositor NumPy) consomem o mesmo plano → mesmo layout.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+__all__ = [
+    "BackgroundLayer",
+    "OverlayLayer",
+    "RenderPlan",
+    "alpha_bbox",
+    "OverlayRaster",
+    "crop_rgba",
+    "overlay_layer_from_rgba",
+    "overlay_layer_from_raster",
+]
+
+
+@dataclass
+class BackgroundLayer:
+    """Fundo RGB (H, W, 3) uint8 exibido em [start, end) com zoom linear zoom_start → zoom_end."""
+
+    image: np.ndarray
+    start: float
+    end: float
+    zoom_start: float = 1.0
+    zoom_end: float = 1.0
+
+    def zoom_at(self, t: float) -> float:
+        """Fator de zoom no instante absoluto t (mesma curva do resize(lambda t: ...) do MoviePy)."""
+        dur = max(0.01, self.end - self.start)
+        progress = min(1.0, max(0.0, (t - self.start) / dur))
+        return self.zoom_start + (self.zoom_end - self.zoom_start) * progress
+
+
+@dataclass
+class OverlayLayer:
+    """
+    Overlay recortado: rgb (h, w, 3) uint8 + alpha (h, w) uint8 posicionados em (x, y).
+    Opacidade = fade-in linear nos primeiros fade_in s e fade-out nos últimos fade_out s.
+    """
+
+    rgb: np.ndarray
+    alpha: np.ndarray
+    x: int
+    y: int
+    start: float
+    end: float
+    fade_in: float = 0.0
+    fade_out: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        return max(0.0, self.end - self.start)
+
+    def opacity_at(self, t: np.ndarray) -> np.ndarray:
+        """Opacidade (0–1) para tempos absolutos t (vetorizado; mesma curva de fadein/fadeout do MoviePy)."""
+        local = np.asarray(t, dtype=np.float64) - self.start
+        op = np.ones_like(local)
+        if self.fade_in > 0:
+            op = np.minimum(op, local / self.fade_in)
+        if self.fade_out > 0:
+            op = np.minimum(op, (self.duration - local) / self.fade_out)
+        return np.clip(op, 0.0, 1.0)
+
+
+@dataclass
+class RenderPlan:
+    """Plano completo de um vídeo: tamanho, fps, duração, camadas (ordem = z-order) e áudio já mixado."""
+
+    size: Tuple[int, int]
+    fps: int
+    duration: float
+    backgrounds: List[BackgroundLayer] = field(default_factory=list)
+    overlays: List[OverlayLayer] = field(default_factory=list)
+    audio_path: Optional[str] = None
+
+    @property
+    def n_frames(self) -> int:
+        return max(1, int(round(self.duration * self.fps)))
+
+    def background_at(self, t: float) -> BackgroundLayer:
+        """Fundo ativo no instante t (último fundo cobre o fim do vídeo)."""
+        for bg in self.backgrounds:
+            if bg.start <= t < bg.end:
+                return bg
+        return self.backgrounds[-1]
+
+
+def alpha_bbox(alpha: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+    """Bounding box (x0, y0, x1, y1) dos pixels com alpha > 0, ou None se totalmente transparente."""
+    rows = np.flatnonzero(alpha.any(axis=1))
+    if rows.size == 0:
+        return None
+    cols = np.flatnonzero(alpha.any(axis=0))
+    return int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
+
+
+class OverlayRaster(NamedTuple):
+    """Overlay recortado: rgba (h, w, 4) uint8 posicionado em (x, y) num quadro size=(W, H)."""
+    rgba: np.ndarray
+    x: int
+    y: int
+    size: Tuple[int, int]
+
+    @property
+    def is_empty(self) -> bool:
+        return self.rgba.size == 0
+
+    def to_full(self) -> np.ndarray:
+        """Quadro RGBA completo (H, W, 4), transparente fora do recorte."""
+        w, h = self.size
+        full = np.zeros((h, w, 4), dtype=np.uint8)
+        ch, cw = self.rgba.shape[:2]
+        full[self.y:self.y + ch, self.x:self.x + cw] = self.rgba
+        return full
+
+
+def crop_rgba(rgba: np.ndarray, offset: Tuple[int, int] = (0, 0), size: Optional[Tuple[int, int]] = None) -> OverlayRaster:
+    """
+    Recorta um RGBA (H, W, 4) ao bounding box do alpha. offset = posição do array no quadro;
+    size = tamanho do quadro (padrão: o do próprio array). Totalmente transparente → recorte vazio.
+    """
+    frame_size = size or (rgba.shape[1], rgba.shape[0])
+    bbox = alpha_bbox(rgba[..., 3])
+    if bbox is None:
+        return OverlayRaster(np.zeros((0, 0, 4), dtype=np.uint8), 0, 0, frame_size)
+    x0, y0, x1, y1 = bbox
+    return OverlayRaster(np.ascontiguousarray(rgba[y0:y1, x0:x1]), offset[0] + x0, offset[1] + y0, frame_size)
+
+
+def overlay_layer_from_rgba(
+    rgba: np.ndarray,
+    start: float,
+    end: float,
+    fade_in: float = 0.0,
+    fade_out: float = 0.0,
+    offset: Tuple[int, int] = (0, 0),
+) -> Optional[OverlayLayer]:
+    """
+    Converte um overlay RGBA (H, W, 4) em OverlayLayer recortado ao bounding box do alpha.
+    Retorna None se o overlay for totalmente transparente (nada a compor).
+    """
+    bbox = alpha_bbox(rgba[..., 3])
+    if bbox is None:
+        return None
+    x0, y0, x1, y1 = bbox
+    crop = rgba[y0:y1, x0:x1]
+    return OverlayLayer(
+        rgb=np.ascontiguousarray(crop[..., :3]),
+        alpha=np.ascontiguousarray(crop[..., 3]),
+        x=offset[0] + x0,
+        y=offset[1] + y0,
+        start=start,
+        end=end,
+        fade_in=fade_in,
+        fade_out=fade_out,
+    )
+
+
+def overlay_layer_from_raster(
+    raster: OverlayRaster,
+    start: float,
+    end: float,
+    fade_in: float = 0.0,
+    fade_out: float = 0.0,
+) -> Optional[OverlayLayer]:
+    """OverlayLayer a partir de um recorte (sem passar por um quadro inteiro). None se vazio."""
+    if raster.is_empty:
+        return None
+    return OverlayLayer(
+        rgb=np.ascontiguousarray(raster.rgba[..., :3]),
+        alpha=np.ascontiguousarray(raster.rgba[..., 3]),
+        x=raster.x,
+        y=raster.y,
+        start=start,
+        end=end,
+        fade_in=fade_in,
+        fade_out=fade_out,
+    )
@@ -0,0 +1,199 @@
+"""
+Registro estruturado de cada execução do pipeline (métricas para comparar hosts e versões).
+
+Um registro JSON por execução, anexado a um arquivo JSON Lines:
+- durações por etapa e caminho crítico (core.stage_graph), tempo total
+- por proporção: frames, tempo e fps do encode, motor, tamanho do MP4
+- caracteres enviados ao edge-tts, hits/misses dos caches nesta execução (delta dos contadores do processo)
+- run_peak_rss_mb: pico de RSS desta execução (core.memory_sampler, com SALMO_MEMORY_REPORT=1; senão null)
+- process_peak_rss_mb: pico de RSS do processo e dos filhos desde o início do processo (ru_maxrss; em processos
+  que rodam vários vídeos, não é da execução)
+- host, CPUs, PIPELINE_VERSION, motor e perfil de encode; status "ok" | "cached" | "error"
+Arquivo: SALMO_METRICS_FILE (padrão outputs/metrics/pipeline_runs.jsonl); SALMO_METRICS=0 desliga.
+Prometheus (node_exporter textfile collector): SALMO_METRICS_PROM_FILE=<dir>/salmo_pipeline.prom grava os
+valores da última execução como gauges e o total de execuções por status como counter (regravado atomicamente).
+"""
+
+import os
+import json
+import logging
+import platform
+import re
+import socket
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_write_lock = threading.Lock()
+
+__all__ = [
+    "emit_run_record",
+    "metrics_path",
+    "process_peak_rss_mb",
+    "prometheus_path",
+]
+
+
+def _enabled() -> bool:
+    return os.getenv("SALMO_METRICS", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def metrics_path() -> Optional[Path]:
+    """Arquivo JSON Lines das execuções (None se SALMO_METRICS=0)."""
+    if not _enabled():
+        return None
+    env_path = os.getenv("SALMO_METRICS_FILE", "").strip()
+    if env_path:
+        return Path(env_path)
+    return Path(__file__).resolve().parents[1] / "outputs" / "metrics" / "pipeline_runs.jsonl"
+
+
+def prometheus_path() -> Optional[Path]:
+    """Arquivo .prom do textfile collector (SALMO_METRICS_PROM_FILE; None → não grava)."""
+    env_path = os.getenv("SALMO_METRICS_PROM_FILE", "").strip()
+    return Path(env_path) if env_path and _enabled() else None
+
+
+def process_peak_rss_mb() -> Dict[str, Optional[float]]:
+    """
+    Pico de RSS do processo e dos filhos já encerrados (ffmpeg, workers) desde o início do processo, em MB;
+    None sem o módulo resource.
+    """
+    try:
+        import resource
+    except ImportError:
+        return {"self": None, "children": None}
+    # ru_maxrss: KB no Linux, bytes no macOS
+    scale = 1024 * 1024 if platform.system() == "Darwin" else 1024
+    return {
+        "self": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1),
+        "children": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale, 1),
+    }
+
+
+def _host_fields() -> Dict[str, Any]:
+    return {
+        "ts": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "host": socket.gethostname(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "pid": os.getpid(),
+    }
+
+
+def emit_run_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Completa o registro (host, horário, pico de RSS do processo), anexa ao JSON Lines e atualiza o arquivo Prometheus.
+    Falha de escrita só gera aviso: métricas nunca derrubam um render. Retorna o registro completo.
+    """
+    full = {**_host_fields(), **record, "process_peak_rss_mb": process_peak_rss_mb()}
+    path = metrics_path()
+    if path is None:
+        return full
+    line = json.dumps(full, ensure_ascii=False, default=str, sort_keys=True)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _write_lock, open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError as e:
+        logger.warning("Métricas da execução não gravadas em %s: %s", path, e)
+    prom = prometheus_path()
+    if prom is not None:
+        try:
+            with _write_lock:
+                _write_prometheus(prom, full)
+        except OSError as e:
+            logger.warning("Arquivo Prometheus não gravado em %s: %s", prom, e)
+    return full
+
+
+# —— Prometheus textfile ——
+
+_PREFIX = "salmo_pipeline"
+_RUNS_RE = re.compile(rf'^{_PREFIX}_runs_total\{{status="([^"]*)"\}} ([0-9.eE+]+)$')
+
+
+def _number(value: Any) -> str:
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def _previous_runs(path: Path) -> Dict[str, float]:
+    """Counters de execuções do arquivo anterior (acumulam entre processos)."""
+    runs: Dict[str, float] = {}
+    try:
+        for line in path.read_text(encoding="utf-8").splitlines():
+            m = _RUNS_RE.match(line.strip())
+            if m:
+                runs[m.group(1)] = float(m.group(2))
+    except (OSError, ValueError):
+        pass
+    return runs
+
+
+def _write_prometheus(path: Path, record: Dict[str, Any]) -> None:
+    runs = _previous_runs(path)
+    status = record.get("status", "ok")
+    runs[status] = runs.get(status, 0) + 1
+
+    lines: List[str] = []
+
+    def metric(name: str, kind: str, help_text: str, samples: List[tuple]) -> None:
+        samples = [(labels, v) for labels, v in samples if v is not None]
+        if not samples:
+            return
+        lines.append(f"# HELP {_PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {_PREFIX}_{name} {kind}")
+        for labels, value in samples:
+            label_str = ",".join(f'{k}="{_label(v)}"' for k, v in labels.items())
+            lines.append(f"{_PREFIX}_{name}{{{label_str}}} {_number(value)}" if label_str else f"{_PREFIX}_{name} {_number(value)}")
+
+    base = {"engine": record.get("engine") or "", "profile": record.get("encoder_profile") or ""}
+    metric("info", "gauge", "Versão do pipeline da última execução.",
+           [({"version": record.get("pipeline_version", ""), **base}, 1)])
+    metric("runs_total", "counter", "Execuções por status.", [({"status": s}, n) for s, n in sorted(runs.items())])
+    metric("last_run_timestamp_seconds", "gauge", "Fim da última execução (epoch).",
+           [({"status": status}, datetime.fromisoformat(record["ts"]).timestamp())])
+    metric("last_run_seconds", "gauge", "Tempo total da última execução.", [(base, record.get("wall_seconds"))])
+    metric("last_run_stage_seconds", "gauge", "Duração de cada etapa na última execução.",
+           [({"stage": name}, secs) for name, secs in sorted((record.get("stages") or {}).items())])
+    renditions = record.get("renditions") or {}
+    metric("last_run_frames", "gauge", "Frames renderizados por proporção.",
+           [({"aspect": a, **base}, r.get("frames")) for a, r in sorted(renditions.items())])
+    metric("last_run_encode_fps", "gauge", "Frames por segundo do encode por proporção.",
+           [({"aspect": a, **base}, r.get("encode_fps")) for a, r in sorted(renditions.items())])
+    metric("last_run_output_bytes", "gauge", "Tamanho do MP4 por proporção.",
+           [({"aspect": a}, r.get("bytes")) for a, r in sorted(renditions.items())])
+    metric("last_run_tts_characters", "gauge", "Caracteres enviados ao edge-tts.", [({}, record.get("tts_chars"))])
+    caches = record.get("cache") or {}
+    metric("last_run_cache_hits", "gauge", "Hits de cache por tipo.",
+           [({"cache": c}, s.get("hits")) for c, s in sorted(caches.items())])
+    metric("last_run_cache_misses", "gauge", "Misses de cache por tipo.",
+           [({"cache": c}, s.get("misses")) for c, s in sorted(caches.items())])
+    run_rss = record.get("run_peak_rss_mb") or {}
+    metric("last_run_peak_rss_bytes", "gauge", "Pico de RSS da última execução (processo e processo + filhos).",
+           [({"scope": k}, v * 1024 * 1024 if v is not None else None) for k, v in sorted(run_rss.items())])
+    rss = record.get("process_peak_rss_mb") or {}
+    metric("process_peak_rss_bytes", "gauge", "Pico de RSS do processo e dos filhos desde o início do processo.",
+           [({"scope": k}, v * 1024 * 1024 if v is not None else None) for k, v in sorted(rss.items())])
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".salmo_", suffix=".prom.tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,255 @@
+"""
+Buffers de frame em memória compartilhada (multiprocessing.shared_memory) para o render multi-processo.
+
+Passar um quadro 1080x1920 entre processos por pickle custa 6–8 MB por array, a cada salto. Aqui os pixels
+ficam num segmento compartilhado e só handles pequenos (nome, offset, shape) atravessam o IPC:
+- FrameBufferPool: N slots (H, W, C) num único segmento. O coordenador empresta um slot (acquire), o worker
+  escreve o frame direto nele, o coordenador lê a view (sem cópia) e devolve o slot (release)
+- SharedPlan / attach_plan: RenderPlan com fundos e overlays copiados uma vez para um segmento; workers
+  (spawn/forkserver) recebem o plano sem os pixels e montam views somente leitura
+Ciclo de vida explícito: quem cria é o dono e fecha com close() ou with. Segmentos ainda vivos no fim do
+processo são registrados como vazamento (aviso no log) e removidos; live_segments() lista os vivos.
+"""
+
+import atexit
+import logging
+import threading
+from dataclasses import dataclass, fields, replace
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.render_plan import RenderPlan
+
+logger = logging.getLogger(__name__)
+
+# Alinhamento dos arrays dentro de um segmento (linha de cache / SIMD)
+_ALIGN = 64
+
+__all__ = [
+    "FrameBufferHandle",
+    "FrameBufferPool",
+    "SharedPlan",
+    "SharedPlanHandle",
+    "attach_plan",
+    "live_segments",
+]
+
+
+# —— Registro de segmentos criados por este processo (detecção de vazamento) ——
+
+_owned: Dict[str, Tuple[SharedMemory, str]] = {}
+_owned_lock = threading.Lock()
+# Segmentos de outros processos abertos aqui (workers): mantidos até o fim do processo
+_attached: Dict[str, SharedMemory] = {}
+
+
+def _create_segment(nbytes: int, label: str) -> SharedMemory:
+    shm = SharedMemory(create=True, size=max(1, int(nbytes)))
+    with _owned_lock:
+        _owned[shm.name] = (shm, label)
+    return shm
+
+
+def _destroy_segment(shm: SharedMemory) -> None:
+    """Remove o segmento (unlink) e fecha o mapeamento. Views NumPy ainda vivas só adiam a liberação da memória."""
+    with _owned_lock:
+        _owned.pop(shm.name, None)
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        shm.close()
+    except BufferError:
+        logger.debug("Segmento %s removido com views ainda abertas", shm.name)
+
+
+def _attach_segment(name: str) -> SharedMemory:
+    shm = _owned.get(name, (None, ""))[0] or _attached.get(name)
+    if shm is None:
+        shm = SharedMemory(name=name)
+        _attached[name] = shm
+    return shm
+
+
+def live_segments() -> List[Dict[str, Any]]:
+    """Segmentos criados por este processo e ainda não liberados: [{"name", "bytes", "label"}]."""
+    with _owned_lock:
+        return [{"name": name, "bytes": shm.size, "label": label} for name, (shm, label) in _owned.items()]
+
+
+@atexit.register
+def _release_leaked_segments() -> None:
+    leaked = live_segments()
+    if not leaked:
+        return
+    total = sum(s["bytes"] for s in leaked) / 1024 / 1024
+    logger.warning(
+        "Memória compartilhada não liberada no fim do processo: %d segmento(s), %.1f MB (%s)",
+        len(leaked), total, ", ".join(sorted({s["label"] for s in leaked})),
+    )
+    for name in [s["name"] for s in leaked]:
+        shm = _owned.get(name, (None, ""))[0]
+        if shm is not None:
+            _destroy_segment(shm)
+
+
+# —— Pool de slots de frame ——
+
+@dataclass(frozen=True)
+class FrameBufferHandle:
+    """Referência serializável a um FrameBufferPool (para os workers)."""
+
+    name: str
+    shape: Tuple[int, ...]
+    slots: int
+    dtype: str = "uint8"
+
+    def view(self, slot: int) -> np.ndarray:
+        """View gravável do slot (abre o segmento uma vez por processo)."""
+        shm = _attach_segment(self.name)
+        frame_bytes = int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+        return np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf, offset=slot * frame_bytes)
+
+
+class FrameBufferPool:
+    """
+    slots frames (shape, dtype) num segmento compartilhado. Só o processo dono faz acquire/release;
+    workers escrevem via handle.view(slot). close() com slots ainda emprestados → aviso de vazamento.
+    """
+
+    def __init__(self, shape: Sequence[int], slots: int, dtype: Any = np.uint8, label: str = "frames"):
+        if slots < 1:
+            raise ValueError("FrameBufferPool precisa de ao menos 1 slot.")
+        self.handle = FrameBufferHandle("", tuple(int(s) for s in shape), int(slots), np.dtype(dtype).name)
+        self.frame_bytes = int(np.prod(self.handle.shape)) * np.dtype(dtype).itemsize
+        self._shm: Optional[SharedMemory] = _create_segment(self.frame_bytes * slots, label)
+        self.handle = replace(self.handle, name=self._shm.name)
+        self.label = label
+        self._free: List[int] = list(range(slots - 1, -1, -1))
+        self._busy: set = set()
+
+    @property
+    def available(self) -> int:
+        return len(self._free)
+
+    def acquire(self) -> int:
+        """Empresta um slot livre. Raises RuntimeError se todos estiverem em uso."""
+        if self._shm is None:
+            raise RuntimeError(f"FrameBufferPool {self.label} já foi fechado.")
+        if not self._free:
+            raise RuntimeError(f"FrameBufferPool {self.label}: todos os {self.handle.slots} slots em uso.")
+        slot = self._free.pop()
+        self._busy.add(slot)
+        return slot
+
+    def release(self, slot: int) -> None:
+        if slot not in self._busy:
+            raise ValueError(f"FrameBufferPool {self.label}: slot {slot} não está emprestado.")
+        self._busy.discard(slot)
+        self._free.append(slot)
+
+    def view(self, slot: int) -> np.ndarray:
+        """View do slot no processo dono (sem cópia); válida até o release."""
+        return self.handle.view(slot)
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        if self._busy:
+            logger.warning(
+                "FrameBufferPool %s fechado com %d slot(s) ainda emprestado(s): %s",
+                self.label, len(self._busy), sorted(self._busy),
+            )
+            self._busy.clear()
+        _destroy_segment(self._shm)
+        self._shm = None
+
+    def __enter__(self) -> "FrameBufferPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+# —— RenderPlan em memória compartilhada ——
+
+@dataclass(frozen=True)
+class _ArrayRef:
+    offset: int
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+@dataclass(frozen=True)
+class SharedPlanHandle:
+    """RenderPlan com arrays trocados por _ArrayRef (offset no segmento); serializável e pequeno."""
+
+    name: str
+    plan: RenderPlan
+
+
+def _array_fields(layer: Any) -> List[str]:
+    return [f.name for f in fields(layer) if isinstance(getattr(layer, f.name), (np.ndarray, _ArrayRef))]
+
+
+def _swap_arrays(layer: Any, fn: Any) -> Any:
+    return replace(layer, **{name: fn(getattr(layer, name)) for name in _array_fields(layer)})
+
+
+class SharedPlan:
+    """
+    Copia os pixels do plano (imagens de fundo, rgb/alpha dos overlays) para um único segmento.
+    handle vai para os workers (initargs); attach_plan(handle) devolve o RenderPlan com views somente leitura.
+    """
+
+    def __init__(self, plan: RenderPlan, label: str = "render_plan"):
+        layers = list(plan.backgrounds) + list(plan.overlays)
+        arrays = [np.ascontiguousarray(getattr(layer, name)) for layer in layers for name in _array_fields(layer)]
+        offsets, total = [], 0
+        for arr in arrays:
+            offsets.append(total)
+            total += -(-arr.nbytes // _ALIGN) * _ALIGN
+        self._shm: Optional[SharedMemory] = _create_segment(total, label)
+        for arr, offset in zip(arrays, offsets):
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=self._shm.buf, offset=offset)[...] = arr
+
+        # Mesma ordem de percurso da coleta acima: cada array vira o _ArrayRef do seu offset
+        refs = iter(_ArrayRef(offset, tuple(arr.shape), arr.dtype.name) for arr, offset in zip(arrays, offsets))
+        skeleton = replace(
+            plan,
+            backgrounds=[_swap_arrays(bg, lambda _: next(refs)) for bg in plan.backgrounds],
+            overlays=[_swap_arrays(layer, lambda _: next(refs)) for layer in plan.overlays],
+        )
+        self.handle = SharedPlanHandle(self._shm.name, skeleton)
+        self.nbytes = total
+
+    def close(self) -> None:
+        if self._shm is not None:
+            _destroy_segment(self._shm)
+            self._shm = None
+
+    def __enter__(self) -> "SharedPlan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def attach_plan(handle: SharedPlanHandle) -> RenderPlan:
+    """RenderPlan do handle com views (somente leitura) no segmento compartilhado; nenhum pixel copiado."""
+    shm = _attach_segment(handle.name)
+
+    def _view(ref: _ArrayRef) -> np.ndarray:
+        arr = np.ndarray(ref.shape, dtype=ref.dtype, buffer=shm.buf, offset=ref.offset)
+        arr.flags.writeable = False
+        return arr
+
+    plan = handle.plan
+    return replace(
+        plan,
+        backgrounds=[_swap_arrays(bg, _view) for bg in plan.backgrounds],
+        overlays=[_swap_arrays(layer, _view) for layer in plan.overlays],
+    )
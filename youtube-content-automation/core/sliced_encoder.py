@@ -0,0 +1,204 @@
+"""
+Encode paralelo por fatias de tempo de um único vídeo.
+
+A timeline do RenderPlan é dividida em N fatias alinhadas a keyframe (múltiplos do GOP):
+- Cada fatia é composta (NumpyFrameCompositor, acesso aleatório por frame) e codificada
+  num processo próprio → N encoders x264 em paralelo em vez de um só com threads=4
+- Mesmos parâmetros de codec em todas as fatias; cada uma começa num IDR
+- Junção com o concat demuxer do ffmpeg em stream copy (sem re-encode) + áudio muxado uma única vez
+"""
+
+import os
+import logging
+import multiprocessing
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.render_plan import RenderPlan
+from core.encoder_profiles import rate_control_args
+from core.frame_compositor import NumpyFrameCompositor, ffmpeg_binary, pipe_frames, raw_input_args
+from core.progress import ProgressTracker, polling
+
+logger = logging.getLogger(__name__)
+
+# Fatias por vídeo (SALMO_RENDER_SLICES); padrão = núcleos disponíveis
+DEFAULT_SLICES = int(os.getenv("SALMO_RENDER_SLICES", str(os.cpu_count() or 1)) or 1)
+# GOP em segundos: fronteiras das fatias caem sempre num múltiplo do GOP
+GOP_SECONDS = 2.0
+
+__all__ = [
+    "DEFAULT_SLICES",
+    "GOP_SECONDS",
+    "concat_slices",
+    "encode_slices",
+    "gop_codec_args",
+    "gop_frames",
+    "plan_slices",
+    "render_plan_sliced",
+]
+
+
+def plan_slices(n_frames: int, n_slices: int, gop: int) -> List[Tuple[int, int]]:
+    """
+    Divide [0, n_frames) em até n_slices intervalos contíguos com início múltiplo de gop.
+    Ex.: plan_slices(300, 4, 60) → [(0, 60), (60, 120), (120, 180), (180, 300)] (GOPs repartidos por igual).
+    """
+    gop = max(1, gop)
+    n_gops = max(1, -(-n_frames // gop))
+    n_slices = max(1, min(n_slices, n_gops))
+    bounds = [min(n_frames, (n_gops * i // n_slices) * gop) for i in range(n_slices + 1)]
+    bounds[-1] = n_frames
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def gop_frames(fps: int) -> int:
+    """GOP fixo (GOP_SECONDS) em frames."""
+    return max(1, int(round(GOP_SECONDS * fps)))
+
+
+def gop_codec_args(
+    gop: int,
+    codec: str,
+    bitrate: str,
+    preset: str,
+    threads: int,
+    crf: Optional[int] = None,
+    maxrate: Optional[str] = None,
+    bufsize: Optional[str] = None,
+) -> List[str]:
+    """
+    Argumentos de encode de uma fatia: GOP fixo e sem keyframes por mudança de cena →
+    fatias com a mesma estrutura, unidas sem re-encode.
+    """
+    return [
+        "-c:v", codec, "-preset", preset, *rate_control_args(bitrate, crf, maxrate, bufsize), "-pix_fmt", "yuv420p",
+        "-g", str(gop), "-keyint_min", str(gop), "-sc_threshold", "0",
+        "-threads", str(threads), "-an",
+    ]
+
+
+_worker_plan: Optional[RenderPlan] = None
+# Frames escritos por todos os workers (multiprocessing.Value) quando há progresso a reportar
+_worker_frames: Any = None
+
+
+def _init_worker(plan: Any, frames_done: Any = None) -> None:
+    """Plano do worker: o próprio RenderPlan (job único, no processo atual) ou montado sobre a memória compartilhada."""
+    global _worker_plan, _worker_frames
+    if not isinstance(plan, RenderPlan):
+        from core.shared_frames import attach_plan
+        plan = attach_plan(plan)
+    _worker_plan = plan
+    _worker_frames = frames_done
+
+
+def _count_frame(_n: int) -> None:
+    with _worker_frames.get_lock():
+        _worker_frames.value += 1
+
+
+def _encode_slice(job: Tuple[int, int, str, List[str]]) -> Tuple[int, float]:
+    """Compõe e codifica os frames [start, stop) num arquivo só de vídeo. Retorna (frames, segundos)."""
+    start, stop, path, codec_args = job
+    compositor = NumpyFrameCompositor(_worker_plan)
+    cmd = [ffmpeg_binary(), "-y", "-loglevel", "error"] + raw_input_args(_worker_plan) + codec_args + [path]
+    t0 = time.monotonic()
+    n = pipe_frames(
+        cmd, compositor.iter_frames(start, stop), stop - start,
+        on_frame=_count_frame if _worker_frames is not None else None,
+    )
+    return n, time.monotonic() - t0
+
+
+def encode_slices(
+    plan: RenderPlan,
+    jobs: List[Tuple[int, int, str, List[str]]],
+    workers: Optional[int] = None,
+    progress: Optional[ProgressTracker] = None,
+) -> List[Tuple[int, float]]:
+    """
+    Codifica os jobs (início, fim, arquivo, args) em processos forkserver/spawn, nunca fork: a narração do próximo
+    item (core.narration_prefetch) roda numa thread com asyncio + SSL durante o encode, e fork nesse estado pode
+    herdar locks presos. Pixels do plano em memória compartilhada (core.shared_frames), não serializados por worker.
+    workers=None → um processo por job. progress: frames escritos somados entre os workers (contador
+    compartilhado lido pelo processo atual). Retorna [(frames, segundos)] na ordem dos jobs.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    frames_done = ctx.Value("q", 0) if progress is not None and progress.active else None
+    with polling(progress, lambda: frames_done.value):
+        if len(jobs) == 1:
+            _init_worker(plan, frames_done)
+            return [_encode_slice(jobs[0])]
+        workers = len(jobs) if workers is None else max(1, min(workers, len(jobs)))
+        from core.shared_frames import SharedPlan
+        with SharedPlan(plan, label="plano (fatias)") as shared, ProcessPoolExecutor(
+            max_workers=workers, mp_context=ctx, initializer=_init_worker, initargs=(shared.handle, frames_done)
+        ) as pool:
+            return list(pool.map(_encode_slice, jobs))
+
+
+def concat_slices(plan: RenderPlan, paths: List[str], work_dir: str, output_path: str, audio_bitrate: str = "192k") -> None:
+    """
+    Junta as fatias (concat demuxer, stream copy) e muxa o áudio do plano uma única vez.
+    Raises:
+        RuntimeError: ffmpeg encerrou com erro.
+    """
+    list_path = os.path.join(work_dir, "slices.txt")
+    with open(list_path, "w", encoding="utf-8") as f:
+        for path in paths:
+            f.write(f"file '{os.path.abspath(path)}'\n")
+    cmd = [ffmpeg_binary(), "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", list_path]
+    if plan.audio_path:
+        cmd += ["-i", plan.audio_path, "-map", "0:v:0", "-map", "1:a:0", "-c:a", "aac", "-b:a", audio_bitrate]
+    cmd += ["-c:v", "copy", "-t", f"{plan.duration:.3f}", "-movflags", "+faststart", output_path]
+    proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if proc.returncode != 0:
+        err = proc.stderr.decode("utf-8", "replace").strip()
+        raise RuntimeError(f"ffmpeg (concat das fatias) falhou (código {proc.returncode}): {err[-400:]}")
+
+
+def render_plan_sliced(
+    plan: RenderPlan,
+    output_path: str,
+    slices: Optional[int] = None,
+    codec: str = "libx264",
+    bitrate: str = "12000k",
+    preset: str = "medium",
+    crf: Optional[int] = None,
+    maxrate: Optional[str] = None,
+    bufsize: Optional[str] = None,
+    audio_bitrate: str = "192k",
+    progress: Optional[ProgressTracker] = None,
+) -> Dict[str, float]:
+    """
+    Renderiza o plano em fatias paralelas (um processo por fatia) e junta com concat + stream copy.
+    slices=None → DEFAULT_SLICES. Threads do x264 por fatia = núcleos / fatias. progress: frames de todas as fatias.
+    Retorna {"frames", "seconds", "fps", "slices"}.
+    Raises:
+        FileNotFoundError: ffmpeg ausente.
+        RuntimeError: ffmpeg encerrou com erro (fatia ou junção).
+    """
+    if not plan.backgrounds:
+        raise ValueError("RenderPlan sem fundo.")
+
+    gop = gop_frames(plan.fps)
+    ranges = plan_slices(plan.n_frames, DEFAULT_SLICES if slices is None else slices, gop)
+    threads = max(1, (os.cpu_count() or 1) // len(ranges))
+    codec_args = gop_codec_args(gop, codec, bitrate, preset, threads, crf, maxrate, bufsize)
+    os.makedirs(os.path.dirname(output_path) or "outputs", exist_ok=True)
+    work_dir = tempfile.mkdtemp(prefix="salmo_slices_", dir=os.path.dirname(output_path) or None)
+    t0 = time.monotonic()
+    try:
+        jobs = [(a, b, os.path.join(work_dir, f"slice_{i:03d}.mp4"), codec_args) for i, (a, b) in enumerate(ranges)]
+        logger.info("      Encode em %d fatias (GOP %d frames, %d thread(s) x264 cada)", len(jobs), gop, threads)
+        n = sum(r[0] for r in encode_slices(plan, jobs, progress=progress))
+        concat_slices(plan, [job[2] for job in jobs], work_dir, output_path, audio_bitrate)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    elapsed = time.monotonic() - t0
+    return {"frames": float(n), "seconds": elapsed, "fps": n / max(elapsed, 1e-6), "slices": float(len(jobs))}
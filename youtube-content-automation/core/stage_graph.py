@@ -0,0 +1,195 @@
+"""
+Executor de etapas em grafo de dependências (DAG) para uma execução do pipeline.
+
+Cada Stage declara de quais etapas depende; o agendador roda em threads todas as etapas prontas ao mesmo tempo
+(rede do TTS, grading do fundo e rasterização de overlays se sobrepõem) e registra início/fim de cada uma:
+- exclusive: etapas com a mesma chave nunca rodam juntas (ex.: "layout" — WIDTH/HEIGHT são globais do processo)
+- optional: falha vira aviso e resultado None (pré-aquecimento de cache); os dependentes rodam mesmo assim
+- Falha de etapa obrigatória: nada novo é iniciado, as que estão rodando terminam e a exceção é relançada
+No fim, StageReport traz os resultados, a duração de cada etapa e o caminho crítico (cadeia de etapas que
+determinou o tempo total, contando a espera por recurso exclusivo), registrados no log.
+"""
+
+import os
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Etapas rodando ao mesmo tempo numa execução (SALMO_STAGE_WORKERS); 1 → sequencial, na ordem de declaração
+DEFAULT_STAGE_WORKERS = max(1, int(os.getenv("SALMO_STAGE_WORKERS", "4") or 1))
+
+__all__ = [
+    "DEFAULT_STAGE_WORKERS",
+    "Stage",
+    "StageReport",
+    "run_stages",
+]
+
+
+@dataclass
+class Stage:
+    """
+    Uma etapa: fn(results) com results = {nome da dependência: resultado}.
+    exclusive: chave de recurso não compartilhável; optional: falha não interrompe o grafo.
+    """
+
+    name: str
+    fn: Callable[[Dict[str, Any]], Any]
+    deps: Tuple[str, ...] = ()
+    exclusive: Optional[str] = None
+    optional: bool = False
+
+
+@dataclass
+class StageReport:
+    """Resultado de run_stages: resultados por etapa, (início, fim) relativos ao começo e caminho crítico."""
+
+    results: Dict[str, Any] = field(default_factory=dict)
+    timings: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    critical_path: List[str] = field(default_factory=list)
+    # Etapa cujo fim liberou esta: a dependência que terminou por último ou a dona anterior do recurso exclusivo
+    blocked_by: Dict[str, Optional[str]] = field(default_factory=dict)
+    failed: Dict[str, str] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+
+    def durations(self) -> Dict[str, float]:
+        return {name: round(end - start, 3) for name, (start, end) in self.timings.items()}
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Resumo serializável (sem os resultados): durações, caminho crítico, falhas opcionais, tempo total."""
+        return {
+            "seconds": self.durations(),
+            "critical_path": list(self.critical_path),
+            "critical_seconds": round(sum(self.durations()[n] for n in self.critical_path), 3),
+            "wall_seconds": round(self.wall_seconds, 3),
+            "failed_optional": dict(self.failed),
+        }
+
+
+def _validate(stages: Sequence[Stage]) -> Dict[str, Stage]:
+    by_name: Dict[str, Stage] = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"Etapa duplicada: {stage.name}")
+        by_name[stage.name] = stage
+    for stage in stages:
+        missing = [d for d in stage.deps if d not in by_name]
+        if missing:
+            raise ValueError(f"Etapa {stage.name} depende de etapa inexistente: {', '.join(missing)}")
+    # Ciclos: ordenação topológica (Kahn) precisa consumir todas as etapas
+    pending = {s.name: set(s.deps) for s in stages}
+    while pending:
+        ready = [n for n, deps in pending.items() if not deps]
+        if not ready:
+            raise ValueError(f"Ciclo entre as etapas: {', '.join(sorted(pending))}")
+        for n in ready:
+            del pending[n]
+        for deps in pending.values():
+            deps.difference_update(ready)
+    return by_name
+
+
+def _critical_path(report: StageReport) -> List[str]:
+    """Da etapa que terminou por último, volta pelas etapas que liberaram cada uma (blocked_by)."""
+    if not report.timings:
+        return []
+    current: Optional[str] = max(report.timings, key=lambda n: report.timings[n][1])
+    path: List[str] = []
+    while current is not None:
+        path.append(current)
+        current = report.blocked_by.get(current)
+    return path[::-1]
+
+
+def run_stages(
+    stages: Sequence[Stage],
+    max_workers: Optional[int] = None,
+    label: str = "Etapas",
+) -> StageReport:
+    """
+    Executa o grafo e devolve o StageReport (log: duração por etapa e caminho crítico).
+    max_workers: threads (None → DEFAULT_STAGE_WORKERS). Entre etapas prontas, vale a ordem de declaração.
+    Raises:
+        ValueError: dependência inexistente, nome duplicado ou ciclo.
+        Exception: a primeira falha de uma etapa obrigatória.
+    """
+    by_name = _validate(stages)
+    order = {s.name: i for i, s in enumerate(stages)}
+    report = StageReport()
+    remaining = {s.name: set(s.deps) for s in stages}
+    running: Dict[Future, str] = {}
+    busy: set = set()
+    last_holder: Dict[str, str] = {}
+    error: Optional[BaseException] = None
+    t0 = time.monotonic()
+
+    def _call(stage: Stage) -> Tuple[Any, float, float]:
+        start = time.monotonic() - t0
+        value = stage.fn({d: report.results.get(d) for d in stage.deps})
+        return value, start, time.monotonic() - t0
+
+    with ThreadPoolExecutor(max_workers=max_workers or DEFAULT_STAGE_WORKERS, thread_name_prefix="stage") as pool:
+        while (remaining and error is None) or running:
+            if error is None:
+                for name in sorted((n for n, deps in remaining.items() if not deps), key=order.get):
+                    stage = by_name[name]
+                    if stage.exclusive and stage.exclusive in busy:
+                        continue
+                    if stage.exclusive:
+                        busy.add(stage.exclusive)
+                    del remaining[name]
+                    blockers = [d for d in stage.deps if d in report.timings]
+                    if stage.exclusive in last_holder:
+                        blockers.append(last_holder[stage.exclusive])
+                    report.blocked_by[name] = max(blockers, key=lambda b: report.timings[b][1]) if blockers else None
+                    running[pool.submit(_call, stage)] = name
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                stage = by_name[name]
+                if stage.exclusive:
+                    busy.discard(stage.exclusive)
+                    last_holder[stage.exclusive] = name
+                try:
+                    value, start, end = future.result()
+                except Exception as e:
+                    end = time.monotonic() - t0
+                    if not stage.optional:
+                        logger.error("%s: etapa %s falhou: %s", label, name, e)
+                        error = error or e
+                        continue
+                    logger.warning("%s: etapa opcional %s falhou (seguindo sem ela): %s", label, name, e)
+                    report.failed[name] = str(e)
+                    value, start = None, end
+                report.results[name] = value
+                report.timings[name] = (start, end)
+                for deps in remaining.values():
+                    deps.discard(name)
+
+    report.wall_seconds = time.monotonic() - t0
+    report.critical_path = _critical_path(report)
+    if error is not None:
+        raise error
+    _log_report(report, label)
+    return report
+
+
+def _log_report(report: StageReport, label: str) -> None:
+    if not report.timings:
+        return
+    durations = report.durations()
+    logger.info("      %s (%d) em %.1fs:", label, len(durations), report.wall_seconds)
+    for name, (start, end) in sorted(report.timings.items(), key=lambda kv: kv[1][0]):
+        marker = "*" if name in report.critical_path else " "
+        logger.info("      %s %-22s %6.2fs → %6.2fs  (%5.2fs)", marker, name, start, end, end - start)
+    critical = sum(durations[n] for n in report.critical_path)
+    logger.info(
+        "      Caminho crítico: %s (%.1fs de %.1fs)",
+        " → ".join(report.critical_path), critical, report.wall_seconds,
+    )
@@ -0,0 +1,222 @@
+"""
+Profiling por etapa (cProfile) para execuções do main.py com --profile.
+
+O pipeline marca as etapas com profile_section("tts"), profile_section("compose_encode")... Com uma sessão ativa
+(start_profiling), cada seção tem seu próprio cProfile na thread que a executa; seções aninhadas pausam a de fora,
+então cada função é atribuída a uma única etapa. write(pasta) grava:
+- <etapa>.prof: pstats de cada etapa (somado entre chamadas; abre com pstats, snakeviz etc.)
+- summary.txt: tempo de parede por etapa e as N funções mais caras (tempo acumulado) de cada uma
+Sem sessão ativa, profile_section devolve um contexto nulo compartilhado: nenhum profiler é criado.
+As mesmas seções marcam as fronteiras de etapa da amostragem de memória (core.memory_sampler), quando ligada.
+Só o processo atual é medido: ffmpeg, o pool de overlays e workers do motor sliced aparecem como espera.
+"""
+
+import os
+import io
+import cProfile
+import logging
+import pstats
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any, ContextManager, Dict, List, Optional
+
+from core import memory_sampler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_TOP = 25
+
+__all__ = [
+    "DEFAULT_PROFILE_TOP",
+    "ProfileSession",
+    "active_session",
+    "instrumented",
+    "profile_section",
+    "start_profiling",
+    "stop_profiling",
+]
+
+_NULL_SECTION = nullcontext()
+_session: Optional["ProfileSession"] = None
+
+
+class _Section:
+    """Uma entrada de profile_section numa thread: profiler próprio, pausado enquanto houver seção interna."""
+
+    def __init__(self, session: "ProfileSession", name: str):
+        self.session = session
+        self.name = name
+        self.profiler: Optional[cProfile.Profile] = None
+        self.wall = 0.0
+        self._resumed = 0.0
+
+    def _resume(self) -> None:
+        if self.profiler is not None:
+            self.profiler.enable()
+        self._resumed = time.perf_counter()
+
+    def _pause(self) -> None:
+        if self.profiler is not None:
+            self.profiler.disable()
+        self.wall += time.perf_counter() - self._resumed
+
+    def __enter__(self) -> "_Section":
+        stack = self.session._stack()
+        if stack:
+            stack[-1]._pause()
+        self.profiler = cProfile.Profile()
+        try:
+            self._resume()
+        except ValueError as e:
+            # Python 3.12+: outro profiler já ativo no processo (sys.monitoring) → só o tempo de parede
+            logger.debug("Profiling da etapa %s indisponível: %s", self.name, e)
+            self.profiler = None
+            self._resumed = time.perf_counter()
+        stack.append(self)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        stack = self.session._stack()
+        self._pause()
+        stack.pop()
+        self.session._record(self)
+        if stack:
+            stack[-1]._resume()
+
+
+class _Nested:
+    """Dois contextos em sequência: a seção de memória por fora (snapshots do tracemalloc fora do cProfile)."""
+
+    def __init__(self, outer: ContextManager[Any], inner: ContextManager[Any]):
+        self.outer = outer
+        self.inner = inner
+
+    def __enter__(self) -> "_Nested":
+        self.outer.__enter__()
+        try:
+            self.inner.__enter__()
+        except BaseException:
+            self.outer.__exit__(None, None, None)
+            raise
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        try:
+            self.inner.__exit__(*exc)
+        finally:
+            self.outer.__exit__(*exc)
+
+
+class ProfileSession:
+    """Profiles acumulados por etapa (nome → lista de cProfile.Profile) e tempo de parede exclusivo."""
+
+    def __init__(self, top: int = DEFAULT_PROFILE_TOP):
+        self.top = top
+        self.started = datetime.now()
+        self._profiles: Dict[str, List[cProfile.Profile]] = {}
+        self._wall: Dict[str, float] = {}
+        self._calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[_Section]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, section: _Section) -> None:
+        with self._lock:
+            if section.profiler is not None:
+                self._profiles.setdefault(section.name, []).append(section.profiler)
+            self._wall[section.name] = self._wall.get(section.name, 0.0) + section.wall
+            self._calls[section.name] = self._calls.get(section.name, 0) + 1
+
+    def section(self, name: str) -> ContextManager[Any]:
+        return _Section(self, name)
+
+    def stages(self) -> List[str]:
+        with self._lock:
+            return sorted(self._wall, key=self._wall.get, reverse=True)
+
+    def _stats(self, name: str) -> Optional[pstats.Stats]:
+        profiles = self._profiles.get(name) or []
+        if not profiles:
+            return None
+        stats = pstats.Stats(profiles[0])
+        for extra in profiles[1:]:
+            stats.add(extra)
+        return stats
+
+    def write(self, out_dir: str) -> Dict[str, str]:
+        """Grava <etapa>.prof e summary.txt em out_dir; retorna {etapa ou "summary": caminho}."""
+        os.makedirs(out_dir, exist_ok=True)
+        paths: Dict[str, str] = {}
+        summary = io.StringIO()
+        summary.write(f"Perfil por etapa — {self.started.isoformat(timespec='seconds')}\n")
+        summary.write("Tempo de parede exclusivo (seções internas da mesma thread descontadas; a espera por etapas em "
+                      "outras threads conta em quem espera); processos filhos não entram.\n\n")
+        summary.write(f"  {'etapa':<18} {'chamadas':>8} {'parede (s)':>11}\n")
+        for name in self.stages():
+            summary.write(f"  {name:<18} {self._calls[name]:>8d} {self._wall[name]:>11.2f}\n")
+
+        for name in self.stages():
+            stats = self._stats(name)
+            if stats is None:
+                continue
+            path = os.path.join(out_dir, f"{name}.prof")
+            stats.dump_stats(path)
+            paths[name] = path
+            block = io.StringIO()
+            stats.stream = block
+            stats.sort_stats("cumulative").print_stats(self.top)
+            summary.write(f"\n{'=' * 78}\n{name}: top {self.top} por tempo acumulado\n{'=' * 78}\n")
+            summary.write(block.getvalue().strip() + "\n")
+
+        summary_path = os.path.join(out_dir, "summary.txt")
+        with open(summary_path, "w", encoding="utf-8") as f:
+            f.write(summary.getvalue())
+        paths["summary"] = summary_path
+        return paths
+
+
+def profile_section(name: str) -> ContextManager[Any]:
+    """Contexto que perfila o bloco como a etapa name (contexto nulo sem profiling nem amostragem de memória)."""
+    session = _session
+    sampler = memory_sampler.active_sampler()
+    if sampler is None:
+        return _NULL_SECTION if session is None else session.section(name)
+    if session is None:
+        return sampler.section(name)
+    return _Nested(sampler.section(name), session.section(name))
+
+
+def active_session() -> Optional[ProfileSession]:
+    return _session
+
+
+def instrumented() -> bool:
+    """Profiling ou amostragem de memória ativos (o pipeline roda uma etapa por vez para atribuir certo)."""
+    return _session is not None or memory_sampler.active_sampler() is not None
+
+
+def start_profiling(top: int = DEFAULT_PROFILE_TOP) -> ProfileSession:
+    """Ativa o profiling por etapa no processo (uma sessão por vez)."""
+    global _session
+    if _session is not None:
+        raise RuntimeError("Já existe uma sessão de profiling ativa.")
+    _session = ProfileSession(top=top)
+    return _session
+
+
+def stop_profiling(out_dir: Optional[str] = None) -> Dict[str, str]:
+    """Encerra a sessão; com out_dir, grava os perfis e o resumo lá. Retorna os caminhos gravados."""
+    global _session
+    session, _session = _session, None
+    if session is None or out_dir is None:
+        return {}
+    paths = session.write(out_dir)
+    logger.info("Perfis por etapa gravados em %s (%d etapa(s))", out_dir, len(paths) - 1)
+    return paths
@@ -11,10 +11,27 @@ Uso (salmo_dia):
   python main.py salmo_dia --list                     # Lista conteúdo
   python main.py salmo_dia --index 0 --upload youtube 18.02.26 15   # Item no índice 0, programado
   python main.py salmo_dia --upload youtube 16.02.26 09 --dry-run  # Dry-run: mostra comando/crontab
+  python main.py salmo_dia --engine moviepy           # Força o motor de render MoviePy (padrão: numpy)
+  python main.py salmo_dia --engine ffmpeg            # Composição inteira num filter_complex do ffmpeg
+  python main.py salmo_dia --engine sliced            # Encode paralelo em fatias de tempo (SALMO_RENDER_SLICES)
+  python main.py salmo_dia --engine incremental       # Correções: só os trechos alterados são recodificados
+  python main.py salmo_dia --index 0 --draft          # Rascunho rápido (540x960, 15 fps); voz reaproveitada no render final
+  python main.py salmo_dia --aspect 9:16,1:1,16:9     # Short + feed + paisagem num único job (mesma voz/tempos)
+  python main.py salmo_dia --index 0 --no-cache       # Renderiza de novo mesmo com o vídeo já no cache
+  python main.py salmo_dia --encoder-profile size-capped   # Perfil de encode (padrão: encoder_profile do canal)
+  python3 scripts/benchmark_encoder_profiles.py       # Compara os perfis de encode nesta máquina
+  python main.py salmo_dia --batch 0-13               # Lote: vários itens num processo (manifesto + retomada)
+  python main.py salmo_dia --batch 0,5,20-26 --batch-workers 3   # Índices avulsos/intervalos, 3 workers de render
+  python main.py salmo_dia --index 0 --profile        # cProfile por etapa em outputs/salmo_do_dia/<gravação>/profile
+  python main.py salmo_dia --memory-report --memory-budget-mb 1500   # Memória por etapa ao lado do vídeo; aviso acima de 1,5 GB
+  python main.py salmo_dia --progress-file outputs/progress.jsonl   # Frames, fps e ETA do export (e bytes do TTS/upload)
+  python3 scripts/benchmark_hot_paths.py run         # Micro-benchmarks dos hot paths → outputs/benchmarks/hot_paths_<commit>.json
+  python3 scripts/benchmark_hot_paths.py compare base.json novo.json   # Sai com 1 se algum ficou >10% mais lento
 
 Agenda (vários canais/datas):
   python main.py agenda.txt                   # Um post por linha: canal  data  hora
   python main.py agenda.yaml                  # YAML com posts (channel, date, time)
+  python main.py agenda.txt --prefetch-depth 2   # Narração dos 2 próximos posts sintetizada durante o encode
   Canal por variável:  CANAL=salmo_dia python main.py --upload 16.02.2026 09
 """
 
@@ -22,6 +39,7 @@ import argparse
 import sys
 import os
 import importlib
+import random
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -60,6 +78,26 @@ def load_channels_config():
     return {"channels": {"salmo_dia": {"id": "salmo_dia", "name": "Salmo do Dia", "enabled": True}}, "default_channel": "salmo_dia"}
 
 
+def apply_encoder_profile(args):
+    """Perfil de encode do processo: --encoder-profile ou encoder_profile do canal em config/channels.yaml."""
+    from core.encoder_profiles import channel_encoder_profile, set_default_encoder_profile
+    name = getattr(args, "encoder_profile", None) or channel_encoder_profile(args.channel, load_channels_config())
+    set_default_encoder_profile(name)
+
+
+def apply_instrumentation_env(args):
+    """
+    --memory-report / --memory-budget-mb / --progress-file → SALMO_MEMORY_REPORT / SALMO_MEMORY_BUDGET_MB /
+    SALMO_PROGRESS_FILE (variáveis de ambiente: herdadas pelos workers do --batch).
+    """
+    if getattr(args, "memory_report", False):
+        os.environ["SALMO_MEMORY_REPORT"] = "1"
+    if getattr(args, "memory_budget_mb", None) is not None:
+        os.environ["SALMO_MEMORY_BUDGET_MB"] = str(args.memory_budget_mb)
+    if getattr(args, "progress_file", None):
+        os.environ["SALMO_PROGRESS_FILE"] = args.progress_file
+
+
 def get_available_channels():
     cfg = load_channels_config()
     channels = cfg.get("channels", {})
@@ -192,9 +230,59 @@ def _load_agenda_yaml(path):
         return []
 
 
+def run_agenda(args, posts, channels):
+    """
+    Um post por vez, na ordem da agenda. Itens do Salmo do Dia são sorteados antes de começar
+    (quando não há --index) para que a narração do próximo seja sintetizada enquanto o atual codifica
+    (core.narration_prefetch; --prefetch-depth).
+    """
+    from core.narration_prefetch import run_pipelined
+
+    valid = []
+    for i, p in enumerate(posts):
+        ch = p.get("channel", "")
+        dt = _normalize_date(p.get("date", "").replace("-", "/").replace(".", "/"))
+        tm = _normalize_time(p.get("time", "09"))
+        if ch not in channels:
+            print(f"  [{i+1}] Canal inválido: {ch}, pulando.")
+            continue
+        if not dt:
+            print(f"  [{i+1}] Data inválida: {p.get('date')}, pulando.")
+            continue
+        valid.append({"n": i + 1, "channel": ch, "date": dt, "time": tm, "index": args.index})
+
+    salmo_posts = [post for post in valid if post["channel"] == "salmo_dia"]
+    if salmo_posts:
+        from channels.salmo_dia.channel_processor import CONTENT_ITEMS
+        for post in salmo_posts:
+            if post["index"] is None:
+                post["index"] = random.randrange(len(CONTENT_ITEMS))
+
+    def _text_of(post):
+        if post["channel"] != "salmo_dia":
+            return None
+        return CONTENT_ITEMS[post["index"]][2]
+
+    def _run_post(post):
+        print(f"\n  [{post['n']}/{len(posts)}] {post['channel']} em {post['date']} às {post['time']}")
+        args.channel = post["channel"]
+        args.upload = True
+        args.publish = True
+        args.schedule_at = _schedule_at_from_date_time(post["date"], post["time"])
+        args.dry_run = False
+        if post["channel"] == "salmo_dia":
+            args.index = post["index"]
+            run_salmo_dia(args)
+        else:
+            run_generic_channel(args)
+
+    run_pipelined(valid, _text_of, _run_post, depth=getattr(args, "prefetch_depth", None))
+
+
 def run_salmo_dia(args):
     """Canal Salmo do Dia: salmos e passagens da Bíblia em um só canal."""
     from channels.salmo_dia.channel_processor import SalmoDiaProcessor
+    apply_encoder_profile(args)
 
     # Garantir que upload vá para o canal salmo_dia (não dica_carreira_dia nem outro)
     os.environ["CONTENT_CHANNEL_ID"] = "salmo_dia"
@@ -217,6 +305,10 @@ def run_salmo_dia(args):
             print(f"❌ Índice {args.info} não encontrado")
         return
 
+    if getattr(args, "batch", None):
+        run_salmo_batch(args)
+        return
+
     do_upload = getattr(args, "upload", False) or args.publish
     schedule_at = getattr(args, "schedule_at", None)
     dry_run = getattr(args, "dry_run", False)
@@ -243,24 +335,36 @@ def run_salmo_dia(args):
     # Saída sempre em outputs (nunca na root); path absoluto para o canal salmo_dia
     root = os.path.dirname(os.path.abspath(__file__))
     output_dir = args.output if os.path.isabs(args.output) else os.path.join(root, args.output)
-    processor = SalmoDiaProcessor(output_dir=output_dir)
+    processor = SalmoDiaProcessor(
+        output_dir=output_dir,
+        render_engine=getattr(args, "engine", None),
+        draft=getattr(args, "draft", False),
+        aspect_ratios=args.aspect.split(",") if getattr(args, "aspect", None) else None,
+        use_cache=not getattr(args, "no_cache", False),
+    )
     print("\n" + "="*60)
     print("  SALMO DO DIA – Salmos e passagens da Bíblia")
     print("="*60 + "\n")
 
     publish_dest = parse_publish_to(getattr(args, "publish_to", None)) if do_upload else None
 
-    if do_upload:
-        result = processor.process_and_publish(
-            salmo_index=args.index,
-            publish_destinations=publish_dest or ["youtube"],
-            schedule_at=schedule_at,
-        )
-    else:
-        result = processor.process_salmo(
-            generate_videos=True,
-            salmo_index=args.index
-        )
+    profiling = getattr(args, "profile", False)
+    if profiling:
+        from core.stage_profiler import profile_section, start_profiling, stop_profiling
+        start_profiling(top=getattr(args, "profile_top", None) or 25)
+    try:
+        if profiling:
+            # "run": o que não cai em nenhuma etapa marcada (seleção do item, caches, descrições...)
+            with profile_section("run"):
+                result = _process_salmo_item(processor, args, do_upload, publish_dest, schedule_at)
+        else:
+            result = _process_salmo_item(processor, args, do_upload, publish_dest, schedule_at)
+    finally:
+        if profiling:
+            profile_dir = os.path.join(processor.session_dir or processor._session_folder(), "profile")
+            paths = stop_profiling(profile_dir)
+            if paths:
+                print(f"\n  🔬 Perfis por etapa: {profile_dir} (resumo: {os.path.basename(paths['summary'])})")
 
     print("\n" + "="*60)
     print("  RESULTADO")
@@ -279,8 +383,65 @@ def run_salmo_dia(args):
     print("\n" + "="*60 + "\n")
 
 
+def _process_salmo_item(processor, args, do_upload, publish_dest, schedule_at):
+    if do_upload:
+        return processor.process_and_publish(
+            salmo_index=args.index,
+            publish_destinations=publish_dest or ["youtube"],
+            schedule_at=schedule_at,
+        )
+    return processor.process_salmo(
+        generate_videos=True,
+        salmo_index=args.index
+    )
+
+
+def run_salmo_batch(args):
+    """--batch: renderiza vários itens do catálogo num único processo (só render; publicação segue por item)."""
+    from channels.salmo_dia.batch_renderer import parse_index_spec, render_catalog
+
+    try:
+        indices = parse_index_spec(args.batch)
+    except ValueError as e:
+        print(f"❌ --batch: {e}")
+        sys.exit(1)
+    if getattr(args, "upload", False) or args.publish:
+        print("  ⚠️ --batch só renderiza; publique cada item depois com --index N --upload.\n")
+    if getattr(args, "profile", False):
+        print("  ⚠️ --profile vale para um item por vez (o lote renderiza em workers); ignorado no --batch.\n")
+    root = os.path.dirname(os.path.abspath(__file__))
+    output_dir = args.output if os.path.isabs(args.output) else os.path.join(root, args.output)
+    print("\n" + "="*60)
+    print(f"  SALMO DO DIA – LOTE ({len(indices)} itens)")
+    print("="*60 + "\n")
+    manifest = render_catalog(
+        indices,
+        output_dir=output_dir,
+        render_engine=getattr(args, "engine", None),
+        draft=getattr(args, "draft", False),
+        aspect_ratios=args.aspect.split(",") if getattr(args, "aspect", None) else None,
+        use_cache=not getattr(args, "no_cache", False),
+        encoder_profile=getattr(args, "encoder_profile", None),
+        workers=getattr(args, "batch_workers", None),
+        prefetch_depth=getattr(args, "prefetch_depth", None),
+    )
+    for i in indices:
+        item = manifest["items"][str(i)]
+        if item.get("status") == "done":
+            print(f"  ✅ [{i:3d}] {item.get('name')}: {item.get('video_path')}")
+        else:
+            print(f"  ❌ [{i:3d}] {item.get('name')}: {item.get('error') or item.get('status')}")
+    summary = manifest["summary"]
+    print(f"\n  {summary['done']} ok, {summary['failed']} com erro")
+    print(f"  Manifesto: {os.path.join(manifest['batch_dir'], 'manifest.json')}")
+    print("  (repita o mesmo comando para retomar um lote interrompido)\n")
+
+
 def run_generic_channel(args):
     """Carrega o processador do canal a partir de config e executa (sem --list/--info)."""
+    apply_encoder_profile(args)
+    if getattr(args, "profile", False):
+        print("  ⚠️ --profile só está disponível para salmo_dia; seguindo sem profiling.\n")
     cfg = load_channels_config()
     chan = cfg.get("channels", {}).get(args.channel)
     if not chan or not chan.get("processor"):
@@ -369,8 +530,22 @@ Exemplos de comando:
     parser.add_argument("--output", "-o", type=str, default="outputs", help="Diretório de saída")
     parser.add_argument("--info", type=int, default=None, help="Mostra informações de um item")
     parser.add_argument("--dry-run", action="store_true", help="Com --upload: só mostra comando e crontab, não executa")
+    parser.add_argument("--engine", type=str, default=None, choices=("numpy", "ffmpeg", "sliced", "incremental", "moviepy"), help="Motor de render do vídeo (padrão: SALMO_RENDER_ENGINE ou numpy)")
+    parser.add_argument("--aspect", type=str, default=None, metavar="PROPORÇÕES", help="Proporções do vídeo, ex.: 9:16,1:1,16:9 (padrão: 9:16); todas num único job")
+    parser.add_argument("--draft", action="store_true", help="Rascunho rápido (540x960, 15 fps, ultrafast) para conferir tipografia e tempo")
+    parser.add_argument("--encoder-profile", type=str, default=None, choices=("draft", "balanced", "archive", "size-capped"), help="Perfil de encode (padrão: encoder_profile do canal em config/channels.yaml ou balanced)")
+    parser.add_argument("--batch", type=str, default=None, metavar="ÍNDICES", help="Lote: índices do catálogo (ex.: 0-13, 0,3,7-9 ou all) renderizados num processo, com manifesto JSON e retomada")
+    parser.add_argument("--batch-workers", type=int, default=None, metavar="N", help="Com --batch: workers de render (padrão: SALMO_ASYNC_RENDER_WORKERS ou 2)")
+    parser.add_argument("--prefetch-depth", type=int, default=None, metavar="N", help="Agenda e --batch: itens com narração sintetizada à frente do que está codificando (padrão: SALMO_PREFETCH_DEPTH ou 1; 0 desliga)")
+    parser.add_argument("--profile", action="store_true", help="cProfile por etapa (texto, TTS, alinhamento, overlays, composição/encode, publicação): .prof + resumo em <pasta da gravação>/profile")
+    parser.add_argument("--profile-top", type=int, default=25, metavar="N", help="Com --profile: funções mais caras por etapa no resumo (padrão: 25)")
+    parser.add_argument("--memory-report", action="store_true", help="Salmo do Dia: RSS, picos e maiores alocações (tracemalloc) por etapa em <vídeo>.memory.json/.txt")
+    parser.add_argument("--memory-budget-mb", type=float, default=None, metavar="MB", help="Com --memory-report: avisa qual etapa passou de MB de RSS (processo + filhos); padrão: SALMO_MEMORY_BUDGET_MB")
+    parser.add_argument("--progress-file", metavar="ARQUIVO", help="Eventos de progresso em JSON Lines (export: frames, fps, ETA; TTS e upload: bytes); '-' → stderr")
+    parser.add_argument("--no-cache", action="store_true", help="Ignora o cache de vídeos finais e renderiza de novo (o resultado novo substitui o do cache)")
 
     args, extra = parser.parse_known_args()
+    apply_instrumentation_env(args)
 
     # Canal pode vir do ambiente (ex.: CANAL=salmo_dia python main.py --upload 16.02.2026 09)
     if not args.channel or args.channel == default:
@@ -386,27 +561,7 @@ Exemplos de comando:
         if not posts:
             print("Nenhum post na agenda.")
             sys.exit(0)
-        root = os.path.dirname(os.path.abspath(__file__))
-        for i, p in enumerate(posts):
-            ch = p.get("channel", "")
-            dt = _normalize_date(p.get("date", "").replace("-", "/").replace(".", "/"))
-            tm = _normalize_time(p.get("time", "09"))
-            if ch not in channels:
-                print(f"  [{i+1}] Canal inválido: {ch}, pulando.")
-                continue
-            if not dt:
-                print(f"  [{i+1}] Data inválida: {p.get('date')}, pulando.")
-                continue
-            print(f"\n  [{i+1}/{len(posts)}] {ch} em {dt} às {tm}")
-            args.channel = ch
-            args.upload = True
-            args.publish = True
-            args.schedule_at = _schedule_at_from_date_time(dt, tm)
-            args.dry_run = False
-            if ch == "salmo_dia":
-                run_salmo_dia(args)
-            else:
-                run_generic_channel(args)
+        run_agenda(args, posts, channels)
         return
 
     # Canal deve ser um dos disponíveis (pode ter vindo como posicional ou default)
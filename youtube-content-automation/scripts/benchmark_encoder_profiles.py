@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Encode de um clipe sintético fixo com cada perfil de core.encoder_profiles, na máquina atual:
+fps de encode, tamanho do arquivo e tempo total por perfil — base para escolher encoder_profile
+por tipo de máquina (config/channels.yaml).
+O clipe imita o conteúdo real: fundo com Ken Burns + faixas de "texto" com fade (sem fontes nem rede).
+Os frames são compostos uma única vez pelo compositor NumPy num arquivo RGB24 cru (temporário; ~1,1 GB no padrão
+de 6 s em 1080x1920); cada perfil lê esse arquivo, então fps e tempo por perfil medem só o encode do ffmpeg.
+O tempo de composição é informado à parte.
+Execute na raiz do repositório youtube-content-automation:
+  python3 scripts/benchmark_encoder_profiles.py [--seconds 6] [--size 1080x1920] [--profiles draft,balanced]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from core.encoder_profiles import ENCODER_PROFILES, get_encoder_profile  # noqa: E402
+from core.frame_compositor import NumpyFrameCompositor, ffmpeg_binary, raw_input_args  # noqa: E402
+from core.render_plan import BackgroundLayer, OverlayLayer, RenderPlan  # noqa: E402
+
+
+def synthetic_plan(size, seconds: float, fps: int) -> RenderPlan:
+    """Fundo em gradiente com textura suave + um bloco de "texto" por 2 s (determinístico)."""
+    w, h = size
+    yy, xx = np.mgrid[0:h, 0:w].astype(np.float32)
+    bg = np.stack([
+        40 + 60 * xx / w + 10 * np.sin(yy / 37.0),
+        50 + 80 * yy / h + 10 * np.cos(xx / 53.0),
+        90 + 40 * np.sin((xx + yy) / 211.0),
+    ], axis=-1).clip(0, 255).astype(np.uint8)
+    plan = RenderPlan(size=size, fps=fps, duration=seconds, backgrounds=[BackgroundLayer(bg, 0.0, seconds, 1.0, 1.06)])
+    bw, bh = int(w * 0.72), int(h * 0.18)
+    rows = np.arange(bh)[:, None]
+    cols = np.arange(bw)[None, :]
+    # Linhas de "glifos": listras finas com buracos → bordas de alto contraste como texto real
+    alpha = (((rows // 6) % 4 != 3) & ((cols // 9) % 5 != 4) & ((rows + cols) % 23 > 3)).astype(np.uint8) * 235
+    rgb = np.full((bh, bw, 3), (245, 242, 232), dtype=np.uint8)
+    t = 0.0
+    while t < seconds:
+        end = min(seconds, t + 2.0)
+        plan.overlays.append(OverlayLayer(rgb, alpha, (w - bw) // 2, int(h * 0.4), t, end, 0.35, 0.35))
+        t = end
+    return plan
+
+
+def render_raw(plan: RenderPlan, raw_path: str) -> float:
+    """Compõe o clipe uma vez em RGB24 cru (raw_path); retorna o tempo só de composição (sem a gravação)."""
+    frames = NumpyFrameCompositor(plan).iter_frames()
+    compose_s = 0.0
+    with open(raw_path, "wb") as f:
+        while True:
+            t0 = time.perf_counter()
+            frame = next(frames, None)
+            compose_s += time.perf_counter() - t0
+            if frame is None:
+                break
+            f.write(memoryview(np.ascontiguousarray(frame)))
+    return compose_s
+
+
+def encode_profile(plan: RenderPlan, raw_path: str, name: str, out_dir: str) -> dict:
+    """Encode do clipe cru já composto com o perfil name; o tempo medido é só o do ffmpeg."""
+    profile = get_encoder_profile(name)
+    path = os.path.join(out_dir, f"bench_{name}.mp4")
+    cmd = [ffmpeg_binary(), "-y", "-loglevel", "error"] + raw_input_args(plan)[:-1] + [raw_path] + profile.video_args()
+    if profile.threads:
+        cmd += ["-threads", str(profile.threads)]
+    cmd += ["-pix_fmt", "yuv420p", "-movflags", "+faststart", path]
+    t0 = time.perf_counter()
+    proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    wall = time.perf_counter() - t0
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg ({name}) falhou: {proc.stderr.decode('utf-8', 'replace').strip()[-400:]}")
+    n = plan.n_frames
+    size = os.path.getsize(path)
+    return {
+        "profile": name,
+        "frames": n,
+        "encode_s": round(wall, 2),
+        "encode_fps": round(n / max(wall, 1e-6), 1),
+        "size_mb": round(size / 1024 / 1024, 2),
+        "kbps": round(size * 8 / 1000 / plan.duration),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark dos perfis de encode nesta máquina")
+    parser.add_argument("--seconds", type=float, default=6.0, help="Duração do clipe sintético")
+    parser.add_argument("--size", type=str, default="1080x1920", help="Quadro LxA (padrão 1080x1920)")
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--profiles", type=str, default=",".join(ENCODER_PROFILES), help="Perfis separados por vírgula")
+    parser.add_argument("--json", action="store_true", help="Saída em JSON (uma linha)")
+    args = parser.parse_args()
+
+    w, h = (int(v) for v in args.size.lower().split("x"))
+    names = [p.strip() for p in args.profiles.split(",") if p.strip()]
+    for name in names:
+        get_encoder_profile(name)  # valida antes de gastar tempo
+    plan = synthetic_plan((w, h), args.seconds, args.fps)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="salmo_enc_bench_") as out_dir:
+        raw_path = os.path.join(out_dir, "clip.rgb")
+        compose_s = render_raw(plan, raw_path)
+        for name in names:
+            results.append(encode_profile(plan, raw_path, name, out_dir))
+
+    if args.json:
+        print(json.dumps({"size": [w, h], "fps": args.fps, "seconds": args.seconds,
+                          "compose_s": round(compose_s, 2), "cpus": os.cpu_count(), "results": results}))
+        return
+
+    print(f"\n  Clipe sintético {w}x{h} @ {args.fps} fps, {args.seconds:g}s ({plan.n_frames} frames), {os.cpu_count()} CPU(s)")
+    print(f"  Composição (NumPy, uma vez, fora das medições de encode): {compose_s:.2f}s\n")
+    print(f"  {'perfil':<12} {'fps enc':>8} {'encode':>8} {'tamanho':>9} {'kbps':>7}")
+    for r in results:
+        print(
+            f"  {r['profile']:<12} {r['encode_fps']:>8.1f} {r['encode_s']:>7.2f}s {r['size_mb']:>7.2f}MB {r['kbps']:>7d}"
+        )
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks dos caminhos quentes do render (offline, entradas determinísticas) com baseline em JSON.
+
+Cobre: prepare_psalm_for_narration, segment_into_phrases, _wrap_verse_by_width, _balance_verse_lines,
+render_verse_only_overlay, render_header_band, PremiumBackgroundGenerator.create_celestial_gradient,
+PremiumBackgroundGenerator._add_vignette, ImageProcessor.create_gradient_background e o custo por frame da
+composição (NumpyFrameCompositor.render_frame: fundo com Ken Burns + header + versos com fade).
+- Textos: data/salmos_completos.py (mesmos salmos e mesma ordem sempre); tempos de palavra sintéticos
+- Fontes: só as locais (--fonts-dir, padrão assets/fonts). Sem a fonte de marca lá, os benchmarks de texto
+  ficam "skipped" (nada é baixado); a composição usa overlays sintéticos e registra isso nos parâmetros
+- Geradores de fundo (loops por pixel em Python) rodam em --scale do layout (padrão 0.25 → 270x480)
+- Cada benchmark: 1 aquecimento e repetições até --min-time s (mín. 3, máx. --max-reps), GC desligado no laço
+Caches de render vão para uma pasta temporária (nenhum efeito em outputs/cache).
+Execute na raiz do repositório youtube-content-automation:
+  python3 scripts/benchmark_hot_paths.py run [--out outputs/benchmarks/base.json] [--only overlay,frame]
+  python3 scripts/benchmark_hot_paths.py compare BASE.json NOVO.json [--threshold 0.10]
+compare sai com código 1 se algum benchmark ficou mais lento que BASE × (1 + threshold).
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+# Caches persistentes (fundo graduado, overlays) fora de outputs/: o benchmark não deixa rastro
+os.environ.setdefault("SALMO_CACHE_DIR", tempfile.mkdtemp(prefix="salmo_bench_cache_"))
+
+import numpy as np  # noqa: E402
+from PIL import Image, ImageDraw  # noqa: E402
+
+SUITE = "hot_paths"
+SUITE_VERSION = 1
+# Salmos usados como entrada (índices em SALMOS_COMPLETOS; fixos para comparar entre commits)
+PSALM_INDICES = tuple(range(0, 150, 15))
+HEADER_REFERENCES = ("Salmo 23", "Salmo 119:105", "Salmos 91:1–2")
+FRAME_SAMPLES = 24
+
+
+class Skip(Exception):
+    """Benchmark sem pré-requisito local (ex.: fonte de marca ausente)."""
+
+
+def _git_info() -> Dict[str, Any]:
+    def git(*args: str) -> str:
+        try:
+            out = subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, timeout=30)
+            return out.stdout.strip() if out.returncode == 0 else ""
+        except (OSError, subprocess.SubprocessError):
+            return ""
+
+    return {"commit": git("rev-parse", "--short", "HEAD") or None, "dirty": bool(git("status", "--porcelain", "--", "core", "scripts"))}
+
+
+def _brand_fonts_present(fonts_dir: Path) -> bool:
+    """Arquivos que o FontManager procuraria (Regular e Bold da fonte de marca) já estão na pasta."""
+    from core.premium_visuals import GOOGLE_FONTS, FontManager
+
+    name = GOOGLE_FONTS[FontManager.BRAND_FONT_KEY]["name"].replace(" ", "")
+    return all((fonts_dir / f"{name}_{suffix}.ttf").is_file() for suffix in ("Regular", "Bold"))
+
+
+# —— Entradas sintéticas ——
+
+def psalm_texts() -> List[Tuple[str, str]]:
+    from data.salmos_completos import SALMOS_COMPLETOS
+
+    return [(SALMOS_COMPLETOS[i][0], SALMOS_COMPLETOS[i][1]) for i in PSALM_INDICES if i < len(SALMOS_COMPLETOS)]
+
+
+def synthetic_words(texts: List[str]) -> List[Dict[str, Any]]:
+    """Palavras com start/end como as do forced alignment: ~70 ms por letra, pausas após pontuação."""
+    words, t = [], 0.0
+    for text in texts:
+        for token in text.split():
+            duration = 0.12 + 0.07 * len(token.strip(".,;:!?"))
+            words.append({"text": token, "start": round(t, 3), "end": round(t + duration, 3)})
+            t += duration + (0.45 if re.search(r"[.;:!?]$", token) else 0.28 if token.endswith(",") else 0.04)
+    return words
+
+
+def phrase_texts(limit: int = 24) -> List[str]:
+    from core.cinematic_salmo_pipeline import segment_into_phrases
+
+    phrases = segment_into_phrases(synthetic_words([t for _, t in psalm_texts()]))
+    return [p["text"] for p in phrases[:limit]]
+
+
+# —— Benchmarks: setup(ctx) → (função sem argumentos, itens por chamada, parâmetros registrados) ——
+
+BenchSetup = Callable[[Dict[str, Any]], Tuple[Callable[[], Any], int, Dict[str, Any]]]
+
+
+def bench_prepare_psalm(ctx: Dict[str, Any]):
+    from core.psalm_text_preparation import prepare_psalm_for_narration
+
+    texts = [t for _, t in psalm_texts()]
+    return (lambda: [prepare_psalm_for_narration(t) for t in texts]), len(texts), {"psalms": len(texts)}
+
+
+def bench_segment_phrases(ctx: Dict[str, Any]):
+    from core.cinematic_salmo_pipeline import segment_into_phrases
+
+    words = synthetic_words([t for _, t in psalm_texts()])
+    return (lambda: segment_into_phrases(words)), len(words), {"words": len(words)}
+
+
+def _verse_draw(ctx: Dict[str, Any]):
+    import core.cinematic_salmo_pipeline as pipeline
+
+    if not ctx["fonts"]:
+        raise Skip(f"fonte de marca ausente em {ctx['fonts_dir']}")
+    font = pipeline._get_phrase_fonts(str(ctx["fonts_dir"]))
+    draw = ImageDraw.Draw(Image.new("RGBA", (pipeline.WIDTH, pipeline.HEIGHT), (0, 0, 0, 0)))
+    texts = [pipeline._normalize_verse_text_for_render(t) for t in phrase_texts()]
+    return pipeline, draw, font, texts
+
+
+def bench_wrap_verse(ctx: Dict[str, Any]):
+    pipeline, draw, font, texts = _verse_draw(ctx)
+    width = pipeline.VERSE_MAX_LINE_WIDTH
+    return (lambda: [pipeline._wrap_verse_by_width(draw, font, t, width) for t in texts]), len(texts), {"phrases": len(texts)}
+
+
+def bench_balance_verse(ctx: Dict[str, Any]):
+    pipeline, draw, font, texts = _verse_draw(ctx)
+    width = pipeline.VERSE_MAX_LINE_WIDTH
+    wrapped = [pipeline._wrap_verse_by_width(draw, font, t, width) for t in texts]
+    return (lambda: [pipeline._balance_verse_lines(draw, font, lines, width) for lines in wrapped]), len(wrapped), {
+        "phrases": len(wrapped),
+    }
+
+
+def bench_verse_overlay(ctx: Dict[str, Any]):
+    from core.cinematic_salmo_pipeline import render_verse_only_overlay
+
+    if not ctx["fonts"]:
+        raise Skip(f"fonte de marca ausente em {ctx['fonts_dir']}")
+    texts = sorted(phrase_texts(), key=len)
+    picks = [texts[0], texts[len(texts) // 2], texts[-1]]  # curta, média, longa
+    fonts_dir = str(ctx["fonts_dir"])
+    return (lambda: [render_verse_only_overlay(t, fonts_dir=fonts_dir) for t in picks]), len(picks), {"phrases": len(picks)}
+
+
+def bench_header_band(ctx: Dict[str, Any]):
+    from core.cinematic_salmo_pipeline import render_header_band
+
+    if not ctx["fonts"]:
+        raise Skip(f"fonte de marca ausente em {ctx['fonts_dir']}")
+    fonts_dir = str(ctx["fonts_dir"])
+    return (lambda: [render_header_band(r, fonts_dir=fonts_dir) for r in HEADER_REFERENCES]), len(HEADER_REFERENCES), {
+        "references": len(HEADER_REFERENCES),
+    }
+
+
+def _scaled_size(ctx: Dict[str, Any]) -> Tuple[int, int]:
+    from core.cinematic_salmo_pipeline import HEIGHT, WIDTH
+
+    return max(16, int(WIDTH * ctx["scale"])), max(16, int(HEIGHT * ctx["scale"]))
+
+
+def bench_celestial_gradient(ctx: Dict[str, Any]):
+    from core.premium_visuals import PremiumBackgroundGenerator
+
+    generator = PremiumBackgroundGenerator(output_dir=ctx["tmp_dir"])
+    size = _scaled_size(ctx)
+    return (lambda: generator.create_celestial_gradient(size, "heavenly")), 1, {"size": list(size)}
+
+
+def bench_vignette(ctx: Dict[str, Any]):
+    from core.premium_visuals import PremiumBackgroundGenerator
+
+    generator = PremiumBackgroundGenerator(output_dir=ctx["tmp_dir"])
+    size = _scaled_size(ctx)
+    w, h = size
+    yy, xx = np.mgrid[0:h, 0:w]
+    img = Image.fromarray(np.stack([xx * 255 // w, yy * 255 // h, (xx + yy) * 127 // (w + h)], -1).astype(np.uint8))
+    return (lambda: generator._add_vignette(img, 0.4)), 1, {"size": list(size)}
+
+
+def bench_gradient_background(ctx: Dict[str, Any]):
+    from core.image_processor import ImageProcessor
+
+    processor = ImageProcessor(output_dir=ctx["tmp_dir"])
+    size = _scaled_size(ctx)
+    out = os.path.join(ctx["tmp_dir"], "gradient.png")
+    return (lambda: processor.create_gradient_background(size, (18, 24, 48), (196, 160, 110), out)), 1, {
+        "size": list(size),
+    }
+
+
+def _frame_overlays(ctx: Dict[str, Any], duration: float) -> Tuple[List[Any], str]:
+    """Header + 3 versos com fade (render real com as fontes locais; sem elas, blocos sintéticos do mesmo porte)."""
+    import core.cinematic_salmo_pipeline as pipeline
+    from core.render_plan import OverlayLayer, overlay_layer_from_raster
+
+    if ctx["fonts"]:
+        fonts_dir = str(ctx["fonts_dir"])
+        header = pipeline._header_layer_raster(pipeline._as_overlay_raster(
+            pipeline.render_header_band("Salmo 23", pipeline.WIDTH, pipeline.HEADER_HEIGHT, fonts_dir)
+        ))
+        layers = [overlay_layer_from_raster(header, 0.0, duration, 0.0, 0.0)]
+        verses = phrase_texts(3)
+        third = duration / len(verses)
+        for i, text in enumerate(verses):
+            raster = pipeline._as_overlay_raster(pipeline.render_verse_only_overlay(text, fonts_dir=fonts_dir))
+            layers.append(overlay_layer_from_raster(raster, i * third, (i + 1) * third, 0.5, 0.5))
+        return [layer for layer in layers if layer is not None], "fonts"
+    w, h = pipeline.WIDTH, pipeline.HEIGHT
+    bw, bh = int(w * 0.8), int(h * 0.2)
+    rows, cols = np.arange(bh)[:, None], np.arange(bw)[None, :]
+    alpha = (((rows // 6) % 4 != 3) & ((cols // 9) % 5 != 4)).astype(np.uint8) * 235
+    rgb = np.full((bh, bw, 3), (245, 242, 232), dtype=np.uint8)
+    layers = [OverlayLayer(rgb[: h // 12], alpha[: h // 12], (w - bw) // 2, 40, 0.0, duration)]
+    third = duration / 3
+    for i in range(3):
+        layers.append(OverlayLayer(rgb, alpha, (w - bw) // 2, int(h * 0.4), i * third, (i + 1) * third, 0.5, 0.5))
+    return layers, "synthetic"
+
+
+def bench_composite_frame(ctx: Dict[str, Any]):
+    import core.cinematic_salmo_pipeline as pipeline
+    from core.frame_compositor import NumpyFrameCompositor
+    from core.render_plan import BackgroundLayer, RenderPlan
+
+    duration, fps = 12.0, pipeline.FPS
+    bg = np.asarray(pipeline.load_background(str(ROOT / "assets")).convert("RGB"))
+    plan = RenderPlan(size=(pipeline.WIDTH, pipeline.HEIGHT), fps=fps, duration=duration,
+                      backgrounds=[BackgroundLayer(bg, 0.0, duration, 1.0, 1.06)])
+    plan.overlays, overlays = _frame_overlays(ctx, duration)
+    compositor = NumpyFrameCompositor(plan)
+    # Frames espalhados pela timeline: fades, trocas de verso e trechos estáveis
+    indices = np.linspace(0, plan.n_frames - 1, FRAME_SAMPLES).astype(int).tolist()
+    out = np.empty((pipeline.HEIGHT, pipeline.WIDTH, 3), dtype=np.uint8)
+
+    def run() -> None:
+        for i in indices:
+            compositor.render_frame(i, out)
+
+    return run, len(indices), {"frames": len(indices), "size": list(plan.size), "overlays": overlays}
+
+
+BENCHMARKS: Dict[str, BenchSetup] = {
+    "prepare_psalm_for_narration": bench_prepare_psalm,
+    "segment_into_phrases": bench_segment_phrases,
+    "wrap_verse_by_width": bench_wrap_verse,
+    "balance_verse_lines": bench_balance_verse,
+    "render_verse_only_overlay": bench_verse_overlay,
+    "render_header_band": bench_header_band,
+    "create_celestial_gradient": bench_celestial_gradient,
+    "add_vignette": bench_vignette,
+    "create_gradient_background": bench_gradient_background,
+    "composite_frame": bench_composite_frame,
+}
+
+
+def measure(fn: Callable[[], Any], min_time: float, max_reps: int) -> List[float]:
+    """Tempos (s) de cada chamada: 1 aquecimento, depois até min_time (mín. 3, máx. max_reps)."""
+    fn()
+    times: List[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        while len(times) < 3 or (time.perf_counter() - started < min_time and len(times) < max_reps):
+            t0 = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - t0)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return times
+
+
+def run_suite(args: argparse.Namespace) -> Dict[str, Any]:
+    import PIL
+
+    fonts_dir = Path(args.fonts_dir).resolve()
+    only = [n.strip() for n in args.only.split(",")] if args.only else None
+    ctx = {
+        "fonts_dir": fonts_dir,
+        "fonts": _brand_fonts_present(fonts_dir),
+        "scale": args.scale,
+        "tmp_dir": tempfile.mkdtemp(prefix="salmo_bench_"),
+    }
+    results: Dict[str, Any] = {}
+    print(f"\n  Benchmarks {SUITE} (escala dos fundos {args.scale}, fontes: {fonts_dir if ctx['fonts'] else 'ausentes'})")
+    print(f"  {'benchmark':<30} {'mediana':>10} {'mín':>10} {'por item':>10} {'reps':>5}")
+    for name, setup in BENCHMARKS.items():
+        if only and not any(o in name for o in only):
+            continue
+        try:
+            fn, items, params = setup(ctx)
+            times = measure(fn, args.min_time, args.max_reps)
+        except Skip as e:
+            results[name] = {"skipped": str(e)}
+            print(f"  {name:<30} {'skipped':>10}  ({e})")
+            continue
+        ms = [t * 1000 for t in times]
+        median = statistics.median(ms)
+        results[name] = {
+            "median_ms": round(median, 4),
+            "min_ms": round(min(ms), 4),
+            "mean_ms": round(statistics.fmean(ms), 4),
+            "stdev_ms": round(statistics.stdev(ms), 4) if len(ms) > 1 else 0.0,
+            "reps": len(ms),
+            "items": items,
+            "per_item_ms": round(median / max(items, 1), 4),
+            "params": params,
+        }
+        print(f"  {name:<30} {median:>8.2f}ms {min(ms):>8.2f}ms {median / max(items, 1):>8.3f}ms {len(ms):>5d}")
+    return {
+        "suite": SUITE,
+        "version": SUITE_VERSION,
+        "created": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "git": _git_info(),
+        "host": {
+            "node": platform.node(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pillow": PIL.__version__,
+        },
+        "config": {"scale": args.scale, "fonts": ctx["fonts"], "min_time": args.min_time, "psalms": list(PSALM_INDICES)},
+        "results": results,
+    }
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    # INFO dos módulos medidos (ex.: "Preparação textual" a cada salmo) polui a tabela e entra no tempo medido
+    logging.disable(logging.INFO)
+    try:
+        data = run_suite(args)
+    finally:
+        logging.disable(logging.NOTSET)
+    out = Path(args.out) if args.out else ROOT / "outputs" / "benchmarks" / f"{SUITE}_{data['git']['commit'] or 'local'}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(f"\n  Baseline gravada em {out}\n")
+    return 0
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float, metric: str) -> Tuple[List[str], int]:
+    """Linhas do relatório e número de regressões (new > base × (1 + threshold) na métrica)."""
+    lines: List[str] = []
+    for key in ("scale", "fonts", "psalms"):
+        if base.get("config", {}).get(key) != new.get("config", {}).get(key):
+            lines.append(f"  ⚠️ config.{key} difere: {base.get('config', {}).get(key)} → {new.get('config', {}).get(key)}")
+    for key in ("node", "cpus", "python", "numpy", "pillow"):
+        if base.get("host", {}).get(key) != new.get("host", {}).get(key):
+            lines.append(f"  ⚠️ host.{key} difere: {base.get('host', {}).get(key)} → {new.get('host', {}).get(key)}")
+    lines.append(f"\n  {'benchmark':<30} {'base':>10} {'novo':>10} {'razão':>7}")
+    regressions = 0
+    names = list(base.get("results", {})) + [n for n in new.get("results", {}) if n not in base.get("results", {})]
+    for name in names:
+        b, n = base.get("results", {}).get(name), new.get("results", {}).get(name)
+        if not b or not n or "skipped" in b or "skipped" in n:
+            why = "ausente" if not b or not n else "skipped"
+            lines.append(f"  {name:<30} {'—':>10} {'—':>10} {'':>7}  ({why})")
+            continue
+        if b.get("params") != n.get("params"):
+            lines.append(f"  {name:<30} parâmetros diferentes ({b.get('params')} → {n.get('params')}); sem comparação")
+            continue
+        ratio = n[metric] / max(b[metric], 1e-9)
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  ← REGRESSÃO"
+            regressions += 1
+        elif ratio < 1 / (1 + threshold):
+            flag = "  (mais rápido)"
+        lines.append(f"  {name:<30} {b[metric]:>8.2f}ms {n[metric]:>8.2f}ms {ratio:>6.2f}x{flag}")
+    return lines, regressions
+
+
+def cmd_compare(args: argparse.Namespace) -> int:
+    base = json.loads(Path(args.base).read_text(encoding="utf-8"))
+    new = json.loads(Path(args.new).read_text(encoding="utf-8"))
+    lines, regressions = compare(base, new, args.threshold, args.metric)
+    print(f"\n  {args.base} ({base.get('git', {}).get('commit')}) → {args.new} ({new.get('git', {}).get('commit')})"
+          f", métrica {args.metric}, limite +{args.threshold:.0%}")
+    print("\n".join(lines))
+    print(f"\n  {regressions} regressão(ões)\n" if regressions else "\n  Sem regressões\n")
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks dos caminhos quentes do render (baseline JSON)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("run", help="Roda a suíte e grava o JSON")
+    run.add_argument("--out", help=f"Arquivo JSON (padrão: outputs/benchmarks/{SUITE}_<commit>.json)")
+    run.add_argument("--only", help="Só benchmarks cujo nome contém um destes termos (separados por vírgula)")
+    run.add_argument("--fonts-dir", default=str(ROOT / "assets" / "fonts"), help="Pasta com a fonte de marca (nada é baixado)")
+    run.add_argument("--scale", type=float, default=0.25, help="Escala do layout para os geradores de fundo (padrão: 0.25)")
+    run.add_argument("--min-time", type=float, default=1.0, help="Segundos mínimos medidos por benchmark (padrão: 1)")
+    run.add_argument("--max-reps", type=int, default=200, help="Repetições máximas por benchmark (padrão: 200)")
+    cmp_ = sub.add_parser("compare", help="Compara dois JSON e aponta regressões")
+    cmp_.add_argument("base")
+    cmp_.add_argument("new")
+    cmp_.add_argument("--threshold", type=float, default=0.10, help="Tolerância relativa (padrão: 0.10 = +10%%)")
+    cmp_.add_argument("--metric", choices=("median_ms", "min_ms", "mean_ms"), default="median_ms")
+    args = parser.parse_args()
+    sys.exit(cmd_run(args) if args.command == "run" else cmd_compare(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark do zoom Ken Burns: ms/frame antes (resize do fundo inteiro por frame, como
+ImageClip.resize(lambda t: ...) do MoviePy) e depois (core.ken_burns.KenBurnsZoom).
+Execute na raiz do repositório youtube-content-automation:
+  python3 scripts/benchmark_ken_burns.py [--frames 60]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from core.cinematic_salmo_pipeline import WIDTH, HEIGHT, FPS, load_background  # noqa: E402
+from core.ken_burns import KenBurnsZoom  # noqa: E402
+
+ZOOM_START, ZOOM_END = 1.0, 1.06
+
+
+def legacy_frame(img: Image.Image, zoom: float) -> np.ndarray:
+    """Caminho antigo: resize LANCZOS do fundo inteiro para (W·z, H·z) e crop central (o que o MoviePy faz)."""
+    w, h = img.size
+    new_w, new_h = int(w * zoom), int(h * zoom)
+    resized = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+    left, top = (new_w - WIDTH) // 2, (new_h - HEIGHT) // 2
+    return np.asarray(resized.crop((left, top, left + WIDTH, top + HEIGHT)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ms/frame do zoom Ken Burns")
+    parser.add_argument("--frames", type=int, default=60, help="Frames medidos por método")
+    args = parser.parse_args()
+
+    bg = load_background(str(ROOT / "assets"))
+    duration = args.frames / FPS
+
+    t0 = time.perf_counter()
+    for i in range(args.frames):
+        legacy_frame(bg, ZOOM_START + (ZOOM_END - ZOOM_START) * i / args.frames)
+    before_ms = (time.perf_counter() - t0) / args.frames * 1000
+
+    t0 = time.perf_counter()
+    zoom = KenBurnsZoom(bg, (WIDTH, HEIGHT), ZOOM_START, ZOOM_END, duration, FPS)
+    setup_ms = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    for _ in zoom.iter_frames():
+        pass
+    after_ms = (time.perf_counter() - t0) / zoom.n_frames * 1000
+
+    print(f"\n  Ken Burns {WIDTH}x{HEIGHT}, {args.frames} frames")
+    print(f"  Antes  (resize por frame):      {before_ms:7.1f} ms/frame")
+    print(f"  Depois (KenBurnsZoom):          {after_ms:7.1f} ms/frame  (+ {setup_ms:.0f} ms de preparo, uma vez)")
+    print(f"  Ganho:                          {before_ms / max(after_ms, 1e-6):7.2f}x\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Pico de RSS da montagem MoviePy de um trecho longo (30 frases por padrão):
+antes (overlay RGBA de quadro inteiro → RGB + máscara float32 de quadro inteiro por frase)
+e depois (core.render_plan.OverlayRaster: recorte + offset, máscara uint8).
+Cada modo roda num subprocesso próprio (pico medido isoladamente via ru_maxrss).
+Execute na raiz do repositório youtube-content-automation:
+  python3 scripts/benchmark_overlay_memory.py [--segments 30] [--frames 15]
+"""
+import argparse
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from core import cinematic_salmo_pipeline as pipeline  # noqa: E402
+from data.salmos_completos import SALMOS_COMPLETOS  # noqa: E402
+
+
+def _phrases(n: int):
+    lines = [ln.strip() for item in SALMOS_COMPLETOS for ln in item[1].splitlines() if len(ln.split()) >= 5]
+    return [lines[i % len(lines)] for i in range(n)]
+
+
+def _legacy_clip(rgba: np.ndarray, duration: float):
+    """Caminho antigo: RGB de quadro inteiro + máscara float32 de quadro inteiro."""
+    from moviepy.editor import ImageClip
+    rgb = rgba[..., :3].copy()
+    mask = (rgba[..., 3] / 255.0).astype(np.float32)
+    return ImageClip(rgb, duration=duration).set_position((0, 0)).set_mask(
+        ImageClip(mask, ismask=True).set_duration(duration)
+    )
+
+
+def run_mode(mode: str, segments: int, frames: int) -> None:
+    from moviepy.editor import CompositeVideoClip, ColorClip
+    from core.overlay_pool import render_overlays
+
+    # Rasters podem vir do cache de overlays: o que se mede é a montagem/composição, não a rasterização
+    rasters = render_overlays([("verse", (text,), {}) for text in _phrases(segments)], workers=1)
+    dur = 2.0
+    clips = []
+    for i, raster in enumerate(rasters):
+        if mode == "full":
+            clip = _legacy_clip(raster.to_full(), dur)
+        else:
+            clip = pipeline._raster_clip(raster, dur)
+        clips.append(clip.set_start(i * dur))
+    total = segments * dur
+    bg = ColorClip((pipeline.WIDTH, pipeline.HEIGHT), color=(20, 20, 20), duration=total)
+    final = CompositeVideoClip([bg] + clips, size=(pipeline.WIDTH, pipeline.HEIGHT)).set_duration(total)
+    t0 = time.perf_counter()
+    for t in np.linspace(0, total - 0.1, frames):
+        final.get_frame(float(t))
+    ms = (time.perf_counter() - t0) / frames * 1000
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    print(f"{peak_mb:.1f} {ms:.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pico de RSS: overlays de quadro inteiro vs recortados")
+    parser.add_argument("--segments", type=int, default=30, help="Frases (overlays) no trecho")
+    parser.add_argument("--frames", type=int, default=15, help="Frames compostos por modo")
+    parser.add_argument("--mode", choices=("full", "crop"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.segments, args.frames)
+        return
+
+    results = {}
+    for mode in ("full", "crop"):
+        out = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--segments", str(args.segments), "--frames", str(args.frames)],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip().splitlines()[-1]
+        peak, ms = (float(v) for v in out.split())
+        results[mode] = (peak, ms)
+
+    print(f"\n  Overlays MoviePy, {args.segments} frases, {pipeline.WIDTH}x{pipeline.HEIGHT}")
+    print(f"  Antes  (RGBA quadro inteiro + máscara float32): pico RSS {results['full'][0]:7.1f} MB  ({results['full'][1]:.0f} ms/frame)")
+    print(f"  Depois (recorte + offset, alpha uint8):         pico RSS {results['crop'][0]:7.1f} MB  ({results['crop'][1]:.0f} ms/frame)")
+    print(f"  Redução:                                        {results['full'][0] - results['crop'][0]:7.1f} MB\n")
+
+
+if __name__ == "__main__":
+    main()